@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import socket
 import subprocess
 import json
 import time
@@ -8,11 +9,17 @@ from pathlib import Path
 # Define path and command
 WORKSPACE = Path.home() / ".openclaw/workspace"
 CONTACT_API_SCRIPT = WORKSPACE / "contact_api.py"
+CONTACT_API_PORT = 8765
 
-def is_running():
-    # Check if contact_api.py is running
-    result = subprocess.run(['pgrep', '-f', 'contact_api.py'], stdout=subprocess.PIPE)
-    return bool(result.stdout)
+def is_running(port=CONTACT_API_PORT):
+    # Check if contact_api.py is running by connecting to its port (no pgrep spawn)
+    with socket.socket() as s:
+        s.settimeout(0.2)
+        try:
+            s.connect(('127.0.0.1', port))
+            return True
+        except OSError:
+            return False
 
 def start_server():
     # Start the contact API server
@@ -3,15 +3,69 @@
 contact_api.py — lightweight local API to capture contact-form submissions
 and trigger a pushover notification.
 """
-from http.server import BaseHTTPRequestHandler, HTTPServer
-import json, time, subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json, os, secrets, signal, time, subprocess, threading, fcntl
 from datetime import datetime
 from pathlib import Path
 
+# orjson is faster and emits bytes directly; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 WORKSPACE = Path.home() / ".openclaw/workspace"
-PENDING_FILE = WORKSPACE / "pending_contacts.json"
+PENDING_LOG = WORKSPACE / "pending_contacts.jsonl"
 PUSHOVER_SCRIPT = WORKSPACE / "pushover.sh"
 
+# Number of server processes sharing the port (flock-guarded appends keep the log consistent)
+WORKERS = int(os.environ.get("CONTACT_API_WORKERS", "1"))
+
+
+def _json_dumps(obj):
+    """Serialize to compact JSON bytes (datetimes as ISO 8601)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=datetime.isoformat).encode()
+
+
+def _json_loads(data):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class PendingStore:
+    """Append-only log of pending submissions.
+
+    Each submission becomes one JSON line in PENDING_LOG, written before the
+    request is acknowledged so a crash or kill never loses an accepted
+    contact. contacts.py folds the log into pending_contacts.json when it
+    needs the full list, under the same flock so no line is lost to a
+    concurrent compaction.
+    """
+
+    def __init__(self, path=PENDING_LOG):
+        self.path = path
+
+    def append(self, entry):
+        line = _json_dumps(entry) + b'\n'
+        with open(self.path, 'ab') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.write(line)
+
+
+pending_store = PendingStore()
+
+
+def _send_pushover(message):
+    try:
+        subprocess.run([str(PUSHOVER_SCRIPT), "New Contact", message, "0"])
+    except Exception as e:
+        print('Pushover error:', e)
+
+
 class ContactHandler(BaseHTTPRequestHandler):
     def _set_headers(self, status=200):
         self.send_response(status)
@@ -29,14 +83,14 @@ class ContactHandler(BaseHTTPRequestHandler):
     def do_POST(self):
         if self.path != '/contact':
             self._set_headers(404)
-            self.wfile.write(json.dumps({'error': 'Invalid endpoint'}).encode())
+            self.wfile.write(_json_dumps({'error': 'Invalid endpoint'}))
             return
 
         content_length = int(self.headers.get('Content-Length', 0))
         body = self.rfile.read(content_length)
 
         try:
-            data = json.loads(body)
+            data = _json_loads(body)
             name = data.get('name') or 'Anonymous'
             contact = data.get('contact')
             message = data.get('message', '')
@@ -44,54 +98,75 @@ class ContactHandler(BaseHTTPRequestHandler):
 
             if not contact:
                 self._set_headers(400)
-                self.wfile.write(json.dumps({'error': 'Missing contact'}).encode())
+                self.wfile.write(_json_dumps({'error': 'Missing contact'}))
                 return
 
             pending_entry = {
                 'id': int(time.time()),
+                'submissionId': secrets.token_hex(8),  # lets contacts.py skip re-folded log lines
                 'name': name,
                 'contact': contact,
                 'message': message,
                 'wantsWeekly': wants_weekly,
-                'submittedAt': datetime.now().isoformat()
+                'submittedAt': datetime.now()  # serialized natively by orjson
             }
 
-            # Load existing pending data
-            if PENDING_FILE.exists():
-                with open(PENDING_FILE, 'r') as f:
-                    pending_data = json.load(f)
-            else:
-                pending_data = {'pending': []}
-
-            pending_data['pending'].append(pending_entry)
-
-            with open(PENDING_FILE, 'w') as f:
-                json.dump(pending_data, f, indent=2)
+            pending_store.append(pending_entry)
 
-            # Trigger pushover notification
+            # Trigger pushover notification in the background so the response isn't held
             if PUSHOVER_SCRIPT.exists():
-                try:
-                    subprocess.run([
-                        str(PUSHOVER_SCRIPT),
-                        "New Contact",
-                        f"{name} ({contact}) just signed up.",
-                        "0"
-                    ])
-                except Exception as e:
-                    print('Pushover error:', e)
+                threading.Thread(
+                    target=_send_pushover,
+                    args=(f"{name} ({contact}) just signed up.",),
+                    daemon=True
+                ).start()
 
             self._set_headers(200)
-            self.wfile.write(json.dumps({'status': 'ok'}).encode())
+            self.wfile.write(_json_dumps({'status': 'ok'}))
         except Exception as e:
             self._set_headers(500)
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self.wfile.write(_json_dumps({'error': str(e)}))
+
+
+def _exit_on_sigterm(signum, frame):
+    """Turn SIGTERM (launchd stop) into a normal exit so run()'s cleanup runs."""
+    raise SystemExit(0)
 
 
-def run(server_class=HTTPServer, handler_class=ContactHandler, port=8765):
+def run(server_class=ThreadingHTTPServer, handler_class=ContactHandler, port=8765, workers=WORKERS):
     server_address = ('', port)
     httpd = server_class(server_address, handler_class)
-    print(f"✅ Contact API running on http://localhost:{port}/contact")
-    httpd.serve_forever()
+    print(f"✅ Contact API running on http://localhost:{port}/contact ({workers} worker(s))")
+
+    # Extra workers are forked after bind and accept on the same socket;
+    # appends are flock-guarded so they never interleave.
+    children = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            children = []
+            break
+        children.append(pid)
+
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    try:
+        httpd.serve_forever()
+    finally:
+        # A terminal Ctrl-C reaches every worker; ignore repeats while stopping
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        httpd.server_close()
+        # Stop the forked workers too, so none is left holding the port
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
 
 
 if __name__ == '__main__':
@@ -6,6 +6,8 @@ import os
 import requests
 from dotenv import load_dotenv
 
+SEARCH_URL = 'https://api.search.brave.com/res/v1/web/search'
+
 # Load environment variables
 def load_api_key():
     load_dotenv()
@@ -13,13 +15,16 @@ def load_api_key():
 
 # Initialize Brave API key
 BRAVE_API_KEY = load_api_key()
-def search(query):
-    url = f'https://api.search.brave.com/res/v1/web/search?q={query}'
-    headers = { 
+
+# Reuse one keep-alive connection across searches instead of a new TLS handshake each call
+_session = requests.Session()
+_session.headers.update({
     'Authorization': f'Bearer {BRAVE_API_KEY}',
-    'x-subscription-token': os.getenv('BRAVE_SUBSCRIPTION_TOKEN') 
-}
-    response = requests.get(url, headers=headers)
+    'x-subscription-token': os.getenv('BRAVE_SUBSCRIPTION_TOKEN')
+})
+
+def search(query):
+    response = _session.get(SEARCH_URL, params={'q': query}, timeout=10)
 
     if response.status_code == 200:
         return response.json()
@@ -4,52 +4,163 @@ Contact form backend handler
 Processes submissions, sends verification messages, and stores verified contacts
 """
 
+import atexit
+import fcntl
 import json
 import os
 import re
+import secrets
+import select
+import signal
+import subprocess
+import sys
 import time
 from datetime import datetime
 from pathlib import Path
 
+# orjson is several times faster than stdlib json; fall back if not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Paths
 WORKSPACE = Path.home() / ".openclaw/workspace"
 CONTACTS_FILE = WORKSPACE / "contacts.json"
 PENDING_FILE = WORKSPACE / "pending_contacts.json"
+PENDING_LOG = WORKSPACE / "pending_contacts.jsonl"  # appended to by contact_api.py
 LOG_FILE = WORKSPACE / "contact_log.txt"
+IMSG_SCRIPT = WORKSPACE / "send_imessage.sh"
+IMSG_REPLY_TIMEOUT = 60  # seconds to wait for the helper's OK/FAIL before restarting it
+
+# Validation patterns
+EMAIL_RE = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+PHONE_RE = re.compile(r'^[\+]?[1]?[0-9]{10,15}$')
+PHONE_SEPARATORS_RE = re.compile(r'[\s\-\(\)\.]')
+
+_log_file = None  # opened on first log() and kept open, line-buffered
 
 def log(message):
     """Log with timestamp"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _log_file
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     entry = f"[{timestamp}] {message}"
     print(entry)
-    with open(LOG_FILE, 'a') as f:
-        f.write(entry + '\n')
+    if _log_file is None:
+        _log_file = open(LOG_FILE, 'a', buffering=1)
+        atexit.register(_log_file.close)
+    _log_file.write(entry + '\n')
+
+def read_json(path):
+    """Parse a JSON file"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+def write_json(path, data, indent=True):
+    """Write data as JSON via a temp file + rename so readers never see a partial file"""
+    if ORJSON_AVAILABLE:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        raw = json.dumps(data, indent=2 if indent else None).encode()
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp, path)
+
+# Parsed contacts file and its contact -> entry index, reused until the mtime changes
+_contacts_cache = {"mtime": None, "data": None, "by_contact": {}}
+
+def index_by_contact(entries):
+    """Map contact string to entry (first entry wins on duplicates)"""
+    index = {}
+    for entry in entries:
+        index.setdefault(entry["contact"], entry)
+    return index
+
+def _set_contacts_cache(mtime, data):
+    _contacts_cache["mtime"] = mtime
+    _contacts_cache["data"] = data
+    _contacts_cache["by_contact"] = index_by_contact(data["contacts"])
 
 def load_contacts():
     """Load verified contacts"""
-    if CONTACTS_FILE.exists():
-        with open(CONTACTS_FILE, 'r') as f:
-            return json.load(f)
-    return {"contacts": [], "lastUpdated": None}
+    try:
+        mtime = CONTACTS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        _set_contacts_cache(None, {"contacts": [], "lastUpdated": None})
+        return _contacts_cache["data"]
+    if mtime != _contacts_cache["mtime"]:
+        _set_contacts_cache(mtime, read_json(CONTACTS_FILE))
+    return _contacts_cache["data"]
+
+def find_contact(contact):
+    """Return the verified entry for a contact string, or None"""
+    load_contacts()
+    return _contacts_cache["by_contact"].get(contact)
 
 def save_contacts(data):
     """Save verified contacts"""
     data["lastUpdated"] = datetime.now().isoformat()
-    with open(CONTACTS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(CONTACTS_FILE, data)
+    _set_contacts_cache(CONTACTS_FILE.stat().st_mtime_ns, data)
+
+def load_pending():
+    """Load pending verifications (empty if the file does not exist yet)"""
+    try:
+        return read_json(PENDING_FILE)
+    except FileNotFoundError:
+        return {"pending": []}
+
+def submission_key(entry):
+    """Identity of one form submission (older log lines have no submissionId)"""
+    return entry.get("submissionId") or (entry.get("contact"), entry.get("submittedAt"))
+
+def compact_pending():
+    """Fold submissions appended by contact_api.py into the pending file.
+
+    Lines already in the pending file are skipped, so a crash between writing
+    the pending file and truncating the log doesn't duplicate submissions.
+    """
+    try:
+        log_f = open(PENDING_LOG, 'rb+')
+    except FileNotFoundError:
+        return
+    with log_f:
+        fcntl.flock(log_f, fcntl.LOCK_EX)
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        entries = [loads(line) for line in log_f if line.strip()]
+        if not entries:
+            return
+        pending_data = load_pending()
+        pending_list = pending_data.setdefault("pending", [])
+        seen = {submission_key(p) for p in pending_list}
+        for entry in entries:
+            key = submission_key(entry)
+            if key not in seen:
+                seen.add(key)
+                pending_list.append(entry)
+        write_json(PENDING_FILE, pending_data, indent=False)
+        log_f.truncate(0)
 
 def is_valid_email(email):
     """Validate email format"""
-    pattern = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
-    return re.match(pattern, email) is not None
+    return EMAIL_RE.match(email) is not None
 
 def is_valid_phone(phone):
     """Validate phone format"""
     # Remove spaces and common separators
-    cleaned = re.sub(r'[\s\-\(\)\.]', '', phone)
+    cleaned = PHONE_SEPARATORS_RE.sub('', phone)
     # Check for valid phone pattern (with optional + and country code)
-    pattern = r'^[\+]?[1]?[0-9]{10,15}$'
-    return re.match(pattern, cleaned) is not None
+    return PHONE_RE.match(cleaned) is not None
+
+def normalize_phone(phone):
+    """Strip separators and add a +1 country code if none given"""
+    cleaned = PHONE_SEPARATORS_RE.sub('', phone)
+    if not cleaned.startswith('+'):
+        cleaned = '+1' + cleaned  # Assume US if no country code
+    return cleaned
 
 def detect_contact_type(contact):
     """Detect if contact is email or phone"""
@@ -59,6 +170,77 @@ def detect_contact_type(contact):
         return 'phone'
     return None
 
+class IMessageSender:
+    """Pipes messages to one long-lived `send_imessage.sh --stdin` process"""
+    
+    def __init__(self, script):
+        self.script = script
+        self.proc = None
+        atexit.register(self.close)
+    
+    def send(self, phone, message):
+        """Send one message; returns True if the script reported OK within IMSG_REPLY_TIMEOUT"""
+        if self.proc is None or self.proc.poll() is not None:
+            self.proc = subprocess.Popen(
+                [str(self.script), '--stdin'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                bufsize=0,
+                start_new_session=True  # so a kill also reaches a hung osascript
+            )
+        # One message per line, so tabs/newlines in the text become spaces
+        message = message.replace('\t', ' ').replace('\n', ' ')
+        try:
+            self.proc.stdin.write(f"{phone}\t{message}\n".encode())
+            reply = self._read_reply(IMSG_REPLY_TIMEOUT)
+        except OSError:
+            reply = None
+        if reply is None:
+            # Wedged (e.g. an osascript permission prompt) or exited: start fresh next time
+            log(f"iMessage helper gave no reply within {IMSG_REPLY_TIMEOUT}s; restarting it")
+            self.kill()
+            return False
+        return reply == "OK"
+    
+    def _read_reply(self, timeout):
+        """Read the helper's next output line, or None on timeout/EOF"""
+        deadline = time.monotonic() + timeout
+        fd = self.proc.stdout.fileno()
+        buf = b''
+        while not buf.endswith(b'\n'):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return None
+            chunk = os.read(fd, 256)
+            if not chunk:
+                return None
+            buf += chunk
+        return buf.decode(errors='replace').strip()
+    
+    def kill(self):
+        """Kill the helper and anything it started"""
+        if self.proc is not None:
+            try:
+                os.killpg(self.proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            self.proc.wait()
+            self.proc = None
+    
+    def close(self):
+        if self.proc is not None:
+            try:
+                self.proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.proc.wait(timeout=IMSG_REPLY_TIMEOUT)
+                self.proc = None
+            except subprocess.TimeoutExpired:
+                self.kill()
+
+imessage = IMessageSender(IMSG_SCRIPT)
+
 def send_verification_email(email, name, code):
     """Send verification email - placeholder for actual implementation"""
     log(f"Would send verification email to: {email}")
@@ -80,35 +262,25 @@ def send_verification_sms(phone, name, code):
     """Send verification SMS via iMessage"""
     log(f"Sending verification SMS to: {phone}")
     # Clean the phone number
-    cleaned = re.sub(r'[\s\-\(\)\.]', '', phone)
-    if not cleaned.startswith('+'):
-        cleaned = '+1' + cleaned  # Assume US if no country code
+    cleaned = normalize_phone(phone)
     
     message = f"Hi {name or 'there'}! Your 6AIndolf verification code is: {code}. Reply with this code to confirm."
     
     # Use the iMessage send script
-    imsg_script = WORKSPACE / "send_imessage.sh"
-    if imsg_script.exists():
-        import subprocess
-        result = subprocess.run(
-            [str(imsg_script), cleaned, message],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
+    if IMSG_SCRIPT.exists():
+        if imessage.send(cleaned, message):
             log(f"Verification SMS sent successfully to {cleaned}")
             return True
         else:
-            log(f"Failed to send SMS: {result.stderr}")
+            log(f"Failed to send SMS to {cleaned}")
             return False
     else:
-        log(f"iMessage script not found at {imsg_script}")
+        log(f"iMessage script not found at {IMSG_SCRIPT}")
         return False
 
 def generate_verification_code():
     """Generate 6-digit verification code"""
-    import random
-    return ''.join([str(random.randint(0, 9)) for _ in range(6)])
+    return f"{secrets.randbelow(1_000_000):06d}"
 
 def process_new_submission(name, contact, message):
     """Process a new contact submission"""
@@ -119,13 +291,10 @@ def process_new_submission(name, contact, message):
         log(f"Invalid contact format: {contact}")
         return False
     
-    contacts = load_contacts()
-    
     # Check if already exists
-    for existing in contacts["contacts"]:
-        if existing["contact"] == contact:
-            log(f"Contact already exists: {contact}")
-            return False
+    if find_contact(contact) is not None:
+        log(f"Contact already exists: {contact}")
+        return False
     
     # Generate verification code
     code = generate_verification_code()
@@ -151,14 +320,10 @@ def process_new_submission(name, contact, message):
     
     if success:
         # Save to pending
-        pending_data = {"pending": []}
-        if PENDING_FILE.exists():
-            with open(PENDING_FILE, 'r') as f:
-                pending_data = json.load(f)
-        
+        compact_pending()
+        pending_data = load_pending()
         pending_data["pending"].append(pending)
-        with open(PENDING_FILE, 'w') as f:
-            json.dump(pending_data, f, indent=2)
+        write_json(PENDING_FILE, pending_data, indent=False)
         
         log(f"Verification sent to {contact}. Code: {code}")
         return True
@@ -168,52 +333,52 @@ def process_new_submission(name, contact, message):
 def verify_contact(contact, code):
     """Verify a contact with their code"""
     log(f"Attempting verification for {contact} with code {code}")
+    compact_pending()
     
-    if not PENDING_FILE.exists():
+    try:
+        pending_data = read_json(PENDING_FILE)
+    except FileNotFoundError:
         log("No pending contacts file")
         return False
     
-    with open(PENDING_FILE, 'r') as f:
-        pending_data = json.load(f)
-    
-    for pending in pending_data.get("pending", []):
-        if pending["contact"] == contact:
-            if pending["verificationCode"] == code:
-                # Move to verified contacts
-                contacts = load_contacts()
-                verified_contact = {
-                    "id": pending["id"],
-                    "name": pending["name"],
-                    "contact": pending["contact"],
-                    "contactType": pending["contactType"],
-                    "message": pending["message"],
-                    "submittedAt": pending["submittedAt"],
-                    "verifiedAt": datetime.now().isoformat(),
-                    "verified": True,
-                    "weeklyUpdates": None  # None = asked but no response yet, True = subscribed, False = declined
-                }
-                contacts["contacts"].append(verified_contact)
-                save_contacts(contacts)
-                
-                # Remove from pending
-                pending_data["pending"] = [p for p in pending_data["pending"] if p["contact"] != contact]
-                with open(PENDING_FILE, 'w') as f:
-                    json.dump(pending_data, f, indent=2)
-                
-                log(f"✓ Contact verified: {contact}")
-                
-                # Send welcome message
-                send_welcome_message(verified_contact)
-                return True
-            else:
-                pending["attempts"] += 1
-                with open(PENDING_FILE, 'w') as f:
-                    json.dump(pending_data, f, indent=2)
-                log(f"Invalid code for {contact}. Attempt {pending['attempts']}")
-                return False
-    
-    log(f"No pending contact found: {contact}")
-    return False
+    pending_list = pending_data.get("pending", [])
+    pending = index_by_contact(pending_list).get(contact)
+    
+    if pending is None:
+        log(f"No pending contact found: {contact}")
+        return False
+    
+    if pending["verificationCode"] != code:
+        pending["attempts"] += 1
+        write_json(PENDING_FILE, pending_data, indent=False)
+        log(f"Invalid code for {contact}. Attempt {pending['attempts']}")
+        return False
+    
+    # Move to verified contacts
+    contacts = load_contacts()
+    verified_contact = {
+        "id": pending["id"],
+        "name": pending["name"],
+        "contact": pending["contact"],
+        "contactType": pending["contactType"],
+        "message": pending["message"],
+        "submittedAt": pending["submittedAt"],
+        "verifiedAt": datetime.now().isoformat(),
+        "verified": True,
+        "weeklyUpdates": None  # None = asked but no response yet, True = subscribed, False = declined
+    }
+    contacts["contacts"].append(verified_contact)
+    save_contacts(contacts)
+    
+    # Remove from pending (including any duplicate submissions)
+    pending_data["pending"] = [p for p in pending_list if p["contact"] != contact]
+    write_json(PENDING_FILE, pending_data, indent=False)
+    
+    log(f"✓ Contact verified: {contact}")
+    
+    # Send welcome message
+    send_welcome_message(verified_contact)
+    return True
 
 def send_welcome_message(contact):
     """Send welcome message to newly verified contact"""
@@ -224,81 +389,68 @@ def send_welcome_message(contact):
     message = f"Welcome{name and ' ' + name or ''}! 🧙‍♂️ You've been added to the 6AIndolf network. Would you like a once-weekly update of our latest insights? Reply YES to subscribe or STOP anytime to unsubscribe."
     
     if contact_type == 'phone':
-        imsg_script = WORKSPACE / "send_imessage.sh"
-        if imsg_script.exists():
-            import subprocess
-            cleaned = re.sub(r'[\s\-\(\)\.]', '', contact_info)
-            if not cleaned.startswith('+'):
-                cleaned = '+1' + cleaned
-            subprocess.run([str(imsg_script), cleaned, message])
+        if IMSG_SCRIPT.exists():
+            imessage.send(normalize_phone(contact_info), message)
             log(f"Welcome message sent to {contact_info}")
     else:
         log(f"Would send welcome email to {contact_info}")
 
 def update_preference(contact, wants_updates):
     """Update weekly update preference for a contact"""
-    contacts = load_contacts()
+    c = find_contact(contact)
+    if c is None:
+        log(f"Contact not found: {contact}")
+        return False
     
-    for c in contacts["contacts"]:
-        if c["contact"] == contact:
-            c["weeklyUpdates"] = wants_updates
-            c["preferenceUpdatedAt"] = datetime.now().isoformat()
-            save_contacts(contacts)
-            
-            status = "subscribed" if wants_updates else "unsubscribed"
-            log(f"Contact {contact} {status} from weekly updates")
-            
-            # Send confirmation
-            name = c["name"]
-            contact_type = c["contactType"]
-            contact_info = c["contact"]
-            
-            if wants_updates:
-                message = f"✓ You're now subscribed to weekly updates from 6AIndolf! Expect insights every Sunday. Reply STOP anytime to unsubscribe."
-            else:
-                message = f"✓ You've been unsubscribed from weekly updates. You can reply YES anytime to resubscribe."
-            
-            if contact_type == 'phone':
-                imsg_script = WORKSPACE / "send_imessage.sh"
-                if imsg_script.exists():
-                    import subprocess
-                    cleaned = re.sub(r'[\s\-\(\)\.]', '', contact_info)
-                    if not cleaned.startswith('+'):
-                        cleaned = '+1' + cleaned
-                    subprocess.run([str(imsg_script), cleaned, message])
-                    log(f"Confirmation sent to {contact_info}")
-            else:
-                log(f"Would send confirmation email to {contact_info}")
-            
-            return True
+    c["weeklyUpdates"] = wants_updates
+    c["preferenceUpdatedAt"] = datetime.now().isoformat()
+    save_contacts(load_contacts())
     
-    log(f"Contact not found: {contact}")
-    return False
+    status = "subscribed" if wants_updates else "unsubscribed"
+    log(f"Contact {contact} {status} from weekly updates")
+    
+    # Send confirmation
+    contact_type = c["contactType"]
+    contact_info = c["contact"]
+    
+    if wants_updates:
+        message = f"✓ You're now subscribed to weekly updates from 6AIndolf! Expect insights every Sunday. Reply STOP anytime to unsubscribe."
+    else:
+        message = f"✓ You've been unsubscribed from weekly updates. You can reply YES anytime to resubscribe."
+    
+    if contact_type == 'phone':
+        if IMSG_SCRIPT.exists():
+            imessage.send(normalize_phone(contact_info), message)
+            log(f"Confirmation sent to {contact_info}")
+    else:
+        log(f"Would send confirmation email to {contact_info}")
+    
+    return True
 
 def list_contacts():
     """List all contacts"""
     contacts = load_contacts()
-    print(f"\nVerified Contacts ({len(contacts['contacts'])}):")
-    print("-" * 70)
-    print(f"  {'Name':<20} | {'Contact':<25} | {'Weekly?':<8} | {'Verified':<10}")
-    print("-" * 70)
+    lines = [
+        f"\nVerified Contacts ({len(contacts['contacts'])}):",
+        "-" * 70,
+        f"  {'Name':<20} | {'Contact':<25} | {'Weekly?':<8} | {'Verified':<10}",
+        "-" * 70,
+    ]
     for c in contacts["contacts"]:
         weekly_status = "?" if c.get('weeklyUpdates') is None else ("YES" if c.get('weeklyUpdates') else "NO")
-        print(f"  {c['name']:<20} | {c['contact']:<25} | {weekly_status:<8} | {c['verifiedAt'][:10]}")
-    
-    if PENDING_FILE.exists():
-        with open(PENDING_FILE, 'r') as f:
-            pending_data = json.load(f)
-        pending = pending_data.get("pending", [])
-        if pending:
-            print(f"\nPending Verification ({len(pending)}):")
-            print("-" * 60)
-            for p in pending:
-                print(f"  {p['name']} | {p['contact']} | Code: {p['verificationCode']} | Submitted: {p['submittedAt'][:10]}")
+        lines.append(f"  {c['name']:<20} | {c['contact']:<25} | {weekly_status:<8} | {c['verifiedAt'][:10]}")
+    
+    compact_pending()
+    pending = load_pending().get("pending", [])
+    if pending:
+        lines.append(f"\nPending Verification ({len(pending)}):")
+        lines.append("-" * 60)
+        for p in pending:
+            lines.append(f"  {p['name']} | {p['contact']} | Code: {p['verificationCode']} | Submitted: {p['submittedAt'][:10]}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python3 contacts.py <command> [args]")
         print("")
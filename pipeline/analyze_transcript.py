@@ -8,6 +8,12 @@ import os
 import sys
 import json
 import re
+import asyncio
+import sqlite3
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, date
 from typing import List, Dict, Optional, Tuple
@@ -17,12 +23,43 @@ from db_manager import get_db, PodcastEpisode, TickerMention
 
 # Try to import OpenAI
 try:
-    from openai import OpenAI
+    import httpx
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     print("  ⚠ OpenAI library not installed. Run: pip install openai")
 
+# orjson parses the AI replies and sidecars several times faster; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    json_loads = json.loads
+
+# Optional: retry rate limits and timeouts with backoff
+try:
+    from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+    TENACITY_AVAILABLE = True
+except ImportError:
+    TENACITY_AVAILABLE = False
+
+# Optional: exact token budgets for the transcript sample
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# HTTP/2 needs the h2 extra (pip install 'httpx[http2]'); keep-alive pooling works either way
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Try to import Gemini
 try:
     import google.generativeai as genai
@@ -35,6 +72,7 @@ except ImportError:
 TRANSCRIPT_DIR = Path.home() / ".openclaw/workspace/pipeline/transcripts"
 PROCESSED_MARKER_DIR = Path.home() / ".openclaw/workspace/pipeline/processed"
 PROCESSED_MARKER_DIR.mkdir(parents=True, exist_ok=True)
+DB_PATH = Path.home() / ".openclaw/workspace/pipeline/dashboard.db"
 
 # Podcast name mappings from filename patterns
 PODCAST_PATTERNS = {
@@ -62,6 +100,66 @@ CONTENT_PODCAST_HINTS = [
     (r'we study billionaires|the investor\'s podcast', 'We Study Billionaires'),
 ]
 
+# Compiled once at import
+PODCAST_PATTERNS_COMPILED = [
+    (pattern_key, podcast_name, re.compile(regex))
+    for pattern_key, (podcast_name, regex) in PODCAST_PATTERNS.items()
+]
+# Hints are lowercase and run against a lowered prefix: case-sensitive patterns keep
+# re's literal-prefix scan, which beats both IGNORECASE and one combined alternation
+CONTENT_HINTS_COMPILED = [
+    (re.compile(pattern), podcast_name)
+    for pattern, podcast_name in CONTENT_PODCAST_HINTS
+]
+
+# Episode date patterns (month names are looked up case-insensitively after matching)
+DATE_PATTERNS = [
+    re.compile(r'(\w+),?\s+(\d{1,2})[,\s]+(\d{4})'),  # Monday, February 9, 2026
+    re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})'),  # 9 February 2026
+    re.compile(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})'),  # February 9, 2026
+]
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+# A date can only parse if a month name appears as a whole word
+MONTH_WORD = re.compile(r'\b(?:' + '|'.join(MONTHS) + r')\b', re.IGNORECASE)
+
+
+# Provider errors worth retrying: rate limits, timeouts, dropped connections, 5xx
+TRANSIENT_AI_ERRORS = ()
+if OPENAI_AVAILABLE:
+    import openai
+    TRANSIENT_AI_ERRORS += (openai.RateLimitError, openai.APIConnectionError,
+                            openai.InternalServerError, httpx.TimeoutException)
+if GEMINI_AVAILABLE:
+    from google.api_core import exceptions as google_exceptions
+    TRANSIENT_AI_ERRORS += (google_exceptions.ResourceExhausted, google_exceptions.ServiceUnavailable,
+                            google_exceptions.DeadlineExceeded)
+AI_RETRY_ATTEMPTS = 5
+
+# Connection pool shared by every request an OpenAI-compatible client makes
+HTTP_MAX_CONNECTIONS = 32
+HTTP_TIMEOUT = 120.0
+GEMINI_MODEL = 'gemini-1.5-flash'
+
+
+def http_client_options() -> Dict:
+    """httpx settings for the OpenAI/Moonshot clients: kept-alive pooled connections, HTTP/2 if available."""
+    return {
+        'http2': HTTP2_AVAILABLE,
+        'limits': httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                               max_keepalive_connections=HTTP_MAX_CONNECTIONS),
+        'timeout': httpx.Timeout(HTTP_TIMEOUT),
+    }
+
+
+@lru_cache(maxsize=None)
+def gemini_model(name: str):
+    """GenerativeModel for a non-default Gemini model, built once per run."""
+    return genai.GenerativeModel(name)
+
 
 def get_ai_client() -> Optional[any]:
     """Get AI client - tries Moonshot/Kimi FIRST, then Gemini, then OpenAI."""
@@ -78,7 +176,8 @@ def get_ai_client() -> Optional[any]:
                 if profile.get('type') == 'api_key':
                     kimi_key = profile.get('key', '')
                     if kimi_key:
-                        client = OpenAI(api_key=kimi_key, base_url="https://api.moonshot.ai/v1")
+                        client = OpenAI(api_key=kimi_key, base_url="https://api.moonshot.ai/v1",
+                                        http_client=httpx.Client(**http_client_options()))
                         print("  Using Moonshot/Kimi API (primary)")
                         return ('moonshot', client)
         except Exception as e:
@@ -89,8 +188,10 @@ def get_ai_client() -> Optional[any]:
     if gemini_key and GEMINI_AVAILABLE:
         try:
             genai.configure(api_key=gemini_key)
+            # One GenerativeModel for the whole run; callers reuse it from client_info
+            model = genai.GenerativeModel(GEMINI_MODEL)
             print("  Using Gemini API (fallback)")
-            return ('gemini', gemini_key)
+            return ('gemini', model)
         except Exception as e:
             print(f"  ⚠ Gemini init failed: {e}")
 
@@ -98,7 +199,7 @@ def get_ai_client() -> Optional[any]:
     openai_key = os.environ.get('OPENAI_API_KEY')
     if openai_key and OPENAI_AVAILABLE:
         try:
-            client = OpenAI(api_key=openai_key)
+            client = OpenAI(api_key=openai_key, http_client=httpx.Client(**http_client_options()))
             print("  Using OpenAI API (fallback)")
             return ('openai', client)
         except Exception as e:
@@ -128,58 +229,52 @@ def parse_podcast_info(filename: str, content: str = '') -> Tuple[str, str]:
         meta_file = path.parent / f"{stem}.meta.json"
     if meta_file.exists():
         try:
-            import json as _json
-            with open(meta_file) as mf:
-                meta = _json.load(mf)
+            meta = json_loads(meta_file.read_bytes())
             podcast_name = meta.get('podcast_name', '').strip()
             if podcast_name and podcast_name not in ('Unknown', 'Unknown Podcast', ''):
                 return podcast_name, stem
         except Exception:
             pass
     
+    # 2-4. Filename patterns, then content clues (memoized; only the sidecar can change)
+    return detect_podcast_name(stem, content[:3000]), stem
+
+
+@lru_cache(maxsize=1024)
+def detect_podcast_name(stem: str, content_head: str) -> str:
+    """Podcast name from filename patterns, then show identity clues in the content head."""
     # 2. Filename pattern matching
-    for pattern_key, (podcast_name, regex) in PODCAST_PATTERNS.items():
-        if pattern_key in stem or re.match(regex, stem):
-            return podcast_name, stem
+    for pattern_key, podcast_name, regex in PODCAST_PATTERNS_COMPILED:
+        if pattern_key in stem or regex.match(stem):
+            return podcast_name
     
     # 3. Fallback: scan transcript content for show identity clues
-    if content:
-        content_lower = content[:3000].lower()
-        for pattern, podcast_name in CONTENT_PODCAST_HINTS:
-            if re.search(pattern, content_lower):
-                return podcast_name, stem
+    if content_head:
+        content_head = content_head.lower()
+        for regex, podcast_name in CONTENT_HINTS_COMPILED:
+            if regex.search(content_head):
+                return podcast_name
     
     # 4. Final fallback
-    return 'Unknown Podcast', stem
+    return 'Unknown Podcast'
 
 
 def extract_date_from_content(content: str) -> Optional[date]:
     """Try to extract episode date from transcript content."""
-    # Look for common date patterns
-    date_patterns = [
-        r'(\w+),?\s+(\d{1,2})[,\s]+(\d{4})',  # Monday, February 9, 2026
-        r'(\d{1,2})\s+(\w+)\s+(\d{4})',  # 9 February 2026
-        r'(\w+)\s+(\d{1,2}),?\s+(\d{4})',  # February 9, 2026
-    ]
-    
-    months = {
-        'january': 1, 'february': 2, 'march': 3, 'april': 4,
-        'may': 5, 'june': 6, 'july': 7, 'august': 8,
-        'september': 9, 'october': 10, 'november': 11, 'december': 12
-    }
-    
-    content_lower = content[:5000].lower()  # Check first 5000 chars
+    content_head = content[:5000]  # Check first 5000 chars
+    if not MONTH_WORD.search(content_head):
+        return None
     
-    for pattern in date_patterns:
-        match = re.search(pattern, content_lower)
+    for pattern in DATE_PATTERNS:
+        match = pattern.search(content_head)
         if match:
             try:
                 groups = match.groups()
                 if len(groups) == 3:
                     # Try to parse
                     for i, g in enumerate(groups):
-                        if g.lower() in months:
-                            month = months[g.lower()]
+                        if g.lower() in MONTHS:
+                            month = MONTHS[g.lower()]
                             day = int(groups[1] if i == 0 else groups[0] if i == 2 else groups[1])
                             year = int(groups[2] if i == 0 else groups[2] if i == 2 else groups[2])
                             return date(year, month, day)
@@ -189,63 +284,93 @@ def extract_date_from_content(content: str) -> Optional[date]:
     return None
 
 
-def is_transcript_processed(transcript_path: Path) -> bool:
-    """Check if transcript has already been processed."""
+# Duplicate-episode lookup: exact title, or same first 50 chars ignoring case
+EPISODE_MATCH_SQL = """
+    SELECT 1 FROM podcast_episodes
+    WHERE podcast_name = ?1
+      AND (episode_title = ?2 OR LOWER(SUBSTR(episode_title, 1, 50)) = LOWER(SUBSTR(?2, 1, 50)))
+    LIMIT 1
+"""
+EPISODE_MATCH_BY_GUID_SQL = """
+    SELECT 1 FROM podcast_episodes
+    WHERE rss_guid = ?3
+       OR (podcast_name = ?1
+           AND (episode_title = ?2 OR LOWER(SUBSTR(episode_title, 1, 50)) = LOWER(SUBSTR(?2, 1, 50))))
+    LIMIT 1
+"""
+
+# One autocommit connection per thread for the small lookups/updates below
+_conn_tls = threading.local()
+_indexes_ensured = False
+
+
+class _ThreadConnection:
+    """Holds a thread's connection in _conn_tls and closes it when the thread exits
+    (pool threads from collect_pending and asyncio.to_thread come and go per run)."""
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        weakref.finalize(self, conn.close)
+
+
+def _db() -> sqlite3.Connection:
+    """This thread's dashboard DB connection, opened on first use."""
+    global _indexes_ensured
+    holder = getattr(_conn_tls, 'holder', None)
+    if holder is None:
+        conn = sqlite3.connect(str(DB_PATH), isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if not _indexes_ensured:
+            _ensure_episode_indexes(conn)
+            _indexes_ensured = True
+        holder = _conn_tls.holder = _ThreadConnection(conn)
+    return holder.conn
+
+
+def _ensure_episode_indexes(conn: sqlite3.Connection):
+    """Indexes behind the duplicate-episode lookup (rss_guid only exists on migrated databases)."""
+    for statement in (
+        "CREATE INDEX IF NOT EXISTS idx_pe_title ON podcast_episodes(podcast_name, episode_title)",
+        "CREATE INDEX IF NOT EXISTS idx_pe_guid ON podcast_episodes(rss_guid)",
+    ):
+        try:
+            conn.execute(statement)
+        except sqlite3.OperationalError:
+            pass
+
+
+def processed_transcript_stems() -> set:
+    """Stems of every transcript with a processed marker (one directory read)."""
+    with os.scandir(PROCESSED_MARKER_DIR) as entries:
+        return {entry.name[:-len('.processed')] for entry in entries if entry.name.endswith('.processed')}
+
+
+def is_transcript_processed(transcript_path: Path, cache: Optional[set] = None) -> bool:
+    """Check if transcript has already been processed (against a processed_transcript_stems() set if given)."""
+    if cache is not None:
+        return transcript_path.stem in cache
     marker_file = PROCESSED_MARKER_DIR / f"{transcript_path.stem}.processed"
     return marker_file.exists()
 
 
 def mark_transcript_processed(transcript_path: Path, episode_id: int):
-    """Mark transcript as processed (file marker + DB flag)."""
+    """Mark transcript as processed (file marker; store_analysis sets the DB flag)."""
     marker_file = PROCESSED_MARKER_DIR / f"{transcript_path.stem}.processed"
-    with open(marker_file, 'w') as f:
-        f.write(json.dumps({
-            'processed_at': datetime.now().isoformat(),
-            'episode_id': episode_id,
-            'transcript_path': str(transcript_path)
-        }))
-    # Also set is_processed=1 in the database so the pipeline can query it
-    if episode_id and episode_id > 0:
-        try:
-            import sqlite3 as _sqlite3
-            _conn = _sqlite3.connect(str(Path.home() / ".openclaw/workspace/pipeline/dashboard.db"))
-            _conn.execute("UPDATE podcast_episodes SET is_processed = 1 WHERE id = ?", (episode_id,))
-            _conn.commit()
-            _conn.close()
-        except Exception as e:
-            print(f"    ⚠ Could not set is_processed in DB for episode {episode_id}: {e}")
-
-
-def analyze_transcript_with_ai(client_info, transcript_content: str, podcast_name: str) -> Dict:
-    """Use AI to extract structured data from transcript."""
-    
-    if client_info is None:
-        return None
-    
-    client_type, client = client_info
-    
-    # Smart sampling: send beginning + middle + end rather than just truncating top
-    # This gives the AI context from across the full episode, not just the intro
-    max_chars = 12000
-    if len(transcript_content) > max_chars:
-        chunk = max_chars // 3
-        beginning = transcript_content[:chunk]
-        mid_start = len(transcript_content) // 2 - chunk // 2
-        middle = transcript_content[mid_start:mid_start + chunk]
-        ending = transcript_content[-chunk:]
-        transcript_content = (
-            beginning + "\n\n[...middle of transcript...]\n\n" +
-            middle + "\n\n[...end of transcript...]\n\n" +
-            ending
-        )
-    
-    prompt = f"""You are an expert financial analyst and podcast curator. Analyze this podcast transcript from "{podcast_name}" and extract structured investment insights.
+    marker = {
+        'processed_at': datetime.now().isoformat(),
+        'episode_id': episode_id,
+        'transcript_path': str(transcript_path)
+    }
+    if ORJSON_AVAILABLE:
+        marker_file.write_bytes(orjson.dumps(marker))
+    else:
+        marker_file.write_text(json.dumps(marker))
 
-TRANSCRIPT:
-{transcript_content}
 
-Please provide your analysis in this exact JSON format:
-{{
+# JSON shape requested for each analyzed transcript
+ANALYSIS_FORMAT = """{
   "episode_title": "Full episode title (infer from content or use descriptive title)",
   "episode_date": "YYYY-MM-DD (infer from content, or use today's date if unclear)",
   "summary": "2-3 paragraph summary of key investment themes and market insights discussed",
@@ -255,7 +380,7 @@ Please provide your analysis in this exact JSON format:
   "key_tickers": ["LIST", "OF", "TICKERS", "MENTIONED"],
   "investment_thesis": "1-2 sentence summary of the core investment opportunity or thesis presented",
   "ticker_mentions": [
-    {{
+    {
       "ticker": "TICKER",
       "context": "Specific context from transcript about this ticker (1-2 sentences)",
       "sentiment": "bullish|bearish|neutral",
@@ -263,73 +388,443 @@ Please provide your analysis in this exact JSON format:
       "timeframe": "short_term|medium_term|long_term",
       "is_contrarian": false,
       "is_disruption_focused": false
-    }}
+    }
   ]
-}}
+}"""
 
-Scoring guidelines:
+SCORING_GUIDELINES = """Scoring guidelines:
 - conviction_score: 0-100 per ticker based on strength of argument (90+ for "deep dive/thesis", 70-89 for strong preference, 50-69 for positive mention, <50 for tracking/watching)
 - sentiment: Use explicit statements from speakers, not your inference
 - is_contrarian: true if speaker explicitly mentions going against consensus, "unloved", "underowned"
-- is_disruption_focused: true if discussing paradigm shifts, game changers, industry transformation
+- is_disruption_focused: true if discussing paradigm shifts, game changers, industry transformation"""
+
+# Batching: several transcripts share one API call (TRANSCRIPT_BATCH_SIZE=1 disables)
+BATCH_SIZE = int(os.environ.get('TRANSCRIPT_BATCH_SIZE', '4'))
+SAMPLE_MAX_CHARS = 12000        # transcript text sent per episode
+SAMPLE_MAX_TOKENS = 3500        # moonshot-v1-8k still fits the prompt (~600) and a 4000-token reply
+BATCH_MAX_CHARS = 48000         # sampled transcript text per batched prompt
+ITEM_OUTPUT_TOKENS = 4000       # reply budget per transcript, batched or not
+# Output token ceiling per provider; batches shrink so every transcript keeps ITEM_OUTPUT_TOKENS
+MAX_OUTPUT_TOKENS = {'gemini': 8192, 'openai': 16384, 'moonshot': 16384}
+
+# AI requests (batches) in flight at once
+CONCURRENCY = int(os.environ.get('TRANSCRIPT_CONCURRENCY', '8'))
+
+# Optional two-tier routing: a cheap model screens each transcript first and
+# low-relevance episodes without tickers skip the full analysis
+SCREEN_TRANSCRIPTS = os.environ.get('SCREEN_TRANSCRIPTS') == '1'
+SCREEN_MODELS = {'gemini': 'gemini-1.5-flash-8b', 'openai': 'gpt-4o-mini', 'moonshot': 'moonshot-v1-8k'}
+SCREEN_SAMPLE_CHARS = 3000
+SCREEN_MAX_TOKENS = 150
+SCREEN_MIN_RELEVANCE = 60
+
+# Threads reading and dedup-checking transcripts before the AI calls
+PREPARE_WORKERS = 8
+
+# Scheduled runs can go through the OpenAI Batch API instead (about half the cost,
+# results collected on a later run)
+USE_BATCH_API = os.environ.get('USE_BATCH_API') == '1'
+
+
+SAMPLE_MIDDLE_MARK = "\n\n[...middle of transcript...]\n\n"
+SAMPLE_END_MARK = "\n\n[...end of transcript...]\n\n"
+TRANSCRIPT_HEAD_CHARS = 5000  # covers podcast/date detection and the title line
+
+
+@lru_cache(maxsize=None)
+def token_encoding():
+    """The gpt-4o tokenizer, or None without tiktoken (or its downloaded data)."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def fit_token_budget(windows: List[str], max_tokens: int) -> List[str]:
+    """Trim sample windows to max_tokens in total, keeping the start/centre/end of each."""
+    enc = token_encoding()
+    if enc is None:
+        return windows
+    tokens = [enc.encode(window, disallowed_special=()) for window in windows]
+    if sum(len(t) for t in tokens) <= max_tokens:
+        return windows
+    chunk = max_tokens // 3
+    if len(tokens) == 1:
+        # Short in characters but not in tokens: split it like a long transcript
+        whole = tokens[0]
+        mid_start = len(whole) // 2 - chunk // 2
+        tokens = [whole[:chunk], whole[mid_start:mid_start + chunk], whole[-chunk:]]
+    else:
+        beginning, middle, ending = tokens
+        mid_start = max(0, len(middle) // 2 - chunk // 2)
+        tokens = [beginning[:chunk], middle[mid_start:mid_start + chunk], ending[-chunk:]]
+    return [enc.decode(t) for t in tokens]
+
+
+def sample_transcript(transcript_content: str, max_chars: int = SAMPLE_MAX_CHARS,
+                      max_tokens: int = SAMPLE_MAX_TOKENS) -> str:
+    """Smart sampling: beginning + middle + end rather than just truncating the top."""
+    # This gives the AI context from across the full episode, not just the intro.
+    # Anything no longer than a finished sample (e.g. from read_transcript) is reused as is.
+    if len(transcript_content) <= max_chars + len(SAMPLE_MIDDLE_MARK) + len(SAMPLE_END_MARK):
+        beginning, _, rest = transcript_content.partition(SAMPLE_MIDDLE_MARK)
+        middle, _, ending = rest.partition(SAMPLE_END_MARK)
+        windows = [beginning, middle, ending] if rest else [transcript_content]
+    else:
+        chunk = max_chars // 3
+        mid_start = len(transcript_content) // 2 - chunk // 2
+        windows = [
+            transcript_content[:chunk],
+            transcript_content[mid_start:mid_start + chunk],
+            transcript_content[-chunk:],
+        ]
+    # Characters are only a proxy; with tiktoken the sample is held to an exact token budget
+    windows = fit_token_budget(windows, max_tokens)
+    if len(windows) == 1:
+        return windows[0]
+    beginning, middle, ending = windows
+    return beginning + SAMPLE_MIDDLE_MARK + middle + SAMPLE_END_MARK + ending
+
+
+def read_transcript(transcript_path: Path, max_chars: int = SAMPLE_MAX_CHARS) -> Tuple[str, str]:
+    """Return (head, sample) for a transcript, reading only the windows sample_transcript() keeps.
+    
+    Long transcripts are read by seeking to the beginning/middle/end byte offsets, so
+    memory stays around max_chars no matter how long the episode runs.
+    """
+    size = transcript_path.stat().st_size
+    if size <= max_chars:
+        with open(transcript_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return content[:TRANSCRIPT_HEAD_CHARS], content
+    
+    chunk = max_chars // 3
+    with open(transcript_path, 'rb') as f:
+        head = f.read(max(chunk, TRANSCRIPT_HEAD_CHARS))
+        f.seek(size // 2 - chunk // 2)
+        middle = f.read(chunk)
+        f.seek(size - chunk)
+        ending = f.read(chunk)
+    
+    # Windows can start or end mid-character; drop the partial bytes
+    decode = lambda raw: raw.decode('utf-8', errors='ignore')
+    sample = decode(head[:chunk]) + SAMPLE_MIDDLE_MARK + decode(middle) + SAMPLE_END_MARK + decode(ending)
+    return decode(head), sample
+
+
+def build_analysis_prompt(transcript_content: str, podcast_name: str) -> str:
+    """Prompt asking for one transcript's analysis."""
+    transcript_content = sample_transcript(transcript_content)
+    return f"""You are an expert financial analyst and podcast curator. Analyze this podcast transcript from "{podcast_name}" and extract structured investment insights.
+
+TRANSCRIPT:
+{transcript_content}
+
+Please provide your analysis in this exact JSON format:
+{ANALYSIS_FORMAT}
+
+{SCORING_GUIDELINES}
+
+Return ONLY valid JSON. No markdown, no explanations."""
+
+
+def batch_limit(client_type: str) -> int:
+    """Transcripts per AI call: BATCH_SIZE, capped by the provider's output token limit."""
+    ceiling = MAX_OUTPUT_TOKENS.get(client_type, ITEM_OUTPUT_TOKENS)
+    return max(1, min(BATCH_SIZE, ceiling // ITEM_OUTPUT_TOKENS))
+
+
+def build_batch_prompt(items: List[Tuple[str, str]]) -> str:
+    """Prompt asking for an {"analyses": [...]} array, one per (podcast_name, content) item."""
+    sections = [
+        f'TRANSCRIPT {i} (from "{podcast_name}"):\n{sample_transcript(content)}'
+        for i, (podcast_name, content) in enumerate(items, 1)
+    ]
+    count = len(items)
+    transcripts = "\n\n".join(sections)
+    return f"""You are an expert financial analyst and podcast curator. Analyze each of the following {count} podcast transcripts independently and extract structured investment insights for each one.
+
+{transcripts}
+
+Return a JSON object of the form {{"analyses": [...]}} where "analyses" holds exactly {count} objects, one per transcript. Each object MUST include "transcript_index": the number N of the TRANSCRIPT N it analyzes. Never merge transcripts into one object. Apart from "transcript_index", each object uses this exact JSON format:
+{ANALYSIS_FORMAT}
+
+{SCORING_GUIDELINES}
 
 Return ONLY valid JSON. No markdown, no explanations."""
 
+
+def parse_batch_reply(content: str, count: int) -> Optional[List[Dict]]:
+    """The analyses in a batch reply in transcript order, or None unless each of the count
+    transcripts is matched by exactly one object carrying its transcript_index."""
+    data = json_loads(content)
+    analyses = data.get('analyses') if isinstance(data, dict) else data
+    if not isinstance(analyses, list) or len(analyses) != count or not all(isinstance(a, dict) for a in analyses):
+        print("    ⚠ Batch AI analysis returned an unexpected shape, retrying one by one")
+        return None
+    by_index = {}
+    for analysis in analyses:
+        index = analysis.pop('transcript_index', None)
+        if type(index) is not int or not 1 <= index <= count or index in by_index:
+            print("    ⚠ Batch AI analysis returned missing or mismatched transcript_index values, retrying one by one")
+            return None
+        by_index[index] = analysis
+    return [by_index[i] for i in range(1, count + 1)]
+
+
+def chat_request(client_type: str, prompt: str, max_tokens: int, batch: bool) -> Dict:
+    """Keyword arguments for chat.completions.create on the OpenAI-compatible providers."""
+    request = {
+        "messages": [
+            {"role": "system", "content": "You are a precise financial analyst. Return only valid JSON."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.3,
+        "max_tokens": max_tokens
+    }
+    if client_type == 'openai':
+        request["model"] = "gpt-4o-mini"
+        if batch:
+            request["response_format"] = {"type": "json_object"}
+    elif client_type == 'moonshot':
+        # Moonshot/Kimi API (OpenAI-compatible); batched prompts need the larger context window
+        request["model"] = "moonshot-v1-32k" if batch else "moonshot-v1-8k"
+    else:
+        raise ValueError(f"Unknown client type: {client_type}")
+    return request
+
+
+def gemini_config(max_tokens: int):
+    return genai.types.GenerationConfig(temperature=0.3, max_output_tokens=max_tokens)
+
+
+def clean_reply(content: str) -> str:
+    """Strip markdown code fences around a JSON reply."""
+    content = content.strip()
+    if content.startswith('```json'):
+        content = content[7:]
+    if content.startswith('```'):
+        content = content[3:]
+    if content.endswith('```'):
+        content = content[:-3]
+    return content.strip()
+
+
+def with_ai_retries(func):
+    """Retry func on TRANSIENT_AI_ERRORS with jittered exponential backoff (needs tenacity)."""
+    if not TENACITY_AVAILABLE or not TRANSIENT_AI_ERRORS:
+        return func
+    return retry(
+        stop=stop_after_attempt(AI_RETRY_ATTEMPTS),
+        wait=wait_random_exponential(min=2, max=60),
+        retry=retry_if_exception_type(TRANSIENT_AI_ERRORS),
+        reraise=True,
+    )(func)
+
+
+@with_ai_retries
+def run_completion(client_info, prompt: str, max_tokens: int = ITEM_OUTPUT_TOKENS, batch: bool = False,
+                   model: Optional[str] = None) -> str:
+    """Send one prompt to the configured provider and return the cleaned reply.
+    
+    model overrides the provider's default model (used for screening).
+    """
+    client_type, client = client_info
+    if client_type == 'gemini':
+        if model:
+            client = gemini_model(model)
+        response = client.generate_content(prompt, generation_config=gemini_config(max_tokens))
+        return clean_reply(response.text)
+    request = chat_request(client_type, prompt, max_tokens, batch)
+    if model:
+        request["model"] = model
+    response = client.chat.completions.create(**request)
+    return clean_reply(response.choices[0].message.content)
+
+
+@with_ai_retries
+async def run_completion_async(client_info, prompt: str, max_tokens: int = ITEM_OUTPUT_TOKENS, batch: bool = False,
+                               model: Optional[str] = None) -> str:
+    """Async run_completion; client_info must come from make_async_client."""
+    client_type, client = client_info
+    if client_type == 'gemini':
+        if model:
+            client = gemini_model(model)
+        response = await client.generate_content_async(prompt, generation_config=gemini_config(max_tokens))
+        return clean_reply(response.text)
+    request = chat_request(client_type, prompt, max_tokens, batch)
+    if model:
+        request["model"] = model
+    response = await client.chat.completions.create(**request)
+    return clean_reply(response.choices[0].message.content)
+
+
+# "episode_title" is the first field asked for, so it arrives early in a streamed reply
+STREAMED_TITLE = re.compile(r'"episode_title"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+
+def streamed_title(partial_reply: str) -> Optional[str]:
+    """The episode title once its JSON string has fully arrived, else None."""
+    match = STREAMED_TITLE.search(partial_reply)
+    if not match:
+        return None
     try:
-        if client_type == 'openai':
-            model = "gpt-4o-mini"
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": "You are a precise financial analyst. Return only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=4000
-            )
-            content = response.choices[0].message.content.strip()
-        elif client_type == 'moonshot':
-            # Moonshot/Kimi API (OpenAI-compatible)
-            response = client.chat.completions.create(
-                model="moonshot-v1-8k",
-                messages=[
-                    {"role": "system", "content": "You are a precise financial analyst. Return only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=4000
-            )
-            content = response.choices[0].message.content.strip()
-        elif client_type == 'gemini':
-            # Gemini API
-            model = genai.GenerativeModel('gemini-1.5-flash')
-            response = model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,
-                    max_output_tokens=4000
-                )
-            )
-            content = response.text.strip()
-        else:
-            raise ValueError(f"Unknown client type: {client_type}")
-        
-        # Clean up any markdown code blocks
-        if content.startswith('```json'):
-            content = content[7:]
-        if content.startswith('```'):
-            content = content[3:]
-        if content.endswith('```'):
-            content = content[:-3]
-        content = content.strip()
-        
-        return json.loads(content)
-        
+        return json.loads(match.group(1))
+    except ValueError:
+        return None
+
+
+class StreamedReply:
+    """Accumulates streamed text and runs on_title(title) once; on_title returns True to stop the stream."""
+    
+    def __init__(self, on_title):
+        self.on_title = on_title
+        self.pieces = []
+        self.title = None
+        self.stopped = False
+    
+    def feed(self, piece: str) -> bool:
+        """Add a piece of the reply; returns True if the rest is not wanted."""
+        self.pieces.append(piece or '')
+        if self.title is None:
+            self.title = streamed_title(''.join(self.pieces))
+            if self.title is not None and self.on_title(self.title):
+                self.stopped = True
+        return self.stopped
+    
+    def result(self) -> str:
+        if self.stopped:
+            # Caller only needs the title to recognize (and skip) the duplicate
+            return json.dumps({'episode_title': self.title})
+        return clean_reply(''.join(self.pieces))
+
+
+@with_ai_retries
+async def stream_completion_async(client_info, prompt: str, on_title, max_tokens: int = ITEM_OUTPUT_TOKENS) -> str:
+    """run_completion_async, streamed, with on_title called as soon as the title is complete.
+    client_info must come from make_async_client."""
+    client_type, client = client_info
+    reply = StreamedReply(on_title)
+    if client_type == 'gemini':
+        response = await client.generate_content_async(
+            prompt, generation_config=gemini_config(max_tokens), stream=True
+        )
+        async for chunk in response:
+            if reply.feed(chunk.text):
+                break
+        return reply.result()
+    
+    stream = await client.chat.completions.create(
+        **chat_request(client_type, prompt, max_tokens, False), stream=True
+    )
+    try:
+        async for chunk in stream:
+            if chunk.choices and reply.feed(chunk.choices[0].delta.content):
+                break
+    finally:
+        await stream.close()
+    return reply.result()
+
+
+def make_async_client(client_info):
+    """Async counterpart of a get_ai_client() result (same provider, key and endpoint)."""
+    client_type, client = client_info
+    if client_type == 'gemini':
+        return client_info  # genai is configured globally; models expose *_async methods
+    return (client_type, AsyncOpenAI(api_key=client.api_key, base_url=client.base_url,
+                                     http_client=httpx.AsyncClient(**http_client_options())))
+
+
+def build_screen_prompt(transcript_content: str, podcast_name: str) -> str:
+    """Short prompt for the cheap screening pass over the start of a transcript."""
+    return f"""Quickly screen this excerpt of a podcast transcript from "{podcast_name}" for an investment research dashboard.
+
+TRANSCRIPT EXCERPT:
+{transcript_content[:SCREEN_SAMPLE_CHARS]}
+
+Return ONLY valid JSON in this exact format:
+{{"episode_title": "best guess at the episode title", "relevance_score": 0-100 for how much concrete investing, markets or tech-industry content it has, "has_tickers": true if specific stocks or companies are discussed as investments}}"""
+
+
+def parse_screen_reply(reply: str) -> Dict:
+    data = json_loads(reply)
+    return {
+        'episode_title': str(data.get('episode_title') or ''),
+        'relevance_score': int(data.get('relevance_score', 100)),
+        'has_tickers': bool(data.get('has_tickers', True)),
+    }
+
+
+async def screen_transcript_async(client_info, transcript_content: str, podcast_name: str) -> Optional[Dict]:
+    """Cheap first pass: {episode_title, relevance_score, has_tickers}, or None to analyze in full.
+    client_info must come from make_async_client."""
+    try:
+        prompt = build_screen_prompt(transcript_content, podcast_name)
+        reply = await run_completion_async(client_info, prompt, SCREEN_MAX_TOKENS, model=SCREEN_MODELS[client_info[0]])
+        return parse_screen_reply(reply)
+    except Exception as e:
+        print(f"    ⚠ Screening failed, analyzing in full: {e}")
+        return None
+
+
+def filler_analysis(screen: Optional[Dict]) -> Optional[Dict]:
+    """Minimal analysis to store for an episode screened as filler; None means analyze in full."""
+    if not screen or screen['has_tickers'] or screen['relevance_score'] >= SCREEN_MIN_RELEVANCE:
+        return None
+    analysis = {'summary': '', 'relevance_score': screen['relevance_score'], 'ticker_mentions': []}
+    if screen['episode_title']:
+        analysis['episode_title'] = screen['episode_title']
+    return analysis
+
+
+def analyze_transcript_with_ai(client_info, transcript_content: str, podcast_name: str) -> Dict:
+    """Use AI to extract structured data from transcript."""
+    if client_info is None:
+        return None
+    
+    try:
+        prompt = build_analysis_prompt(transcript_content, podcast_name)
+        return json_loads(run_completion(client_info, prompt))
     except Exception as e:
         print(f"    ⚠ AI analysis failed: {e}")
         return None
 
 
+async def analyze_transcript_with_ai_async(client_info, transcript_content: str, podcast_name: str,
+                                           on_title=None) -> Dict:
+    """Async analyze_transcript_with_ai.
+    
+    With on_title the reply is streamed; if on_title(title) returns True the
+    request stops early and only {'episode_title': title} comes back.
+    """
+    try:
+        prompt = build_analysis_prompt(transcript_content, podcast_name)
+        if on_title is not None:
+            return json_loads(await stream_completion_async(client_info, prompt, on_title))
+        return json_loads(await run_completion_async(client_info, prompt))
+    except Exception as e:
+        print(f"    ⚠ AI analysis failed: {e}")
+        return None
+
+
+async def analyze_transcripts_batch_async(client_info, items: List[Tuple[str, str]]) -> Optional[List[Dict]]:
+    """Analyze several (podcast_name, content) transcripts in one AI call.
+    
+    Returns one analysis per item, in order, or None if the reply can't be
+    matched up (callers then fall back to one call per transcript).
+    """
+    try:
+        prompt = build_batch_prompt(items)
+        max_tokens = min(ITEM_OUTPUT_TOKENS * len(items), MAX_OUTPUT_TOKENS[client_info[0]])
+        reply = await run_completion_async(client_info, prompt, max_tokens, batch=True)
+        return parse_batch_reply(reply, len(items))
+    except Exception as e:
+        print(f"    ⚠ Batch AI analysis failed: {e}")
+        return None
+
+
 def episode_exists_in_db(db, podcast_name: str, episode_title: str, rss_guid: str = None) -> bool:
     """Check if an episode already exists in database.
     
@@ -338,36 +833,12 @@ def episode_exists_in_db(db, podcast_name: str, episode_title: str, rss_guid: st
     2. Exact podcast_name + episode_title match
     3. Fuzzy title match (first 50 chars, case-insensitive)
     """
-    import sqlite3 as _sqlite3
     try:
-        conn = _sqlite3.connect(str(Path.home() / ".openclaw/workspace/pipeline/dashboard.db"))
-
-        # 1. GUID match — most reliable
+        # One statement covers all three checks; the GUID branch only applies when we have one
         if rss_guid:
-            row = conn.execute(
-                "SELECT id FROM podcast_episodes WHERE rss_guid = ?", (rss_guid,)
-            ).fetchone()
-            if row:
-                conn.close()
-                return True
-
-        # 2. Exact title match
-        row = conn.execute(
-            "SELECT id FROM podcast_episodes WHERE podcast_name = ? AND episode_title = ?",
-            (podcast_name, episode_title)
-        ).fetchone()
-        if row:
-            conn.close()
-            return True
-
-        # 3. Fuzzy title match (first 50 chars)
-        row = conn.execute(
-            """SELECT id FROM podcast_episodes
-               WHERE podcast_name = ?
-               AND LOWER(SUBSTR(episode_title, 1, 50)) = LOWER(SUBSTR(?, 1, 50))""",
-            (podcast_name, episode_title)
-        ).fetchone()
-        conn.close()
+            row = _db().execute(EPISODE_MATCH_BY_GUID_SQL, (podcast_name, episode_title, rss_guid)).fetchone()
+        else:
+            row = _db().execute(EPISODE_MATCH_SQL, (podcast_name, episode_title)).fetchone()
         return row is not None
 
     except Exception as e:
@@ -375,62 +846,75 @@ def episode_exists_in_db(db, podcast_name: str, episode_title: str, rss_guid: st
         return False
 
 
-def process_transcript_file(transcript_path: Path, client_info, db) -> Optional[int]:
-    """Process a single transcript file and add to database."""
+def prepare_transcript(transcript_path: Path, db, processed_cache: Optional[set] = None,
+                       log=print) -> Optional[Dict]:
+    """Read a transcript and run the pre-AI checks; returns the work item or None to skip."""
     
-    if is_transcript_processed(transcript_path):
-        print(f"  ⏭ Skipping {transcript_path.name} (already processed)")
+    if is_transcript_processed(transcript_path, processed_cache):
+        log(f"  ⏭ Skipping {transcript_path.name} (already processed)")
         return None
     
-    print(f"  Processing {transcript_path.name}...")
+    log(f"  Processing {transcript_path.name}...")
 
-    # Read transcript
+    # Read transcript (just the head and the sampled windows)
     try:
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        head, content = read_transcript(transcript_path)
     except Exception as e:
-        print(f"    ✗ Failed to read: {e}")
+        log(f"    ✗ Failed to read: {e}")
         return None
     
     if len(content) < 500:
-        print(f"    ⏭ Too short, skipping")
+        log(f"    ⏭ Too short, skipping")
         return None
 
     # Parse podcast info (pass content for fallback content-based detection)
-    podcast_name, episode_slug = parse_podcast_info(transcript_path.name, content)
+    podcast_name, episode_slug = parse_podcast_info(transcript_path.name, head)
 
     # Load sidecar metadata (rss_guid, published_date, etc.)
     meta_file = transcript_path.parent / f"{transcript_path.stem}.meta.json"
     sidecar = {}
     if meta_file.exists():
         try:
-            with open(meta_file) as mf:
-                sidecar = json.load(mf)
+            sidecar = json_loads(meta_file.read_bytes())
         except Exception:
             pass
     rss_guid = sidecar.get('rss_guid', '') or ''
 
     # Get a preview of the episode title from the first line
-    first_line = content.strip().split('\n')[0][:100] if content else episode_slug
+    first_line = head.strip().split('\n')[0][:100] if head else episode_slug
     
     # Check if this episode already exists in database (guid first, then title)
     if episode_exists_in_db(db, podcast_name, first_line, rss_guid):
-        print(f"    ⏭ Episode already in database (duplicate), skipping")
+        log(f"    ⏭ Episode already in database (duplicate), skipping")
         mark_transcript_processed(transcript_path, -1)  # Mark as processed to avoid re-checking
         return None
     
-    # Analyze with AI
-    analysis = analyze_transcript_with_ai(client_info, content, podcast_name)
-    if not analysis:
-        print(f"    ✗ AI analysis failed")
-        return None
+    return {
+        'path': transcript_path,
+        'head': head,
+        'content': content,
+        'podcast_name': podcast_name,
+        'episode_slug': episode_slug,
+        'sidecar': sidecar,
+        'rss_guid': rss_guid,
+    }
+
+
+def store_analysis(item: Dict, analysis: Dict, db) -> Optional[int]:
+    """Add the analyzed episode and its ticker mentions to the database."""
+    transcript_path = item['path']
+    head = item['head']
+    podcast_name = item['podcast_name']
+    episode_slug = item['episode_slug']
+    sidecar = item['sidecar']
+    rss_guid = item['rss_guid']
     
     # Parse date
     ep_date_str = analysis.get('episode_date', '')
     try:
         episode_date = datetime.strptime(ep_date_str, '%Y-%m-%d').date()
     except (ValueError, TypeError):
-        episode_date = extract_date_from_content(content) or date.today()
+        episode_date = extract_date_from_content(head) or date.today()
     
     # Extract episode title from AI analysis
     episode_title = analysis.get('episode_title', episode_slug.replace('_', ' ').title())
@@ -459,33 +943,38 @@ def process_transcript_file(transcript_path: Path, client_info, db) -> Optional[
         key_takeaways=analysis.get('key_takeaways', []),
         key_tickers=analysis.get('key_tickers', []),
         investment_thesis=analysis.get('investment_thesis', '')[:500],
-        relevance_score=80  # Fixed baseline; no AI-calculated relevance
+        relevance_score=analysis.get('relevance_score', 80)  # Fixed baseline unless screened out as filler
     )
     
     episode_id = db.add_podcast_episode(episode)
     print(f"    ✓ Added episode (ID: {episode_id})")
 
-    # Store rss_guid and published_date from sidecar
-    if episode_id and (rss_guid or sidecar.get('published_date')):
+    # Store rss_guid/published_date from sidecar and set is_processed in one UPDATE,
+    # so the pipeline can query it
+    if episode_id:
         try:
-            import sqlite3 as _sqlite3
-            _conn = _sqlite3.connect(str(Path.home() / ".openclaw/workspace/pipeline/dashboard.db"))
-            _conn.execute(
-                "UPDATE podcast_episodes SET rss_guid=?, published_date=? WHERE id=?",
-                (rss_guid or None, sidecar.get('published_date') or None, episode_id)
-            )
-            _conn.commit()
-            _conn.close()
+            if rss_guid or sidecar.get('published_date'):
+                try:
+                    _db().execute(
+                        "UPDATE podcast_episodes SET rss_guid=?, published_date=?, is_processed=1 WHERE id=?",
+                        (rss_guid or None, sidecar.get('published_date') or None, episode_id)
+                    )
+                except sqlite3.OperationalError as e:
+                    # Databases without the rss_guid/published_date columns still get the flag
+                    print(f"    ⚠ Could not store rss_guid: {e}")
+                    _db().execute("UPDATE podcast_episodes SET is_processed = 1 WHERE id = ?", (episode_id,))
+            else:
+                _db().execute("UPDATE podcast_episodes SET is_processed = 1 WHERE id = ?", (episode_id,))
         except Exception as e:
-            print(f"    ⚠ Could not store rss_guid: {e}")
+            print(f"    ⚠ Could not set is_processed in DB for episode {episode_id}: {e}")
     
-    # Add ticker mentions
+    # Add ticker mentions (one transaction for the whole episode)
     ticker_mentions = analysis.get('ticker_mentions', [])
-    added_count = 0
+    mentions = []
     
     for tm in ticker_mentions:
         try:
-            mention = TickerMention(
+            mentions.append(TickerMention(
                 ticker=tm.get('ticker', 'UNKNOWN'),
                 source_type='podcast',
                 source_name=podcast_name,
@@ -496,12 +985,22 @@ def process_transcript_file(transcript_path: Path, client_info, db) -> Optional[
                 timeframe=tm.get('timeframe', 'medium_term'),
                 is_contrarian=tm.get('is_contrarian', False),
                 is_disruption_focused=tm.get('is_disruption_focused', False)
-            )
-            db.add_ticker_mention(mention)
-            added_count += 1
+            ))
         except Exception as e:
             print(f"    ⚠ Failed to add mention for {tm.get('ticker')}: {e}")
     
+    try:
+        added_count = db.add_ticker_mentions_bulk(mentions)
+    except Exception:
+        # One bad row rolls back the batch; retry row by row so the rest still land
+        added_count = 0
+        for mention in mentions:
+            try:
+                db.add_ticker_mention(mention)
+                added_count += 1
+            except Exception as e:
+                print(f"    ⚠ Failed to add mention for {mention.ticker}: {e}")
+    
     print(f"    ✓ Added {added_count} ticker mentions")
     
     # Mark as processed
@@ -510,49 +1009,286 @@ def process_transcript_file(transcript_path: Path, client_info, db) -> Optional[
     return episode_id
 
 
-def process_all_transcripts() -> Dict[str, any]:
-    """Process all unprocessed transcripts in the transcripts directory."""
+def iter_batches(items: List[Dict], max_items: int = BATCH_SIZE):
+    """Group work items into batches bounded by max_items and BATCH_MAX_CHARS of sampled text."""
+    batch, batch_chars = [], 0
+    for item in items:
+        chars = min(len(item['content']), SAMPLE_MAX_CHARS)
+        if batch and (len(batch) >= max_items or batch_chars + chars > BATCH_MAX_CHARS):
+            yield batch
+            batch, batch_chars = [], 0
+        batch.append(item)
+        batch_chars += chars
+    if batch:
+        yield batch
 
-    print("\n" + "="*60)
-    print("Processing Podcast Transcripts with AI")
-    print("="*60)
 
-    client_info = get_ai_client()
-    if not client_info:
-        print("✗ No AI client available. Check your API keys.")
-        return {'processed': 0, 'errors': 1}
-    
-    db = get_db()
+async def screen_items_async(client_info, items: List[Dict], semaphore) -> Tuple[List[Dict], List[Tuple[Dict, Dict]]]:
+    """Screen work items; returns (items to analyze in full, [(filler item, minimal analysis)])."""
+    async def screen(item):
+        async with semaphore:
+            return await screen_transcript_async(client_info, item['content'], item['podcast_name'])
     
+    screens = await asyncio.gather(*(screen(item) for item in items))
+    to_analyze, filler = [], []
+    for item, screen_result in zip(items, screens):
+        analysis = filler_analysis(screen_result)
+        if analysis:
+            print(f"  ⏭ {item['path'].name}: low relevance ({analysis['relevance_score']}), no tickers; "
+                  f"storing without full analysis")
+            filler.append((item, analysis))
+        else:
+            to_analyze.append(item)
+    return to_analyze, filler
+
+
+def duplicate_title_check(item: Dict, db):
+    """on_title callback: stop the AI reply once its title shows the episode is already stored."""
+    return lambda title: episode_exists_in_db(db, item['podcast_name'], title, item['rss_guid'])
+
+
+async def analyze_items_async(client_info, batch: List[Dict], db=None) -> List[Optional[Dict]]:
+    """Analyses for a batch of work items: one AI call, or one per item if that fails."""
+    if len(batch) > 1:
+        print(f"  Analyzing {len(batch)} transcripts in one request...")
+        analyses = await analyze_transcripts_batch_async(
+            client_info, [(item['podcast_name'], item['content']) for item in batch]
+        )
+        if analyses is not None:
+            return analyses
+    return await asyncio.gather(*(
+        analyze_transcript_with_ai_async(
+            client_info, item['content'], item['podcast_name'],
+            on_title=duplicate_title_check(item, db) if db is not None else None
+        )
+        for item in batch
+    ))
+
+
+def collect_pending(db, exclude=frozenset()) -> Tuple[List[Dict], int, int]:
+    """Read and dedup unprocessed transcripts; returns (work items, skipped, errors)."""
     # Find all transcript files
     transcript_files = list(TRANSCRIPT_DIR.glob('*.txt'))
     print(f"Found {len(transcript_files)} transcript files")
     
+    processed_stems = processed_transcript_stems()
+    to_prepare = [
+        path for path in transcript_files
+        if not is_transcript_processed(path, processed_stems) and str(path) not in exclude
+    ]
+    skipped = len(transcript_files) - len(to_prepare)
+    
+    def prepare(transcript_path):
+        # Progress lines are printed per file in order, not interleaved across threads
+        lines = []
+        try:
+            return prepare_transcript(transcript_path, db, processed_stems, log=lines.append), lines, None
+        except Exception as e:
+            return None, lines, e
+    
+    # Reading and the duplicate lookups are I/O-bound and independent per file
+    pending = []
+    errors = 0
+    with ThreadPoolExecutor(max_workers=PREPARE_WORKERS) as executor:
+        for transcript_path, (item, lines, error) in zip(to_prepare, executor.map(prepare, to_prepare)):
+            if lines:
+                print("\n".join(lines))
+            if error is not None:
+                print(f"  ✗ Error processing {transcript_path.name}: {error}")
+                errors += 1
+            elif item:
+                pending.append(item)
+    return pending, skipped, errors
+
+
+async def process_all_transcripts_async(client_info, db) -> Dict[str, any]:
+    """Analyze unprocessed transcripts, keeping up to CONCURRENCY AI requests in flight."""
+    # Read and dedup first so the AI calls can be batched
+    pending, skipped, errors = collect_pending(db)
+    processed = 0
+    
+    async_client = make_async_client(client_info)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    db_lock = asyncio.Lock()  # one batch writes at a time; sqlite serializes writers anyway
+    
+    async def store_results(results):
+        nonlocal processed, errors
+        async with db_lock:
+            for item, analysis in results:
+                if not analysis:
+                    print(f"    ✗ AI analysis failed for {item['path'].name}")
+                    continue
+                try:
+                    # Off the event loop so other requests keep progressing
+                    episode_id = await asyncio.to_thread(store_analysis, item, analysis, db)
+                    if episode_id:
+                        processed += 1
+                except Exception as e:
+                    print(f"  ✗ Error processing {item['path'].name}: {e}")
+                    errors += 1
+    
+    async def run_batch(batch):
+        nonlocal errors
+        async with semaphore:
+            try:
+                analyses = await analyze_items_async(async_client, batch, db)
+            except Exception as e:
+                print(f"  ✗ Error analyzing {', '.join(item['path'].name for item in batch)}: {e}")
+                errors += len(batch)
+                return
+        await store_results(zip(batch, analyses))
+    
+    try:
+        if SCREEN_TRANSCRIPTS:
+            pending, filler = await screen_items_async(async_client, pending, semaphore)
+            await store_results(filler)
+        await asyncio.gather(*(run_batch(batch) for batch in iter_batches(pending, batch_limit(async_client[0]))))
+    finally:
+        if async_client[0] != 'gemini':
+            await async_client[1].close()
+    
+    print(f"\n✓ Transcript processing complete: {processed} new, {skipped} skipped, {errors} errors")
+    return {
+        'processed': processed,
+        'skipped': skipped,
+        'errors': errors
+    }
+
+
+def submit_batch(client_info, items: List[Dict], db) -> Optional[str]:
+    """Upload one chat request per transcript as a Batch API job and record it in pending_batches."""
+    client_type, client = client_info
+    transcript_paths = {}
+    lines = []
+    for i, item in enumerate(items):
+        custom_id = f"transcript-{i}"
+        transcript_paths[custom_id] = str(item['path'])
+        prompt = build_analysis_prompt(item['content'], item['podcast_name'])
+        lines.append(json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": chat_request(client_type, prompt, ITEM_OUTPUT_TOKENS, batch=False)
+        }))
+    
+    batch_input = client.files.create(
+        file=("transcripts.jsonl", ("\n".join(lines) + "\n").encode('utf-8')),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_input.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    db.add_pending_batch(batch.id, client_type, transcript_paths)
+    print(f"  ✓ Submitted {len(items)} transcripts as batch {batch.id}")
+    return batch.id
+
+
+def poll_batches(client_info, db) -> Tuple[int, int, set]:
+    """Store results of finished batches; returns (processed, errors, paths still in flight)."""
+    client_type, client = client_info
     processed = 0
-    skipped = 0
     errors = 0
+    in_flight = set()
     
-    for transcript_path in transcript_files:
-        if is_transcript_processed(transcript_path):
-            skipped += 1
+    for row in db.get_pending_batches():
+        batch_id = row['batch_id']
+        paths = row['transcript_paths']
+        batch = client.batches.retrieve(batch_id)
+        
+        if batch.status in ('validating', 'in_progress', 'finalizing'):
+            print(f"  ⏳ Batch {batch_id} still {batch.status}")
+            in_flight.update(paths.values())
             continue
         
+        if batch.status != 'completed' or not batch.output_file_id:
+            # Its transcripts are picked up again by the next submission
+            print(f"  ⚠ Batch {batch_id} ended as {batch.status}")
+            db.finish_pending_batch(batch_id, batch.status)
+            continue
+        
+        print(f"  Collecting batch {batch_id}...")
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = json_loads(line)
+            transcript_path = paths.get(result.get('custom_id'))
+            if not transcript_path:
+                continue
+            try:
+                body = (result.get('response') or {}).get('body')
+                if not body:
+                    raise ValueError(result.get('error') or 'no response')
+                analysis = json_loads(clean_reply(body['choices'][0]['message']['content']))
+            except Exception as e:
+                print(f"    ✗ AI analysis failed for {Path(transcript_path).name}: {e}")
+                errors += 1
+                continue
+            
+            try:
+                # Re-read and re-check: the episode may have arrived another way meanwhile
+                item = prepare_transcript(Path(transcript_path), db)
+                if item is None:
+                    continue
+                episode_id = store_analysis(item, analysis, db)
+                if episode_id:
+                    processed += 1
+            except Exception as e:
+                print(f"  ✗ Error processing {Path(transcript_path).name}: {e}")
+                errors += 1
+        
+        db.finish_pending_batch(batch_id, 'completed')
+    
+    return processed, errors, in_flight
+
+
+def process_with_batch_api(client_info, db) -> Dict[str, any]:
+    """Collect finished Batch API jobs, then submit everything not yet analyzed or in flight."""
+    processed, errors, in_flight = poll_batches(client_info, db)
+    pending, skipped, collect_errors = collect_pending(db, exclude=in_flight)
+    errors += collect_errors
+    
+    submitted = 0
+    if pending:
         try:
-            episode_id = process_transcript_file(transcript_path, client_info, db)
-            if episode_id:
-                processed += 1
+            submit_batch(client_info, pending, db)
+            submitted = len(pending)
         except Exception as e:
-            print(f"  ✗ Error processing {transcript_path.name}: {e}")
-            errors += 1
+            print(f"  ✗ Batch submission failed: {e}")
+            errors += len(pending)
     
-    print(f"\n✓ Transcript processing complete: {processed} new, {skipped} skipped, {errors} errors")
+    print(f"\n✓ Transcript processing complete: {processed} new, {submitted} submitted, {skipped} skipped, {errors} errors")
     return {
         'processed': processed,
+        'submitted': submitted,
         'skipped': skipped,
         'errors': errors
     }
 
 
+def process_all_transcripts() -> Dict[str, any]:
+    """Process all unprocessed transcripts in the transcripts directory."""
+
+    print("\n" + "="*60)
+    print("Processing Podcast Transcripts with AI")
+    print("="*60)
+
+    client_info = get_ai_client()
+    if not client_info:
+        print("✗ No AI client available. Check your API keys.")
+        return {'processed': 0, 'errors': 1}
+    
+    db = get_db()
+    
+    if USE_BATCH_API:
+        if client_info[0] == 'openai':
+            return process_with_batch_api(client_info, db)
+        print(f"  ⚠ USE_BATCH_API needs the OpenAI client (have {client_info[0]}); analyzing now instead")
+    
+    return asyncio.run(process_all_transcripts_async(client_info, db))
+
+
 if __name__ == "__main__":
     result = process_all_transcripts()
     print(f"\nResults: {result}")
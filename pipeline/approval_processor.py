@@ -5,32 +5,98 @@ Downloads, transcribes, and analyzes ONLY approved episodes.
 """
 
 import json
+import os
 import re
-import sys
+import shutil
 import subprocess
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses the state files several times faster; fall back to stdlib json
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
 TRANSCRIPT_DIR = Path.home() / ".openclaw/workspace/pipeline/transcripts"
 STATE_DIR = Path.home() / ".openclaw/workspace/pipeline/state"
 PENDING_FILE = STATE_DIR / "pending_approval.json"
-CURATED_FILE = STATE_DIR / "curated_episodes.json"
+# audio_url -> {path, size, etag, last_modified} of earlier downloads, for reuse and conditional GETs
+AUDIO_CACHE_FILE = STATE_DIR / "audio_cache.json"
+
+# Parsed state files keyed by path -> ((mtime_ns, size), data); callers treat the data as read-only
+_JSON_CACHE = {}
+
+APPROVAL_TOKEN = re.compile(r'(\d+)\s*(?:-|to)\s*(\d+)|(\d+)', re.I)
+
+# File-name sanitizing: anything but word characters and '-' becomes '_'
+UNSAFE_NAME_CHARS = re.compile(r'[^\w\-]')
+ASCII_SAFE_NAME = str.maketrans({chr(c): '_' for c in range(128) if UNSAFE_NAME_CHARS.match(chr(c))})
+
+EXPORT_LOG_TAIL_LINES = 200
+PIPELINE_EXPORT_TIMEOUT = 300  # seconds before run_pipeline.py is killed
+
+DOWNLOAD_WORKERS = 4              # episodes downloading at once
+DOWNLOAD_AHEAD = 2                # episodes fetched ahead of the one being transcribed
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = (10, 300)      # connect, read (seconds)
+
+# aria2c, when installed, splits one episode across parallel range requests (CDNs throttle per connection)
+ARIA2C = shutil.which('aria2c')
+ARIA2C_CONNECTIONS = 4
+ARIA2C_TIMEOUT = 1800             # whole download (seconds)
+
+# Reuse keep-alive connections across downloads (episodes often share a CDN host)
+_session = requests.Session()
+_session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'})
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=DOWNLOAD_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)),
+)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+# Download threads update the audio cache file one at a time
+_audio_cache_lock = threading.Lock()
+
+def _load_json_cached(path, default):
+    """Parse a state JSON file, reusing the last parse while its mtime and size are unchanged."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _JSON_CACHE.pop(path, None)
+        return default
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    data = json_loads(path.read_bytes())
+    _JSON_CACHE[path] = (key, data)
+    return data
+
+def _atomic_write_json(path, obj):
+    """Write JSON beside path and rename it into place, so readers never see a torn file."""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_bytes(json_dumps(obj))
+    os.replace(tmp, path)
 
 def load_pending_episodes():
     """Load pending episodes from file."""
-    if not PENDING_FILE.exists():
-        return None
-    
-    with open(PENDING_FILE, 'r') as f:
-        return json.load(f)
-
-def load_curated_episodes():
-    """Load curated episodes with audio URLs."""
-    if not CURATED_FILE.exists():
-        return {}
-    
-    with open(CURATED_FILE, 'r') as f:
-        return json.load(f)
+    return _load_json_cached(PENDING_FILE, None)
 
 def parse_approval_response(response_text, episodes):
     """Parse user's approval response."""
@@ -44,98 +110,155 @@ def parse_approval_response(response_text, episodes):
     if 'skip' in response_lower:
         return []
     
-    # Look for numbers
-    numbers = []
-    
-    # Pattern: "1,3,5"
-    if ',' in response_text:
-        parts = response_text.split(',')
-        for p in parts:
-            p = p.strip()
-            if p.isdigit():
-                numbers.append(int(p))
-    
-    # Pattern: "1 3 5" or "1 and 3"
-    elif ' ' in response_text or 'and' in response_lower:
-        words = re.findall(r'\d+', response_text)
-        numbers = [int(w) for w in words]
-    
-    # Pattern: "1-3" or "1 to 3"
-    elif '-' in response_text or 'to' in response_lower:
-        match = re.search(r'(\d+)\s*(?:-|to)\s*(\d+)', response_text)
-        if match:
+    # One pass over the reply: "1-3" / "1 to 3" ranges and single numbers, in any mix ("1-3,5")
+    numbers = set()
+    for match in APPROVAL_TOKEN.finditer(response_text):
+        if match.group(1):
             start, end = int(match.group(1)), int(match.group(2))
-            numbers = list(range(start, end + 1))
-    
-    # Single number
-    elif response_text.strip().isdigit():
-        numbers = [int(response_text.strip())]
+            numbers.update(range(max(start, 1), min(end, len(episodes)) + 1))
+        else:
+            numbers.add(int(match.group(3)))
     
     # Convert numbers to episode dicts
-    to_process = []
-    for num in numbers:
-        if 1 <= num <= len(episodes):
-            to_process.append(episodes[num - 1])
+    to_process = [episodes[num - 1] for num in sorted(numbers) if 1 <= num <= len(episodes)]
     
     return to_process
 
-def download_and_transcribe(episode, curated_data):
-    """Download and transcribe a single approved episode."""
-    import urllib.request
-    import os
-    
+def cached_audio_path(audio_url):
+    """Path of an earlier, complete download of audio_url, or None."""
+    entry = _load_json_cached(AUDIO_CACHE_FILE, {}).get(audio_url)
+    if not entry:
+        return None
+    path = Path(entry['path'])
+    try:
+        return path if path.stat().st_size == entry.get('size') else None
+    except OSError:
+        return None
+
+def cached_audio_validators(audio_url):
+    """If-None-Match / If-Modified-Since headers for revalidating an earlier download."""
+    entry = _load_json_cached(AUDIO_CACHE_FILE, {}).get(audio_url) or {}
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+def remember_audio(audio_url, audio_path, headers=None):
+    """Record a finished download (and the server's validators) in the audio cache."""
+    headers = headers or {}
+    with _audio_cache_lock:
+        cache = dict(_load_json_cached(AUDIO_CACHE_FILE, {}))
+        cache[audio_url] = {
+            'path': str(audio_path),
+            'size': audio_path.stat().st_size,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        _atomic_write_json(AUDIO_CACHE_FILE, cache)
+
+def save_response(response, audio_path):
+    """Stream a response body to disk rather than holding the whole episode in memory."""
+    with open(audio_path, 'wb') as f:
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+
+def download_with_aria2c(audio_url, audio_path):
+    """Fetch audio_url into audio_path over several range connections; raises on failure."""
+    result = subprocess.run(
+        [ARIA2C, '-x', str(ARIA2C_CONNECTIONS), '-s', str(ARIA2C_CONNECTIONS),
+         '--max-tries=3', '--retry-wait=2', '--allow-overwrite=true', '--auto-file-renaming=false',
+         '--console-log-level=error', '--summary-interval=0', '--download-result=hide',
+         f"--user-agent={_session.headers['User-Agent']}",
+         '-d', str(audio_path.parent), '-o', audio_path.name, audio_url],
+        capture_output=True, text=True, timeout=ARIA2C_TIMEOUT,
+    )
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).strip().splitlines()
+        raise RuntimeError(f"aria2c exit {result.returncode}: {output[-1] if output else 'no output'}")
+
+def download_episode(episode, log=print):
+    """Download one approved episode's audio; returns (audio_path, safe_name) or None."""
     audio_url = episode.get('audio_url')
     if not audio_url:
-        print(f"  ✗ No audio URL for {episode.get('title', 'Unknown')}")
+        log(f"  ✗ No audio URL for {episode.get('title', 'Unknown')}")
         return None
     
     # Create safe filename
     podcast_name = episode.get('podcast', 'unknown').replace(' ', '_')
     episode_title = episode.get('title', 'episode')[:50].replace(' ', '_')
     safe_name = f"{podcast_name}_{episode_title}_{datetime.now().strftime('%Y%m%d')}"
-    safe_name = re.sub(r'[^\w\-]', '_', safe_name)
+    # Same result as UNSAFE_NAME_CHARS.sub('_', ...); the table lookup covers the usual all-ASCII names
+    safe_name = safe_name.translate(ASCII_SAFE_NAME) if safe_name.isascii() else UNSAFE_NAME_CHARS.sub('_', safe_name)
     
     audio_path = TRANSCRIPT_DIR.parent / "audio" / f"{safe_name}.mp3"
-    transcript_path = TRANSCRIPT_DIR / f"{safe_name}.txt"
-    
     audio_path.parent.mkdir(exist_ok=True)
     
     try:
-        # Download audio
-        print(f"  ↓ Downloading audio...")
-        req = urllib.request.Request(audio_url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-        })
-        
-        with urllib.request.urlopen(req, timeout=300) as response:
-            with open(audio_path, 'wb') as f:
-                f.write(response.read())
-        
-        print(f"  ✓ Downloaded: {audio_path}")
+        cached_path = cached_audio_path(audio_url)
+        if cached_path:
+            validators = cached_audio_validators(audio_url)
+            if not validators:
+                log(f"  ⏭ Audio already downloaded: {cached_path}")
+                return cached_path, safe_name
+            
+            # Conditional GET: a 304 reuses the earlier download without transferring the episode again
+            with _session.get(audio_url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers=validators) as response:
+                if response.status_code == 304:
+                    log(f"  ⏭ Audio unchanged since last download: {cached_path}")
+                    return cached_path, safe_name
+                log(f"  ↓ Downloading audio (changed on server)...")
+                response.raise_for_status()
+                save_response(response, audio_path)
+            remember_audio(audio_url, audio_path, response.headers)
+        else:
+            log(f"  ↓ Downloading audio...")
+            if ARIA2C:
+                download_with_aria2c(audio_url, audio_path)
+                remember_audio(audio_url, audio_path)
+            else:
+                with _session.get(audio_url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                    response.raise_for_status()
+                    save_response(response, audio_path)
+                remember_audio(audio_url, audio_path, response.headers)
         
+        log(f"  ✓ Downloaded: {audio_path}")
+        return audio_path, safe_name
+    
+    except Exception as e:
+        log(f"  ✗ Error: {str(e)[:100]}")
+        return None
+
+def transcribe_episode(audio_path, safe_name):
+    """Transcribe downloaded audio with local Whisper; returns the transcript path or None."""
+    transcript_path = TRANSCRIPT_DIR / f"{safe_name}.txt"
+    
+    try:
         # Transcribe using LOCAL Whisper (free, no API costs)
         print(f"  🎤 Transcribing with local Whisper (FREE)...")
-        result = subprocess.run(
-            [sys.executable, "transcribe_local.py", str(audio_path), safe_name],
-            cwd=Path(__file__).parent,
-            capture_output=True,
-            text=True,
-            timeout=1800  # 30 min timeout for long episodes
-        )
+        from transcribe_local import transcribe_file
         
-        if result.returncode == 0:
+        if transcribe_file(audio_path, output_name=safe_name):
             print(f"  ✓ Transcribed: {transcript_path}")
             return str(transcript_path)
         else:
-            print(f"  ✗ Transcription failed: {result.stderr[:200]}")
+            print(f"  ✗ Transcription failed")
             return None
             
     except Exception as e:
         print(f"  ✗ Error: {str(e)[:100]}")
         return None
 
-def analyze_transcript(transcript_path):
-    """Run AI analysis on transcript."""
+def download_in_background(executor, episode):
+    """Start an episode download; its progress lines are kept until the result is collected."""
+    lines = []
+    return executor.submit(download_episode, episode, lines.append), lines
+
+def analyze_new_transcripts():
+    """Run AI analysis over every unprocessed transcript (one pass covers the whole batch).
+    Returns how many transcripts were analyzed and stored."""
     print(f"  🤖 Running AI analysis...")
     
     # Import and run analysis
@@ -143,26 +266,42 @@ def analyze_transcript(transcript_path):
         from analyze_transcript import process_all_transcripts
         result = process_all_transcripts()
         print(f"  ✓ Analysis complete")
-        return True
+        return result.get('processed', 0)
     except Exception as e:
         print(f"  ✗ Analysis failed: {e}")
-        return False
+        return 0
 
 def run_full_pipeline_export():
     """Run pipeline export and push to GitHub."""
     print(f"\n🚀 Running full pipeline export...")
     
-    result = subprocess.run(
+    # Separate interpreter with a deadline, so a hung export can't stall the approval reply
+    proc = subprocess.Popen(
         [sys.executable, "run_pipeline.py"],
         cwd=Path(__file__).parent,
-        capture_output=True,
-        text=True,
-        timeout=300
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
     )
+    timed_out = threading.Event()
+    timer = threading.Timer(PIPELINE_EXPORT_TIMEOUT, lambda: (timed_out.set(), proc.kill()))
+    timer.start()
+    # Keep only the tail of the pipeline's (long) output rather than all of it
+    tail = deque(maxlen=EXPORT_LOG_TAIL_LINES)
+    try:
+        with proc.stdout:
+            tail.extend(proc.stdout)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
     
-    print(result.stdout[-2000:] if len(result.stdout) > 2000 else result.stdout)
+    log = ''.join(tail)
+    print(log[-2000:] if len(log) > 2000 else log)
     
-    if result.returncode == 0:
+    if timed_out.is_set():
+        print(f"\n✗ Pipeline timed out after {PIPELINE_EXPORT_TIMEOUT}s")
+        return False
+    if returncode == 0:
         print("\n✓ Pipeline complete! Website updating...")
         return True
     else:
@@ -174,7 +313,6 @@ def main(response_text=None):
     
     # Load pending episodes
     pending = load_pending_episodes()
-    curated = load_curated_episodes()
     
     if not pending:
         print("No pending episodes found. Run morning_curator.py first.")
@@ -223,15 +361,37 @@ def main(response_text=None):
     print(f"DOWNLOADING & TRANSCRIBING")
     print(f"{'='*60}")
     
-    success_count = 0
-    for i, episode in enumerate(approved_episodes, 1):
-        print(f"\n[{i}/{len(approved_episodes)}] {episode.get('title', 'Unknown')[:50]}")
-        
-        transcript_path = download_and_transcribe(episode, curated)
-        
-        if transcript_path:
-            success_count += 1
-            analyze_transcript(transcript_path)
+    # Episodes a previous (interrupted) run already transcribed, by audio URL
+    transcribed = dict(pending.get('transcribed', {}))
+    done = [ep for ep in approved_episodes if ep.get('audio_url') in transcribed]
+    if done:
+        print(f"\n⏭ {len(done)} episode(s) already transcribed by an earlier run")
+    remaining = [ep for ep in approved_episodes if ep.get('audio_url') not in transcribed]
+    
+    success_count = len(done)
+    # Downloads run ahead in threads while earlier episodes transcribe (Whisper runs one at a time),
+    # at most DOWNLOAD_AHEAD episodes past the one being transcribed
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        queued = iter(remaining)
+        downloads = deque(download_in_background(executor, episode)
+                          for episode in islice(queued, DOWNLOAD_AHEAD + 1))
+        for i, episode in enumerate(remaining, 1):
+            print(f"\n[{i}/{len(remaining)}] {episode.get('title', 'Unknown')[:50]}")
+            
+            download, lines = downloads.popleft()
+            for upcoming in islice(queued, 1):
+                downloads.append(download_in_background(executor, upcoming))
+            downloaded = download.result()
+            print("\n".join(lines))
+            if not downloaded:
+                continue
+            
+            transcript_path = transcribe_episode(*downloaded)
+            if transcript_path:
+                success_count += 1
+                # Checkpoint so a restart skips this episode
+                transcribed[episode['audio_url']] = transcript_path
+                _atomic_write_json(PENDING_FILE, {**pending, 'transcribed': transcribed})
     
     print(f"\n{'='*60}")
     print(f"SUMMARY")
@@ -242,8 +402,11 @@ def main(response_text=None):
     PENDING_FILE.unlink(missing_ok=True)
     
     if success_count > 0:
-        # Run full pipeline to update website
-        run_full_pipeline_export()
+        # One analysis pass picks up every new transcript, then run full pipeline to update website
+        if analyze_new_transcripts() > 0:
+            run_full_pipeline_export()
+        else:
+            print("\n⏭ No new analysis stored; website export skipped")
     else:
         print("\nNo episodes successfully processed.")
 
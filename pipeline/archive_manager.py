@@ -11,51 +11,60 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 from db_manager import get_db
 
+def _render_insight(row):
+    status = "ARCHIVED" if not row['display_on_main'] else "ACTIVE"
+    title = row['title'][:37] + "..." if len(row['title']) > 40 else row['title']
+    date = row['source_date'][:10] if row['source_date'] else "Unknown"
+    return f"{row['id']:<5} {date:<12} {status:<10} {title:<40} {row['source_name']}"
+
+def _render_definition(row):
+    status = "ARCHIVED" if not row['display_on_main'] else "ACTIVE"
+    date = row['added_date'] if row['added_date'] else "Unknown"
+    return f"{row['id']:<5} {date:<12} {status:<10} {row['vote_count']:<6} {row['term']}"
+
+def _render_overton(row):
+    status = row['status'].upper() if not row['display_on_main'] else "ACTIVE"
+    date = row['first_detected_date'] if row['first_detected_date'] else "Unknown"
+    return f"{row['id']:<5} {date:<12} {status:<12} {row['mention_count']:<9} {row['term']}"
+
+def _list_queries(select, order):
+    """(all rows, active only) variants of a listing query, built once so SQLite can reuse them."""
+    # Active-only listings read straight off the (display_on_main, sort column) indexes
+    return (f"{select} {order}", f"{select} WHERE display_on_main = 1 {order}")
+
+# item_type -> (queries, header, rule width, row renderer)
+LIST_SPECS = {
+    'insights': (
+        _list_queries("SELECT id, title, source_name, source_date, display_on_main, archived_date FROM latest_insights",
+                      "ORDER BY source_date DESC LIMIT 20"),
+        f"\n{'ID':<5} {'Date':<12} {'Status':<10} {'Title':<40} {'Source'}", 100, _render_insight,
+    ),
+    'definitions': (
+        _list_queries("SELECT id, term, added_date, display_on_main, vote_count FROM definitions",
+                      "ORDER BY vote_count DESC"),
+        f"\n{'ID':<5} {'Added':<12} {'Status':<10} {'Votes':<6} {'Term'}", 80, _render_definition,
+    ),
+    'overton': (
+        _list_queries("SELECT id, term, first_detected_date, status, display_on_main, mention_count FROM overton_terms",
+                      "ORDER BY mention_count DESC"),
+        f"\n{'ID':<5} {'First Seen':<12} {'Status':<12} {'Mentions':<9} {'Term'}", 80, _render_overton,
+    ),
+}
+
 def list_content(item_type: str, show_archived: bool = False):
     """List content with IDs for archiving."""
+    spec = LIST_SPECS.get(item_type)
+    if spec is None:
+        return
+    (all_sql, active_sql), header, width, render = spec
     db = get_db()
     
     with db._get_connection() as conn:
-        if item_type == 'insights':
-            cursor = conn.execute("""
-                SELECT id, title, source_name, source_date, display_on_main, archived_date
-                FROM latest_insights
-                ORDER BY source_date DESC
-                LIMIT 20
-            """)
-            print(f"\n{'ID':<5} {'Date':<12} {'Status':<10} {'Title':<40} {'Source'}")
-            print("-" * 100)
-            for row in cursor.fetchall():
-                status = "ARCHIVED" if not row['display_on_main'] else "ACTIVE"
-                title = row['title'][:37] + "..." if len(row['title']) > 40 else row['title']
-                date = row['source_date'][:10] if row['source_date'] else "Unknown"
-                print(f"{row['id']:<5} {date:<12} {status:<10} {title:<40} {row['source_name']}")
-        
-        elif item_type == 'definitions':
-            cursor = conn.execute("""
-                SELECT id, term, added_date, display_on_main, vote_count
-                FROM definitions
-                ORDER BY vote_count DESC
-            """)
-            print(f"\n{'ID':<5} {'Added':<12} {'Status':<10} {'Votes':<6} {'Term'}")
-            print("-" * 80)
-            for row in cursor.fetchall():
-                status = "ARCHIVED" if not row['display_on_main'] else "ACTIVE"
-                date = row['added_date'] if row['added_date'] else "Unknown"
-                print(f"{row['id']:<5} {date:<12} {status:<10} {row['vote_count']:<6} {row['term']}")
-        
-        elif item_type == 'overton':
-            cursor = conn.execute("""
-                SELECT id, term, first_detected_date, status, display_on_main, mention_count
-                FROM overton_terms
-                ORDER BY mention_count DESC
-            """)
-            print(f"\n{'ID':<5} {'First Seen':<12} {'Status':<12} {'Mentions':<9} {'Term'}")
-            print("-" * 80)
-            for row in cursor.fetchall():
-                status = row['status'].upper() if not row['display_on_main'] else "ACTIVE"
-                date = row['first_detected_date'] if row['first_detected_date'] else "Unknown"
-                print(f"{row['id']:<5} {date:<12} {status:<12} {row['mention_count']:<9} {row['term']}")
+        cursor = conn.execute(all_sql if show_archived else active_sql)
+        print(header)
+        print("-" * width)
+        for row in cursor.fetchall():
+            print(render(row))
 
 def archive_item(item_type: str, item_id: int, reason: str):
     """Archive an item."""
@@ -107,18 +116,25 @@ def show_stats():
         print("ARCHIVE STATISTICS")
         print("="*60)
         
-        for table, name in [('latest_insights', 'Insights'), 
-                           ('definitions', 'Definitions'), 
-                           ('overton_terms', 'Overton Terms')]:
-            cursor = conn.execute(f"""
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN display_on_main = 1 THEN 1 ELSE 0 END) as active,
-                    SUM(CASE WHEN display_on_main = 0 THEN 1 ELSE 0 END) as archived
-                FROM {table}
-            """)
-            row = cursor.fetchone()
-            print(f"\n{name}:")
+        # All three tables in one statement
+        rows = conn.execute("""
+            SELECT 'Insights' AS name, COUNT(*) AS total,
+                   SUM(CASE WHEN display_on_main = 1 THEN 1 ELSE 0 END) AS active,
+                   SUM(CASE WHEN display_on_main = 0 THEN 1 ELSE 0 END) AS archived
+            FROM latest_insights
+            UNION ALL
+            SELECT 'Definitions', COUNT(*),
+                   SUM(CASE WHEN display_on_main = 1 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN display_on_main = 0 THEN 1 ELSE 0 END)
+            FROM definitions
+            UNION ALL
+            SELECT 'Overton Terms', COUNT(*),
+                   SUM(CASE WHEN display_on_main = 1 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN display_on_main = 0 THEN 1 ELSE 0 END)
+            FROM overton_terms
+        """).fetchall()
+        for row in rows:
+            print(f"\n{row['name']}:")
             print(f"  Total: {row['total']}")
             print(f"  Active (main page): {row['active']}")
             print(f"  Archived: {row['archived']}")
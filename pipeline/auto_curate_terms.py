@@ -26,66 +26,70 @@ PROMOTE_MENTIONS_THRESHOLD = 6
 MIN_RELEVANCE_REVIEW = 40  # Flag for review if relevance >= 40 but < 70
 
 
-def analyze_term_quality(term_data):
-    """
-    Analyze term quality for auto-curation.
-    Returns: ('auto_promote', 'manual_review', or 'skip')
-    """
-    relevance = term_data.get('relevance_score', 0) or 0
-    sources = term_data.get('source_diversity', 0) or 0
-    mentions = term_data.get('mention_count', 0) or 0
-    
-    # Hard rule: once a term has been mentioned enough times, always promote it.
-    if mentions >= PROMOTE_MENTIONS_THRESHOLD:
-        return 'auto_promote'
-    
-    # Otherwise, use relevance + source diversity rules for early promotion
-    if relevance >= MIN_RELEVANCE_AUTO and sources >= MIN_SOURCES_AUTO and mentions >= MIN_MENTIONS_AUTO:
-        return 'auto_promote'
-    
-    # Borderline = manual review
-    if relevance >= MIN_RELEVANCE_REVIEW:
-        return 'manual_review'
-    
-    # Low quality = skip
-    return 'skip'
+# Term classification as a SQL expression, so the pending-terms query labels every row with
+# 'auto_promote', 'manual_review' or 'skip':
+#   - mentioned PROMOTE_MENTIONS_THRESHOLD+ times: always promote
+#   - high relevance, several sources and mentions: promote early
+#   - borderline relevance: manual review; anything else is skipped
+TERM_ACTION_SQL = """
+    CASE
+        WHEN COALESCE(mention_count, 0) >= :promote_mentions THEN 'auto_promote'
+        WHEN COALESCE(relevance_score, 0) >= :min_relevance_auto
+             AND COALESCE(source_diversity, 0) >= :min_sources_auto
+             AND COALESCE(mention_count, 0) >= :min_mentions_auto THEN 'auto_promote'
+        WHEN COALESCE(relevance_score, 0) >= :min_relevance_review THEN 'manual_review'
+        ELSE 'skip'
+    END
+"""
+TERM_ACTION_PARAMS = {
+    'promote_mentions': PROMOTE_MENTIONS_THRESHOLD,
+    'min_relevance_auto': MIN_RELEVANCE_AUTO,
+    'min_sources_auto': MIN_SOURCES_AUTO,
+    'min_mentions_auto': MIN_MENTIONS_AUTO,
+    'min_relevance_review': MIN_RELEVANCE_REVIEW,
+}
 
 
-def auto_promote_term(db, term_data):
-    """Promote a term to Definitions."""
+def auto_promote_terms(db, terms):
+    """Promote terms to Definitions in one transaction. Returns the number promoted."""
+    definition_rows = []
+    approval_rows = []
     with db._get_connection() as conn:
-        # Check if already in definitions
-        cursor = conn.execute(
-            "SELECT id FROM definitions WHERE term = ?",
-            (term_data['term'],)
-        )
-        if cursor.fetchone():
-            print(f"  ℹ️  '{term_data['term']}' already in definitions")
-            return False
+        # One lookup for every existing definition instead of a SELECT per term
+        existing = {row[0] for row in conn.execute("SELECT term FROM definitions")}
+        
+        for term_data in terms:
+            if term_data['term'] in existing:
+                print(f"  ℹ️  '{term_data['term']}' already in definitions")
+                continue
+            existing.add(term_data['term'])
+            
+            definition_rows.append((
+                term_data['term'],
+                term_data.get('definition') or f"Definition for {term_data['term']}",
+                term_data.get('investment_implications') or 'AI-curated from transcript analysis',
+                term_data.get('mention_count', 1)
+            ))
+            approval_rows.append(('Auto-approved: high relevance score', term_data['id']))
+            print(f"  ✅ AUTO-PROMOTED: '{term_data['term']}' (relevance: {term_data.get('relevance_score', 'N/A')})")
         
         # Add to definitions
-        conn.execute("""
+        conn.executemany("""
             INSERT INTO definitions 
             (term, definition, investment_implications, added_date, vote_count, display_on_main, display_order)
             VALUES (?, ?, ?, date('now'), ?, 1, 0)
-        """, (
-            term_data['term'],
-            term_data.get('definition') or f"Definition for {term_data['term']}",
-            term_data.get('investment_implications') or 'AI-curated from transcript analysis',
-            term_data.get('mention_count', 1)
-        ))
+        """, definition_rows)
         
         # Update suggested_terms status
-        conn.execute("""
+        conn.executemany("""
             UPDATE suggested_terms 
             SET status = 'approved', 
                 reviewed_at = CURRENT_TIMESTAMP, 
-                review_notes = 'Auto-approved: high relevance score'
+                review_notes = ?
             WHERE id = ?
-        """, (term_data['id'],))
-        
-        print(f"  ✅ AUTO-PROMOTED: '{term_data['term']}' (relevance: {term_data.get('relevance_score', 'N/A')})")
-        return True
+        """, approval_rows)
+    
+    return len(definition_rows)
 
 
 def get_borderline_terms_for_review(db):
@@ -119,13 +123,13 @@ def main():
     
     db = get_db()
     
-    # Get pending suggested terms
+    # Get pending suggested terms, classified by SQLite in the same scan
     with db._get_connection() as conn:
-        cursor = conn.execute("""
-            SELECT * FROM suggested_terms
+        cursor = conn.execute(f"""
+            SELECT *, {TERM_ACTION_SQL} AS action FROM suggested_terms
             WHERE status = 'pending'
             ORDER BY relevance_score DESC, mention_count DESC
-        """)
+        """, TERM_ACTION_PARAMS)
         pending_terms = [dict(row) for row in cursor.fetchall()]
     
     if not pending_terms:
@@ -135,22 +139,23 @@ def main():
     print(f"\n📊 Analyzing {len(pending_terms)} pending terms...")
     print("-"*60)
     
-    promoted = 0
+    to_promote = []
     review_queue = []
     skipped = 0
     
     for term in pending_terms:
-        action = analyze_term_quality(term)
+        action = term.pop('action')
         
         if action == 'auto_promote':
-            if auto_promote_term(db, term):
-                promoted += 1
+            to_promote.append(term)
         elif action == 'manual_review':
             review_queue.append(term)
         else:
             skipped += 1
             print(f"  ⏭️  SKIPPED: '{term['term']}' (relevance too low: {term.get('relevance_score', 'N/A')})")
     
+    promoted = auto_promote_terms(db, to_promote) if to_promote else 0
+    
     # Generate review summary
     print("\n" + "="*60)
     print("CURATION SUMMARY")
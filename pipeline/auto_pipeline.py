@@ -17,20 +17,74 @@ Usage:
 import sys
 import os
 import json
+import re
+import hashlib
 import subprocess
+import threading
+import email.header
+from email.utils import parsedate_to_datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from db_manager import get_db, DailyScore
+from keyword_matcher import KeywordMatcher
 from datetime import date
 
+# orjson parses the inbox newsletter files several times faster; fall back to stdlib json
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional: semantic LLM cache (reuse replies for paraphrased prompts)
+try:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
 WORKSPACE = Path.home() / ".openclaw/workspace"
 PIPELINE_DIR = WORKSPACE / "pipeline"
 SITE_DIR = WORKSPACE / "site"
 STATE_DIR = PIPELINE_DIR / "state"
 LOCK_FILE = STATE_DIR / "auto_pipeline.lock"
+LLM_CACHE_DIR = STATE_DIR / "llm_cache"  # parsed AI replies keyed by (model, prompt)
+# Semantic layer is opt-in: a hit reuses another issue's analysis, so only enable it deliberately
+SEMANTIC_CACHE_ENABLED = os.environ.get("LLMCACHE_SEMANTIC", "0") == "1"
+SEMANTIC_INDEX_FILE = LLM_CACHE_DIR / "semantic.faiss"
+SEMANTIC_ENTRIES_FILE = LLM_CACHE_DIR / "semantic_entries.jsonl"  # one line per index vector
+SEMANTIC_EMBED_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("LLMCACHE_SEMANTIC_THRESHOLD", "0.92"))
+SEMANTIC_SEARCH_K = 8  # neighbours checked for one from the same model and sender
+
+STEP_OUTPUT_TAIL_LINES = 200  # lines of each step's output kept for the log
+
+# Newsletter disruption keywords, matched with one compiled alternation
+DISRUPTION_KEYWORDS = [
+    'disruption', 'disruptive', 'paradigm shift', 'game changer',
+    'breakthrough', 'transformation', 'revolutionary', 'inflection point'
+]
+DISRUPTION_RE = re.compile('|'.join(map(re.escape, DISRUPTION_KEYWORDS)))
+
+# Newsletter cleanup for insight promotion, compiled once
+MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+IMAGE_JUNK_RE = re.compile(r'(?:View image|Follow image link|Caption):.*')
+BLANK_LINES_RE = re.compile(r'\n{3,}')
+SENDER_NAME_RE = re.compile(r'^(.+?)\s*<[^>]+>$')
+SENDER_HANDLE_RE = re.compile(r'^[a-z0-9_]+\d+$')
+FORWARD_PREFIX_RE = re.compile(r'^(Fw|Fwd|Re):\s*', re.IGNORECASE)
+
+# Episode sentiment keywords, matched together in one scan of summary + thesis
+BULLISH_WORDS = ['bullish', 'buy', 'long', 'upside', 'opportunity', 'growth', 'breakout', 'undervalued']
+BEARISH_WORDS = ['bearish', 'sell', 'short', 'downside', 'risk', 'collapse', 'overvalued', 'avoid']
+SENTIMENT_MATCHER = KeywordMatcher(BULLISH_WORDS + BEARISH_WORDS)
+BULLISH_WORD_SET = frozenset(BULLISH_WORDS)
 
 
 def _load_dotenv(env_path: Path) -> None:
@@ -51,6 +105,107 @@ def _load_dotenv(env_path: Path) -> None:
     except Exception:
         pass
 
+_semantic_cache = None  # (embedder, index, entries) once loaded, False if unavailable
+_semantic_lock = threading.Lock()
+
+def _load_semantic_cache():
+    """Load the embedding model plus the persisted FAISS index and its entries (once)."""
+    global _semantic_cache
+    if _semantic_cache is not None:
+        return _semantic_cache
+    _semantic_cache = False
+    if not (SEMANTIC_CACHE_ENABLED and SEMANTIC_CACHE_AVAILABLE):
+        return False
+    try:
+        embedder = SentenceTransformer(SEMANTIC_EMBED_MODEL)
+        entries = []
+        if SEMANTIC_ENTRIES_FILE.exists():
+            with open(SEMANTIC_ENTRIES_FILE, encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        index = faiss.read_index(str(SEMANTIC_INDEX_FILE)) if SEMANTIC_INDEX_FILE.exists() else None
+        if index is None or index.ntotal != len(entries):
+            # Missing or out of step with the entries file: rebuild from the stored bodies
+            index = faiss.IndexFlatIP(embedder.get_sentence_embedding_dimension())
+            if entries:
+                index.add(_embed(embedder, [e['body'] for e in entries]))
+        _semantic_cache = (embedder, index, entries)
+    except Exception as e:
+        print(f"  ⚠ Semantic LLM cache disabled: {e}")
+    return _semantic_cache
+
+def _embed(embedder, texts):
+    """L2-normalised float32 embeddings, so inner product == cosine similarity."""
+    return embedder.encode(texts, normalize_embeddings=True, convert_to_numpy=True).astype('float32')
+
+def _semantic_lookup(model_name: str, sender: str, subject: str, body: str):
+    """Return (cached_result, vector); cached_result is None unless a close enough body was seen.
+
+    Only another issue from the same sender with a different subject counts as a hit.
+    """
+    cache = _load_semantic_cache()
+    if not cache:
+        return None, None
+    embedder, index, entries = cache
+    vec = _embed(embedder, [body])
+    if index.ntotal:
+        scores, ids = index.search(vec, min(SEMANTIC_SEARCH_K, index.ntotal))
+        for score, i in zip(scores[0], ids[0]):
+            if score < SEMANTIC_CACHE_THRESHOLD:
+                break
+            entry = entries[i] if i >= 0 else None
+            if (entry and entry['model'] == model_name and entry['sender'] == sender
+                    and entry['subject'] != subject):
+                return entry['result'], vec
+    return None, vec
+
+def _semantic_store(model_name: str, sender: str, subject: str, body: str, vec, result) -> None:
+    """Append a reply to the entries file and the FAISS index (entries first, so a crash only forces a rebuild)."""
+    embedder, index, entries = _semantic_cache
+    entry = {'embedding_id': index.ntotal, 'model': model_name, 'sender': sender,
+             'subject': subject, 'body': body, 'result': result}
+    with open(SEMANTIC_ENTRIES_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    entries.append(entry)
+    index.add(vec)
+    tmp = SEMANTIC_INDEX_FILE.with_suffix(".tmp")
+    faiss.write_index(index, str(tmp))
+    os.replace(tmp, SEMANTIC_INDEX_FILE)
+
+def cached_llm_json(model_name: str, prompt: str, call, similar: tuple = None):
+    """
+    Return call()'s parsed JSON reply, reusing the stored reply for an identical (model, prompt).
+    similar: optional (sender, subject, body) for the opt-in semantic layer, which matches on the
+    body alone. A semantic hit comes from a different issue, so its 'title' is never reused.
+    """
+    key = hashlib.sha256(f"{model_name}\x00{prompt}".encode("utf-8")).hexdigest()
+    path = LLM_CACHE_DIR / f"{key}.json"
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    vec = None
+    if similar:
+        with _semantic_lock:
+            result, vec = _semantic_lookup(model_name, *similar)
+        if result is not None:
+            return {k: v for k, v in result.items() if k != 'title'}
+    result = call()
+    if vec is not None:
+        try:
+            LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with _semantic_lock:
+                _semantic_store(model_name, *similar, vec, result)
+        except Exception as e:
+            print(f"  ⚠ Could not update semantic LLM cache: {e}")
+    try:
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(result), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return result
+
 def acquire_lock(max_age_hours: int = 6) -> bool:
     """
     Prevent concurrent runs by using a simple lock file.
@@ -105,32 +260,69 @@ def send_notification(title: str, message: str, priority: int = 0):
             print(f"  iMessage failed: {e}")
 
 
-def run_script(name: str, script: str, timeout: int = 300, extra_args: list = None) -> bool:
-    """Run a pipeline script and return success. extra_args: optional list of CLI args (e.g. ['--queue-only'])."""
-    print(f"\n{'='*60}")
-    print(f"STEP: {name}")
-    print(f"{'='*60}")
+def _run_script_captured(name: str, script: str, timeout: int = 300, extra_args: list = None):
+    """Run a pipeline script without printing; return (success, report with output tail and status)."""
     cmd = [sys.executable, script]
     if extra_args:
         cmd.extend(extra_args)
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True, text=True,
-            cwd=PIPELINE_DIR, timeout=timeout
+        # Stream the step's output and keep only its tail; long steps (fetch/transcribe) print a lot
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+            cwd=PIPELINE_DIR
         )
-        print(result.stdout[-3000:] if len(result.stdout) > 3000 else result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr[-1000:])
-        ok = result.returncode == 0
-        print(f"{'✓' if ok else '✗'} {name} {'completed' if ok else 'failed'}")
-        return ok
-    except subprocess.TimeoutExpired:
-        print(f"✗ {name} timed out after {timeout}s")
-        return False
+        timed_out = threading.Event()
+        timer = threading.Timer(timeout, lambda: (timed_out.set(), proc.kill()))
+        timer.start()
+        tail = deque(maxlen=STEP_OUTPUT_TAIL_LINES)
+        try:
+            with proc.stdout:
+                tail.extend(proc.stdout)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+        output = ''.join(tail)
+        report = output[-3000:] if len(output) > 3000 else output
+        if timed_out.is_set():
+            return False, f"{report}\n✗ {name} timed out after {timeout}s"
+        ok = returncode == 0
+        return ok, f"{report}\n{'✓' if ok else '✗'} {name} {'completed' if ok else 'failed'}"
     except Exception as e:
-        print(f"✗ {name} error: {e}")
-        return False
+        return False, f"✗ {name} error: {e}"
+
+
+def _print_step_header(name: str) -> None:
+    print(f"\n{'='*60}")
+    print(f"STEP: {name}")
+    print(f"{'='*60}")
+
+
+def run_script(name: str, script: str, timeout: int = 300, extra_args: list = None) -> bool:
+    """Run a pipeline script and return success. extra_args: optional list of CLI args (e.g. ['--queue-only'])."""
+    _print_step_header(name)
+    ok, report = _run_script_captured(name, script, timeout, extra_args)
+    print(report)
+    return ok
+
+
+def run_script_chains(chains: list) -> list:
+    """
+    Run independent chains of pipeline scripts concurrently; steps within a chain run in order.
+    Each chain is a list of (name, script, timeout) specs. Reports are printed in spec order
+    once every chain has finished, so step logs don't interleave. Returns each step's success.
+    """
+    def run_chain(chain):
+        return [_run_script_captured(*spec) for spec in chain]
+
+    with ThreadPoolExecutor(max_workers=len(chains)) as executor:
+        chain_results = list(executor.map(run_chain, chains))
+    oks = []
+    for chain, results in zip(chains, chain_results):
+        for (name, *_), (ok, report) in zip(chain, results):
+            _print_step_header(name)
+            print(report)
+            oks.append(ok)
+    return oks
 
 
 def analyze_transcripts() -> int:
@@ -157,67 +349,94 @@ def import_newsletters() -> int:
     print("="*60)
     db = get_db()
     inbox_dir = PIPELINE_DIR / "inbox"
-    imported = 0
-
-    disruption_keywords = [
-        'disruption', 'disruptive', 'paradigm shift', 'game changer',
-        'breakthrough', 'transformation', 'revolutionary', 'inflection point'
-    ]
 
     from db_manager import TickerMention
 
-    for json_file in inbox_dir.glob("*.json"):
-        try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+    newsletter_sql = """
+        INSERT INTO newsletters (sender, subject, received_date,
+            content_preview, extracted_tickers, is_processed,
+            disruption_keywords_found, added_to_site)
+        VALUES (?, ?, ?, ?, ?, 1, ?, 0)
+    """
+    new_newsletters = []  # (newsletter row, its ticker mentions, display name) per inbox file
+    with db._get_connection() as conn:
+        # One lookup for every stored newsletter instead of a SELECT per file
+        existing = {tuple(row) for row in conn.execute("SELECT subject, sender FROM newsletters")}
+
+        for json_file in inbox_dir.glob("*.json"):
+            try:
+                data = json_loads(json_file.read_bytes())
 
-            sender = data.get('sender', 'Unknown')
-            subject = data.get('subject', '')
-            content = str(subject) + ' ' + str(data.get('content_preview', ''))
-            is_disruption = any(kw in content.lower() for kw in disruption_keywords)
+                sender = data.get('sender', 'Unknown')
+                subject = data.get('subject', '')
+                content = str(subject) + ' ' + str(data.get('content_preview', ''))
+                is_disruption = DISRUPTION_RE.search(content.lower()) is not None
 
-            # Insert into newsletters table directly
-            with db._get_connection() as conn:
                 # Check for duplicate
-                existing = conn.execute(
-                    "SELECT id FROM newsletters WHERE subject = ? AND sender = ?",
-                    (subject[:200], sender)
-                ).fetchone()
-                if existing:
+                key = (subject[:200], sender)
+                if key in existing:
                     print(f"  ⏭ Already in DB: {subject[:60]}")
                     continue
+                existing.add(key)
 
-                conn.execute("""
-                    INSERT INTO newsletters (sender, subject, received_date,
-                        content_preview, extracted_tickers, is_processed,
-                        disruption_keywords_found, added_to_site)
-                    VALUES (?, ?, ?, ?, ?, 1, ?, 0)
-                """, (
+                row = (
                     sender,
                     subject[:200],
                     data.get('date', str(datetime.now().date())),
                     data.get('content_preview', '')[:1000],
                     json.dumps(data.get('extracted_tickers', [])),
                     is_disruption
-                ))
-
-            # Add ticker mentions
-            for ticker in data.get('extracted_tickers', []):
-                mention = TickerMention(
-                    ticker=ticker,
-                    source_type='newsletter',
-                    source_name=sender,
-                    episode_title=subject[:100],
-                    context=data.get('content_preview', '')[:300],
-                    is_disruption_focused=is_disruption
                 )
-                db.add_ticker_mention(mention)
 
-            imported += 1
-            print(f"  ✓ Imported: {sender}: {subject[:60]}")
+                # Slice once; every mention from this newsletter shares the same context
+                mention_title = subject[:100]
+                mention_context = data.get('content_preview', '')[:300]
+                file_mentions = [
+                    TickerMention(
+                        ticker=ticker,
+                        source_type='newsletter',
+                        source_name=sender,
+                        episode_title=mention_title,
+                        context=mention_context,
+                        is_disruption_focused=is_disruption
+                    )
+                    for ticker in data.get('extracted_tickers', [])
+                ]
+                new_newsletters.append((row, file_mentions, f"{sender}: {subject[:60]}"))
+
+            except Exception as e:
+                print(f"  ✗ Error importing {json_file.name}: {e}")
 
-        except Exception as e:
-            print(f"  ✗ Error importing {json_file.name}: {e}")
+        # Newsletters and their ticker mentions go in together, in one transaction
+        try:
+            with db._savepoint(conn, "import_newsletters"):
+                conn.executemany(newsletter_sql, [entry[0] for entry in new_newsletters])
+            stored = new_newsletters
+        except Exception:
+            # One bad row rejects the batch; retry file by file so the rest still import
+            stored = []
+            for entry in new_newsletters:
+                try:
+                    with db._savepoint(conn, "import_newsletter"):
+                        conn.execute(newsletter_sql, entry[0])
+                    stored.append(entry)
+                except Exception as e:
+                    print(f"  ✗ Error importing {entry[2]}: {e}")
+
+        mentions = [mention for entry in stored for mention in entry[1]]
+        try:
+            db.add_ticker_mentions_bulk(mentions)
+        except Exception:
+            # The bulk insert is all-or-nothing; retry row by row so the rest still land
+            for mention in mentions:
+                try:
+                    db.add_ticker_mention(mention)
+                except Exception as e:
+                    print(f"  ✗ Error adding newsletter mention {mention.ticker}: {e}")
+
+    for entry in stored:
+        print(f"  ✓ Imported: {entry[2]}")
+    imported = len(stored)
 
     print(f"✓ Total newsletters imported: {imported}")
     return imported
@@ -232,37 +451,31 @@ def aggregate_scores():
     today = date.today()
     top_tickers = db.get_top_tickers(date_filter=today, limit=30)
     
-    # Get all sentiment and timeframe data for today in one query
+    # Today's sentiment split and most common timeframe per ticker, in one query. The mention_date
+    # range (rather than date(mention_date) = ?) lets SQLite use idx_mentions_date.
     with db._get_connection() as conn:
         cursor = conn.execute("""
-            SELECT ticker, sentiment, COUNT(*) as count 
-            FROM ticker_mentions 
-            WHERE date(mention_date) = ?
-            GROUP BY ticker, sentiment
-        """, (today,))
-        sentiment_rows = cursor.fetchall()
-        
-        cursor = conn.execute("""
-            SELECT ticker, timeframe, COUNT(*) as count 
-            FROM ticker_mentions 
-            WHERE date(mention_date) = ?
-            GROUP BY ticker, timeframe
-        """, (today,))
-        timeframe_rows = cursor.fetchall()
-    
-    # Organize sentiment data by ticker
-    sentiment_by_ticker = {}
-    for r in sentiment_rows:
-        if r['ticker'] not in sentiment_by_ticker:
-            sentiment_by_ticker[r['ticker']] = {}
-        sentiment_by_ticker[r['ticker']][r['sentiment']] = r['count']
-    
-    # Organize timeframe data by ticker
-    timeframe_by_ticker = {}
-    for r in timeframe_rows:
-        if r['ticker'] not in timeframe_by_ticker:
-            timeframe_by_ticker[r['ticker']] = {}
-        timeframe_by_ticker[r['ticker']][r['timeframe']] = r['count']
+            WITH today_mentions AS (
+                SELECT ticker, sentiment, timeframe
+                FROM ticker_mentions
+                WHERE mention_date >= ? AND mention_date < ?
+            ),
+            timeframes AS (
+                SELECT ticker, timeframe,
+                       ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY COUNT(*) DESC, timeframe) AS pick
+                FROM today_mentions
+                GROUP BY ticker, timeframe
+            )
+            SELECT m.ticker,
+                   SUM(CASE WHEN m.sentiment = 'bullish' THEN 1 ELSE 0 END) AS bullish,
+                   SUM(CASE WHEN m.sentiment = 'bearish' THEN 1 ELSE 0 END) AS bearish,
+                   COUNT(*) AS total,
+                   t.timeframe
+            FROM today_mentions m
+            JOIN timeframes t ON t.ticker = m.ticker AND t.pick = 1
+            GROUP BY m.ticker
+        """, (str(today), str(today + timedelta(days=1))))
+        mentions_by_ticker = {r['ticker']: r for r in cursor.fetchall()}
     
     scores = []
     for i, row in enumerate(top_tickers, 1):
@@ -276,10 +489,10 @@ def aggregate_scores():
             conviction_level = 'low'
         
         # Get sentiment distribution for contrarian signal calculation
-        sentiment_counts = sentiment_by_ticker.get(row['ticker'], {})
-        bullish = sentiment_counts.get('bullish', 0)
-        bearish = sentiment_counts.get('bearish', 0)
-        total = sum(sentiment_counts.values())
+        mentions = mentions_by_ticker.get(row['ticker'])
+        bullish = mentions['bullish'] if mentions else 0
+        bearish = mentions['bearish'] if mentions else 0
+        total = mentions['total'] if mentions else 0
         
         # Determine contrarian signal
         if total >= 3 and bearish > bullish:
@@ -289,14 +502,8 @@ def aggregate_scores():
         else:
             contrarian_signal = 'neutral'
         
-        # Calculate timeframe - use most common timeframe
-        timeframe_counts = timeframe_by_ticker.get(row['ticker'], {})
-        if timeframe_counts:
-            # Sort by count descending and pick most common
-            most_common = max(timeframe_counts.items(), key=lambda x: x[1])
-            timeframe = most_common[0] if most_common[0] else 'unspecified'
-        else:
-            timeframe = 'unspecified'
+        # Calculate timeframe - use most common timeframe (picked in the query above)
+        timeframe = (mentions['timeframe'] if mentions else None) or 'unspecified'
         
         score = DailyScore(
             ticker=row['ticker'],
@@ -331,19 +538,18 @@ def promote_episodes_to_insights() -> int:
     promoted = 0
 
     with db._get_connection() as conn:
-        # Find processed episodes not yet in latest_insights
+        # Find processed episodes not yet in latest_insights (anti-join on idx_insights_episode)
         cursor = conn.execute("""
             SELECT pe.id, pe.podcast_name, pe.episode_title, pe.episode_date,
                    pe.summary, pe.key_takeaways, pe.key_tickers, pe.investment_thesis
             FROM podcast_episodes pe
-            WHERE pe.is_processed = 1
-              AND pe.id NOT IN (
-                  SELECT podcast_episode_id FROM latest_insights
-                  WHERE podcast_episode_id IS NOT NULL
-              )
+            LEFT JOIN latest_insights li ON li.podcast_episode_id = pe.id
+            WHERE pe.is_processed = 1 AND li.id IS NULL
             ORDER BY pe.episode_date DESC, pe.id DESC
         """)
         episodes = cursor.fetchall()
+        # Titles already on the site, for the duplicate guard below
+        existing_titles = {row[0] for row in conn.execute("SELECT title FROM latest_insights")}
 
     print(f"Found {len(episodes)} processed episodes not yet in insights")
 
@@ -365,10 +571,9 @@ def promote_episodes_to_insights() -> int:
 
         # Infer sentiment from summary/thesis keywords
         text = ((ep['summary'] or '') + ' ' + (ep['investment_thesis'] or '')).lower()
-        bullish_words = ['bullish', 'buy', 'long', 'upside', 'opportunity', 'growth', 'breakout', 'undervalued']
-        bearish_words = ['bearish', 'sell', 'short', 'downside', 'risk', 'collapse', 'overvalued', 'avoid']
-        bull_score = sum(1 for w in bullish_words if w in text)
-        bear_score = sum(1 for w in bearish_words if w in text)
+        hits = SENTIMENT_MATCHER.found(text)
+        bull_score = sum(1 for w in hits if w in BULLISH_WORD_SET)
+        bear_score = len(hits) - bull_score
         sentiment = 'bullish' if bull_score > bear_score else ('bearish' if bear_score > bull_score else 'neutral')
 
         # Use episode_date as source_date only if it looks recent (within 2 years).
@@ -383,16 +588,12 @@ def promote_episodes_to_insights() -> int:
         except Exception:
             source_date = str(date.today())
 
-        with db._get_connection() as conn:
-            # Final duplicate guard: skip if title already exists
-            existing = conn.execute(
-                "SELECT id FROM latest_insights WHERE title = ?",
-                (ep['episode_title'],)
-            ).fetchone()
-            if existing:
-                print(f"  ⏭ Insight already exists: '{ep['episode_title'][:60]}'")
-                continue
+        # Final duplicate guard: skip if title already exists
+        if ep['episode_title'] in existing_titles:
+            print(f"  ⏭ Insight already exists: '{ep['episode_title'][:60]}'")
+            continue
 
+        with db._get_connection() as conn:
             conn.execute("""
                 INSERT INTO latest_insights
                     (title, source_type, source_name, source_date, summary,
@@ -410,6 +611,7 @@ def promote_episodes_to_insights() -> int:
                 str(date.today()),
                 ep['id']
             ))
+            existing_titles.add(ep['episode_title'])
             promoted += 1
             print(f"  ✓ Promoted: '{ep['episode_title'][:60]}' (sentiment={sentiment})")
 
@@ -466,8 +668,15 @@ def promote_newsletters_to_insights() -> int:
         print(f"  ✗ Could not get AI client: {e}")
         client_info = None
 
-    # Load full content from inbox JSON files
+    # Load full content from inbox JSON files, parsed once for every row below: (subject, content)
     inbox_dir = PIPELINE_DIR / "inbox"
+    inbox_newsletters = []
+    for jf in inbox_dir.glob("*.json"):
+        try:
+            d = json_loads(jf.read_bytes())
+            inbox_newsletters.append((d.get('subject', ''), d.get('content', d.get('content_preview', ''))))
+        except Exception:
+            pass
 
     for row in rows:
         nl_id, sender, subject, received_date, content_preview = row
@@ -480,7 +689,6 @@ def promote_newsletters_to_insights() -> int:
 
         # Decode subject first
         try:
-            import email.header
             decoded = email.header.decode_header(subject)
             subject_clean = ''.join(
                 part.decode(enc or 'utf-8') if isinstance(part, bytes) else part
@@ -492,15 +700,14 @@ def promote_newsletters_to_insights() -> int:
         # Clean sender → human-readable publication name
         # "The Rundown AI <news@daily.therundown.ai>" → "The Rundown AI"
         # "gandolf2026 <gandolf2026@proton.me>" → use subject as publication hint
-        import re as _re
         sender_name = sender
-        m = _re.match(r'^(.+?)\s*<[^>]+>$', sender.strip())
+        m = SENDER_NAME_RE.match(sender.strip())
         if m:
             sender_name = m.group(1).strip().strip('"')
         # If sender_name looks like an email username/handle (no spaces, ends in digits),
         # fall back to subject line as publication name (strip Fw:/Re: prefixes first)
-        if not sender_name or '@' in sender_name or _re.match(r'^[a-z0-9_]+\d+$', sender_name.lower()):
-            subj_clean = _re.sub(r'^(Fw|Fwd|Re):\s*', '', subject_clean, flags=_re.IGNORECASE).strip()
+        if not sender_name or '@' in sender_name or SENDER_HANDLE_RE.match(sender_name.lower()):
+            subj_clean = FORWARD_PREFIX_RE.sub('', subject_clean).strip()
             if ':' in subj_clean:
                 sender_name = subj_clean.split(':')[0].strip()[:50]
             else:
@@ -508,22 +715,15 @@ def promote_newsletters_to_insights() -> int:
 
         # Find matching inbox JSON for full content
         full_content = row.get('content_preview', '')
-        for jf in inbox_dir.glob("*.json"):
-            try:
-                d = json.load(open(jf))
-                if d.get('subject', '') == subject or subject_clean in d.get('subject', ''):
-                    full_content = d.get('content', d.get('content_preview', ''))
-                    break
-            except Exception:
-                pass
+        for inbox_subject, inbox_content in inbox_newsletters:
+            if inbox_subject == subject or subject_clean in inbox_subject:
+                full_content = inbox_content
+                break
 
         # Strip markdown links/images to get readable text
-        import re
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', full_content)
-        text = re.sub(r'View image:.*', '', text)
-        text = re.sub(r'Follow image link:.*', '', text)
-        text = re.sub(r'Caption:.*', '', text)
-        text = re.sub(r'\n{3,}', '\n\n', text).strip()
+        text = MD_LINK_RE.sub(r'\1', full_content)
+        text = IMAGE_JUNK_RE.sub('', text)
+        text = BLANK_LINES_RE.sub('\n\n', text).strip()
 
         if len(text) < 100:
             print(f"  ⏭ Skipping '{subject_clean[:50]}' — content too short")
@@ -552,20 +752,21 @@ Return JSON with:
 - "sentiment": "bullish", "bearish", or "neutral"
 """
                 client_type, client = client_info
+                similar = (sender, subject_clean, text[:3000])  # semantic cache matches on the body
                 if client_type in ('openai', 'moonshot'):
                     model_name = "moonshot-v1-8k" if client_type == 'moonshot' else "gpt-4o-mini"
-                    resp = client.chat.completions.create(
-                        model=model_name,
-                        messages=[{"role": "user", "content": prompt}],
-                        response_format={"type": "json_object"},
-                        max_tokens=400
-                    )
-                    result = json.loads(resp.choices[0].message.content)
+                    result = cached_llm_json(model_name, prompt, lambda: json.loads(
+                        client.chat.completions.create(
+                            model=model_name,
+                            messages=[{"role": "user", "content": prompt}],
+                            response_format={"type": "json_object"},
+                            max_tokens=400
+                        ).choices[0].message.content
+                    ), similar)
                 elif client_type == 'gemini':
-                    import google.generativeai as genai
-                    model = genai.GenerativeModel('gemini-1.5-flash')
-                    resp = model.generate_content(prompt)
-                    result = json.loads(resp.text)
+                    model_name = getattr(client, 'model_name', 'gemini')
+                    result = cached_llm_json(model_name, prompt,
+                                             lambda: json.loads(client.generate_content(prompt).text), similar)
                 else:
                     result = {}
 
@@ -582,7 +783,6 @@ Return JSON with:
 
         # Parse received_date for source_date
         try:
-            from email.utils import parsedate_to_datetime
             source_date = parsedate_to_datetime(received_date).strftime('%Y-%m-%d')
         except Exception:
             source_date = str(date.today())
@@ -795,10 +995,13 @@ def main():
         # Generate Deep Dives for any insights that don't have one (so site always has full content)
         run_script("Generate Deep Dives", "generate_deepdives.py", timeout=900)
 
-        run_script("Fetch Prices", "fetch_prices.py", timeout=120)
-        # Generate 2-week charts and price data for the website
-        run_script("Generate Charts", "generate_charts.py", timeout=600)
-        run_script("Auto-Curate Terms", "auto_curate_terms.py", timeout=60)
+        # Prices, then 2-week charts (both write site/price_data.json, so they stay in order),
+        # alongside term curation, which only touches the database
+        run_script_chains([
+            [("Fetch Prices", "fetch_prices.py", 120),
+             ("Generate Charts", "generate_charts.py", 600)],
+            [("Auto-Curate Terms", "auto_curate_terms.py", 60)],
+        ])
 
         export_website()
 
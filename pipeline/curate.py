@@ -7,8 +7,13 @@ only transcribes investment-relevant content.
 import xml.etree.ElementTree as ET
 import urllib.request
 import json
+import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
+from email.utils import parsedate_to_datetime
+
+sys.path.insert(0, str(Path(__file__).parent))
+from keyword_matcher import KeywordMatcher
 
 # Config
 AUDIO_DIR = Path.home() / ".openclaw/workspace/audio"
@@ -40,6 +45,9 @@ EXCLUDE_KEYWORDS = [
     'sports', 'football', 'basketball', 'baseball'
 ]
 
+INVESTMENT_MATCHER = KeywordMatcher(INVESTMENT_KEYWORDS)
+EXCLUDE_MATCHER = KeywordMatcher(EXCLUDE_KEYWORDS)
+
 def load_feeds():
     """Load podcast feed URLs from file."""
     feeds = []
@@ -69,6 +77,7 @@ def fetch_feed_metadata(feed_url):
                 podcast_title = title_elem.text
         
         episodes = []
+        today = date.today()  # once per feed, not per episode
         
         # Find all items (episodes)
         for item in root.findall('.//item'):
@@ -101,19 +110,17 @@ def fetch_feed_metadata(feed_url):
             if title and enclosure_url:
                 # Parse pub date
                 pub_date_iso = None
+                pub_day = None
                 if pub_date:
                     try:
-                        from email.utils import parsedate_to_datetime
-                        pub_date_iso = parsedate_to_datetime(pub_date).strftime('%Y-%m-%d')
+                        pub_day = parsedate_to_datetime(pub_date).date()
+                        pub_date_iso = pub_day.isoformat()
                     except Exception:
                         pass
 
                 # Skip episodes older than 2 days
-                if pub_date_iso:
-                    from datetime import date
-                    age_days = (date.today() - date.fromisoformat(pub_date_iso)).days
-                    if age_days > 2:
-                        continue
+                if pub_day is not None and (today - pub_day).days > 2:
+                    continue
 
                 # Skip if rss_guid already in DB
                 guid_el = item.find('guid')
@@ -152,18 +159,12 @@ def score_episode_relevance(episode):
     full_text = f"{episode['title']} {episode['description']}".lower()
     
     # Check for exclusion keywords first
-    for keyword in EXCLUDE_KEYWORDS:
-        if keyword in full_text:
-            return -1  # Exclude this episode
+    if EXCLUDE_MATCHER.found(full_text):
+        return -1  # Exclude this episode
     
     # Count investment keywords
-    score = 0
-    matched_keywords = []
-    
-    for keyword in INVESTMENT_KEYWORDS:
-        if keyword in full_text:
-            score += 1
-            matched_keywords.append(keyword)
+    matched_keywords = INVESTMENT_MATCHER.found(full_text)
+    score = len(matched_keywords)
     
     return score, matched_keywords
 
@@ -11,11 +11,36 @@ from datetime import datetime, date
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from contextlib import contextmanager
+import threading
+import weakref
 
 # Database path
 DB_PATH = Path.home() / ".openclaw/workspace/pipeline/dashboard.db"
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# Mention weights (base score x source weight), folded into one factor each
+PODCAST_MENTION_WEIGHT = 40.0        # base 20 x 2.0
+DISRUPTION_NEWSLETTER_WEIGHT = 15.0  # base 10 x 1.5
+NEWSLETTER_MENTION_WEIGHT = 5.0      # base 10 x 0.5
+
+# Indexes behind the archive listings (active rows in display order); also in schema.sql
+LISTING_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_insights_active_date ON latest_insights(display_on_main, source_date DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_insights_episode ON latest_insights(podcast_episode_id)",
+    "CREATE INDEX IF NOT EXISTS idx_definitions_active_votes ON definitions(display_on_main, vote_count DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_overton_active_mentions ON overton_terms(display_on_main, mention_count DESC)",
+)
+
+def mention_weighted_score(source_type: str, is_disruption_focused: bool, conviction_score: int) -> float:
+    """Weighted score stored with a mention, scaled up by its conviction."""
+    if source_type == 'podcast':
+        weight = PODCAST_MENTION_WEIGHT
+    elif is_disruption_focused:
+        weight = DISRUPTION_NEWSLETTER_WEIGHT
+    else:
+        weight = NEWSLETTER_MENTION_WEIGHT
+    return weight * (1.0 + conviction_score / 100.0)
+
 @dataclass
 class TickerMention:
     ticker: str
@@ -57,24 +82,87 @@ class DailyScore:
     hidden_plays: Optional[Dict] = None
     rank: int = 0
 
+# Per-connection tuning, applied once when a connection is opened
+CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+"""
+
+class _ThreadConnections(dict):
+    """One thread's open connections: {db_path: [connection, nesting depth]}.
+    
+    It lives only in that thread's DashboardDB._local, which is dropped when the
+    thread exits, so connections opened by pool threads close with their pool
+    (weakref.finalize also closes whatever is still open at interpreter exit).
+    """
+    
+    def add(self, db_path, conn: sqlite3.Connection) -> list:
+        weakref.finalize(self, conn.close)
+        entry = self[db_path] = [conn, 0]
+        return entry
+
+
 class DashboardDB:
+    # Database files already switched to WAL and indexed by this process
+    _prepared_paths = set()
+    # Open connections per thread, see _ThreadConnections
+    _local = threading.local()
+    
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
         self._init_db()
+        self._prepare_db()
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and tune a connection that this thread keeps until it exits."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(CONNECTION_PRAGMAS)  # synchronous=NORMAL is safe with WAL
+        return conn
     
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Context manager for database connections.
+        
+        Each thread reuses one open connection per database file. The outermost
+        block commits on success and rolls back on error; nested blocks join it.
+        """
+        conns = getattr(self._local, 'conns', None)
+        if conns is None:
+            conns = self._local.conns = _ThreadConnections()
+        entry = conns.get(self.db_path)
+        if entry is None:
+            entry = conns.add(self.db_path, self._open_connection())
+        conn = entry[0]
+        entry[1] += 1
         try:
             yield conn
-            conn.commit()
+            if entry[1] == 1:
+                conn.commit()
         except Exception as e:
-            conn.rollback()
+            if entry[1] == 1:
+                conn.rollback()
             raise e
         finally:
-            conn.close()
+            entry[1] -= 1
+    
+    @staticmethod
+    @contextmanager
+    def _savepoint(conn: sqlite3.Connection, name: str):
+        """Make a block all-or-nothing even when nested in another _get_connection block
+        (nested blocks join the outer transaction and never roll back on their own)."""
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield conn
+        except Exception:
+            conn.execute(f"ROLLBACK TO {name}")
+            conn.execute(f"RELEASE {name}")
+            raise
+        conn.execute(f"RELEASE {name}")
     
     def _init_db(self):
         """Initialize database with schema if it doesn't exist."""
@@ -84,6 +172,20 @@ class DashboardDB:
                     conn.executescript(f.read())
                 print(f"✓ Initialized database at {self.db_path}")
     
+    def _prepare_db(self):
+        """Switch to WAL (readers no longer block on the curator's writes) and add the listing
+        indexes to databases created before they were in the schema."""
+        if self.db_path in DashboardDB._prepared_paths:
+            return
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in LISTING_INDEXES:
+                try:
+                    conn.execute(statement)
+                except sqlite3.OperationalError:
+                    pass
+        DashboardDB._prepared_paths.add(self.db_path)
+    
     # === Ticker Aliases ===
 
     def resolve_ticker(self, raw: str) -> str:
@@ -93,10 +195,15 @@ class DashboardDB:
         canonical ticker if found, otherwise returns the original uppercased.
         """
         with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT ticker FROM ticker_aliases WHERE alias = ?",
-                (raw.lower().strip(),)
-            ).fetchone()
+            return self._resolve_ticker(conn, raw)
+
+    @staticmethod
+    def _resolve_ticker(conn: sqlite3.Connection, raw: str) -> str:
+        """resolve_ticker() on an already-open connection."""
+        row = conn.execute(
+            "SELECT ticker FROM ticker_aliases WHERE alias = ?",
+            (raw.lower().strip(),)
+        ).fetchone()
         if row:
             return row["ticker"]
         return raw.upper().strip()
@@ -129,10 +236,9 @@ class DashboardDB:
         mention.ticker = self.resolve_ticker(mention.ticker)
 
         # Calculate weighted score at insert time
-        base = 20.0 if mention.source_type == 'podcast' else 10.0
-        weight = 2.0 if mention.source_type == 'podcast' else (1.5 if mention.is_disruption_focused else 0.5)
-        conviction_mult = 1.0 + (mention.conviction_score / 100.0)
-        weighted = base * weight * conviction_mult
+        weighted = mention_weighted_score(
+            mention.source_type, mention.is_disruption_focused, mention.conviction_score
+        )
 
         with self._get_connection() as conn:
             cursor = conn.execute("""
@@ -149,6 +255,33 @@ class DashboardDB:
             ))
             return cursor.lastrowid
     
+    def add_ticker_mentions_bulk(self, mentions: List[TickerMention]) -> int:
+        """Add many ticker mentions in one transaction and return how many were stored."""
+        if not mentions:
+            return 0
+
+        with self._get_connection() as conn, self._savepoint(conn, "ticker_mentions_bulk"):
+            rows = []
+            for mention in mentions:
+                mention.ticker = self._resolve_ticker(conn, mention.ticker)
+                rows.append((
+                    mention.ticker, mention.source_type, mention.source_name,
+                    mention.episode_title, mention.context, mention.conviction_score,
+                    mention.sentiment, mention.timeframe, mention.is_contrarian,
+                    mention.is_disruption_focused,
+                    mention_weighted_score(
+                        mention.source_type, mention.is_disruption_focused, mention.conviction_score
+                    )
+                ))
+            conn.executemany("""
+                INSERT INTO ticker_mentions 
+                (ticker, source_type, source_name, episode_title, context,
+                 conviction_score, sentiment, timeframe, is_contrarian, is_disruption_focused,
+                 weighted_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        return len(rows)
+    
     def get_ticker_mentions(self, ticker: str, days: int = 30) -> List[Dict]:
         """Get all mentions for a ticker in the last N days."""
         with self._get_connection() as conn:
@@ -239,25 +372,72 @@ class DashboardDB:
                 UPDATE podcast_episodes SET added_to_site = 1 WHERE id = ?
             """, (episode_id,))
     
+    # === Pending AI Batches ===
+    
+    def _ensure_pending_batches(self, conn):
+        """Create pending_batches on databases initialized before it was added to the schema."""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS pending_batches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                batch_id TEXT NOT NULL UNIQUE,
+                provider TEXT NOT NULL,
+                transcript_paths TEXT NOT NULL,
+                status TEXT DEFAULT 'submitted',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                completed_at TIMESTAMP
+            )
+        """)
+    
+    def add_pending_batch(self, batch_id: str, provider: str, transcript_paths: Dict[str, str]):
+        """Record a submitted batch and the transcript behind each request id."""
+        with self._get_connection() as conn:
+            self._ensure_pending_batches(conn)
+            conn.execute("""
+                INSERT INTO pending_batches (batch_id, provider, transcript_paths)
+                VALUES (?, ?, ?)
+            """, (batch_id, provider, json.dumps(transcript_paths)))
+    
+    def get_pending_batches(self) -> List[Dict]:
+        """Batches that have been submitted but not yet collected."""
+        with self._get_connection() as conn:
+            self._ensure_pending_batches(conn)
+            cursor = conn.execute("""
+                SELECT * FROM pending_batches WHERE status = 'submitted' ORDER BY created_at
+            """)
+            results = []
+            for row in cursor.fetchall():
+                result = dict(row)
+                result['transcript_paths'] = json.loads(result['transcript_paths'])
+                results.append(result)
+            return results
+    
+    def finish_pending_batch(self, batch_id: str, status: str):
+        """Close out a batch (completed, failed, expired, cancelled)."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                UPDATE pending_batches SET status = ?, completed_at = CURRENT_TIMESTAMP
+                WHERE batch_id = ?
+            """, (status, batch_id))
+    
     # === Daily Scores ===
     
     def save_daily_scores(self, scores: List[DailyScore]):
-        """Save daily aggregated scores."""
+        """Save daily aggregated scores (one executemany in one transaction)."""
         with self._get_connection() as conn:
-            for score in scores:
-                conn.execute("""
-                    INSERT OR REPLACE INTO daily_scores
-                    (ticker, date, total_score, podcast_mentions, newsletter_mentions,
-                     disruption_signals, unique_sources, conviction_level,
-                     contrarian_signal, timeframe, hidden_plays, rank)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (score.ticker, score.date, score.total_score,
-                      score.podcast_mentions, score.newsletter_mentions,
-                      score.disruption_signals, score.unique_sources,
-                      score.conviction_level, score.contrarian_signal,
-                      score.timeframe,
-                      json.dumps(score.hidden_plays) if score.hidden_plays else None,
-                      score.rank))
+            conn.executemany("""
+                INSERT OR REPLACE INTO daily_scores
+                (ticker, date, total_score, podcast_mentions, newsletter_mentions,
+                 disruption_signals, unique_sources, conviction_level,
+                 contrarian_signal, timeframe, hidden_plays, rank)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(score.ticker, score.date, score.total_score,
+                   score.podcast_mentions, score.newsletter_mentions,
+                   score.disruption_signals, score.unique_sources,
+                   score.conviction_level, score.contrarian_signal,
+                   score.timeframe,
+                   json.dumps(score.hidden_plays) if score.hidden_plays else None,
+                   score.rank)
+                  for score in scores])
     
     def get_all_ticker_scores(self, limit: int = 50) -> List[Dict]:
         """Get all tickers ranked by total weighted score from all mentions."""
@@ -562,10 +742,15 @@ class DashboardDB:
             """)
             return [dict(row) for row in cursor.fetchall()]
 
+_default_db = None
+
 # Convenience function for quick access
 def get_db() -> DashboardDB:
-    """Get database instance."""
-    return DashboardDB()
+    """Get database instance (shared across the process)."""
+    global _default_db
+    if _default_db is None:
+        _default_db = DashboardDB()
+    return _default_db
 
 if __name__ == "__main__":
     # Test the database
@@ -4,11 +4,21 @@ Standalone data export script for website updates.
 Called by cron job for midday price refreshes.
 """
 
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
 import json
 
+# orjson encodes the data.js blobs several times faster; fall back to stdlib json
+try:
+    import orjson
+    def json_dump(obj, f):
+        f.write(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+except ImportError:
+    def json_dump(obj, f):
+        f.write(json.dumps(obj, separators=(',', ':')).encode())
+
 # Add pipeline directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 from db_manager import get_db
@@ -52,34 +62,30 @@ def generate_website_js():
     except FileNotFoundError:
         ticker_scores = []
     
-    # Generate data.js that the HTML can load
-    # Pre-serialize to avoid f-string issues
-    ticker_json = json.dumps(ticker_scores, indent=2)
-    archive_json = json.dumps(archive, indent=2)
-    main_json = json.dumps(main_content, indent=2)
-    deepdives_json = json.dumps(deepdives, indent=2)
-    suggested_json = json.dumps(suggested_terms, indent=2)
-    
-    js_content = f"""// Auto-generated data file
-// DO NOT EDIT MANUALLY
-
-const dashboardData = {{
-  generatedAt: "{datetime.now().isoformat()}",
-  tickerScores: {ticker_json},
-  archive: {archive_json},
-  mainContent: {main_json},
-  deepDives: {deepdives_json},
-  suggestedTerms: {suggested_json}
-}};
+    # Stream data.js section by section (compact JSON) instead of building it in memory
+    sections = [
+        ('tickerScores', ticker_scores),
+        ('archive', archive),
+        ('mainContent', main_content),
+        ('deepDives', deepdives),
+        ('suggestedTerms', suggested_terms),
+    ]
+    tmp = site_dir / 'data.js.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(b"// Auto-generated data file\n// DO NOT EDIT MANUALLY\n\nconst dashboardData = {\n")
+        f.write(f'  generatedAt: "{datetime.now().isoformat()}"'.encode())
+        for name, value in sections:
+            f.write(f",\n  {name}: ".encode())
+            json_dump(value, f)
+        f.write(b"""
+};
 
 // Export for use in other scripts
-if (typeof module !== 'undefined' && module.exports) {{
+if (typeof module !== 'undefined' && module.exports) {
   module.exports = dashboardData;
-}}
-"""
-    
-    with open(site_dir / 'data.js', 'w') as f:
-        f.write(js_content)
+}
+""")
+    os.replace(tmp, site_dir / 'data.js')
     
     total_archive = sum(len(v) for v in archive.values() if isinstance(v, list))
     print(f"✓ Generated data.js with {len(ticker_scores)} tickers, {total_archive} archive items, {len(deepdives)} deep dives, {len(suggested_terms)} suggested terms")
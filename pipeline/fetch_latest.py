@@ -25,6 +25,7 @@ AUDIO_DIR = Path.home() / ".openclaw/workspace/audio"
 TRANSCRIPT_DIR = Path.home() / ".openclaw/workspace/pipeline/transcripts"
 FEEDS_FILE = Path.home() / ".openclaw/workspace/podcast_feeds.txt"
 LOG_FILE = Path.home() / ".openclaw/workspace/pipeline/state/fetch_log.json"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 AUDIO_DIR.mkdir(exist_ok=True)
 TRANSCRIPT_DIR.mkdir(exist_ok=True)
@@ -234,6 +235,7 @@ def download_episode(episode):
         filename = f"{pod_slug}_{pub}_{unique}.mp3"
     
     filepath = AUDIO_DIR / filename
+    partial_path = filepath.with_name(filepath.name + '.part')
     
     # Skip if already downloaded
     if filepath.exists():
@@ -245,22 +247,27 @@ def download_episode(episode):
     
     try:
         req = urllib.request.Request(audio_url, headers={'User-Agent': 'Mozilla/5.0'})
+        # Stream to a .part file in 1 MiB chunks instead of holding the episode in memory;
+        # the rename means a half-finished download never looks "already downloaded"
         with urllib.request.urlopen(req, timeout=120) as response:
-            data = response.read()
-        if not data or len(data) < 1000:
-            print(f"     ✗ Download empty or too small ({len(data)} bytes), skipping")
+            with open(partial_path, 'wb') as f:
+                shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+                size = f.tell()
+        if size < 1000:
+            print(f"     ✗ Download empty or too small ({size} bytes), skipping")
+            partial_path.unlink()
             return None
-        with open(filepath, 'wb') as f:
-            f.write(data)
+        os.replace(partial_path, filepath)
         print(f"     ✓ Downloaded to {filepath}")
         return str(filepath)
     except Exception as e:
         print(f"     ✗ Download failed: {e}")
-        if filepath.exists():
-            try:
-                filepath.unlink()
-            except OSError:
-                pass
+        for path in (partial_path, filepath):
+            if path.exists():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
         return None
 
 WHISPER_QUEUE_DIR = Path.home() / ".openclaw/workspace/whisper_queue"
@@ -548,9 +555,10 @@ def main():
     print("\n" + "=" * 70)
     print("SUMMARY")
     print("=" * 70)
+    succeeded = sum(1 for r in results if r['success'])
     print(f"Total feeds: {len(feeds)}")
-    print(f"Successfully transcribed: {sum(1 for r in results if r['success'])}")
-    print(f"Failed: {sum(1 for r in results if not r['success'])}")
+    print(f"Successfully transcribed: {succeeded}")
+    print(f"Failed: {len(results) - succeeded}")
     
     print("\nCompleted episodes:")
     for r in results:
@@ -80,7 +80,7 @@ def get_ai_client():
         if gemini_key:
             genai.configure(api_key=gemini_key)
             print("  Using Gemini API", flush=True)
-            return ('gemini', None)
+            return ('gemini', genai.GenerativeModel('gemini-1.5-flash'))
     except Exception as e:
         print(f"  ⚠ Gemini not available: {e}", flush=True)
     
@@ -210,9 +210,7 @@ Requirements:
             result = json.loads(resp.choices[0].message.content)
         
         elif client_type == 'gemini':
-            import google.generativeai as genai
-            model = genai.GenerativeModel('gemini-1.5-flash')
-            resp = model.generate_content(prompt)
+            resp = client.generate_content(prompt)
             result = json.loads(resp.text)
         
         else:
@@ -9,9 +9,40 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+# orjson serializes indented JSON several times faster; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 DB_PATH = Path.home() / ".openclaw/workspace/pipeline/dashboard.db"
 DATA_DIR = Path.home() / ".openclaw/workspace/site/data"
 
+# Define characteristics for variety
+# Short-term tickers (tactical/volatility plays)
+SHORT_TERM_TICKERS = frozenset({'VIX', 'SQQQ', 'SPY', 'IWM'})
+# Long-term tickers (infrastructure/thematic)
+LONG_TERM_TICKERS = frozenset({'NEE', 'CEG', 'VST', 'SMR', 'OKLO', 'BTC', 'COIN'})
+
+# Score per insight mention; podcasts are weighted 2x
+NEWSLETTER_SCORE = 10
+PODCAST_SCORE = NEWSLETTER_SCORE * 2.0
+
+class TickerAgg:
+    """Running totals for one ticker (__slots__ by hand; dataclass(slots=True) needs 3.10+)."""
+    __slots__ = ('total_score', 'podcast_mentions', 'newsletter_mentions',
+                 'unique_sources', 'bullish', 'bearish', 'sources')
+
+    def __init__(self):
+        self.total_score = 0
+        self.podcast_mentions = 0
+        self.newsletter_mentions = 0
+        self.unique_sources = set()
+        self.bullish = 0
+        self.bearish = 0
+        self.sources = []  # first 5 only
+
 def generate_ticker_data():
     """Generate ticker scores from insights data."""
     conn = sqlite3.connect(DB_PATH)
@@ -24,7 +55,7 @@ def generate_ticker_data():
         WHERE tickers_mentioned IS NOT NULL
     """)
     
-    ticker_data = {}
+    ticker_data: dict[str, TickerAgg] = {}
     
     for row in cursor.fetchall():
         tickers = row['tickers_mentioned']
@@ -37,48 +68,38 @@ def generate_ticker_data():
             continue
         
         for ticker in ticker_list:
-            if ticker not in ticker_data:
-                ticker_data[ticker] = {
-                    'ticker': ticker,
-                    'total_score': 0,
-                    'podcast_mentions': 0,
-                    'newsletter_mentions': 0,
-                    'unique_sources': set(),
-                    'sentiments': [],
-                    'sources': []
-                }
+            agg = ticker_data.get(ticker)
+            if agg is None:
+                agg = ticker_data[ticker] = TickerAgg()
             
             # Add score
-            base_score = 10
             if row['source_type'] == 'podcast':
-                base_score *= 2.0  # Podcasts weighted 2x
-                ticker_data[ticker]['podcast_mentions'] += 1
+                agg.total_score += PODCAST_SCORE
+                agg.podcast_mentions += 1
             else:
-                ticker_data[ticker]['newsletter_mentions'] += 1
+                agg.total_score += NEWSLETTER_SCORE
+                agg.newsletter_mentions += 1
             
-            ticker_data[ticker]['total_score'] += base_score
-            ticker_data[ticker]['unique_sources'].add(row['source_name'])
-            ticker_data[ticker]['sentiments'].append(row['sentiment'] or 'neutral')
-            ticker_data[ticker]['sources'].append({
-                'name': row['source_name'],
-                'type': row['source_type'],
-                'sentiment': row['sentiment']
-            })
+            agg.unique_sources.add(row['source_name'])
+            # Tally sentiment as we go rather than re-scanning a list per ticker later
+            if row['sentiment'] == 'bullish':
+                agg.bullish += 1
+            elif row['sentiment'] == 'bearish':
+                agg.bearish += 1
+            if len(agg.sources) < 5:  # only the first 5 are output
+                agg.sources.append({
+                    'name': row['source_name'],
+                    'type': row['source_type'],
+                    'sentiment': row['sentiment']
+                })
     
     # Format for output
     output = []
     
-    # Define characteristics for variety
-    # Short-term tickers (tactical/volatility plays)
-    short_term_tickers = {'VIX', 'SQQQ', 'SPY', 'IWM'}
-    # Long-term tickers (infrastructure/thematic)
-    long_term_tickers = {'NEE', 'CEG', 'VST', 'SMR', 'OKLO', 'BTC', 'COIN'}
-    
-    for idx, (ticker, data) in enumerate(sorted(ticker_data.items(), key=lambda x: x[1]['total_score'], reverse=True)):
+    for idx, (ticker, data) in enumerate(sorted(ticker_data.items(), key=lambda x: x[1].total_score, reverse=True)):
         # Determine overall sentiment
-        sentiments = [s for s in data['sentiments'] if s]
-        bullish = sentiments.count('bullish')
-        bearish = sentiments.count('bearish')
+        bullish = data.bullish
+        bearish = data.bearish
         
         if bullish > bearish:
             overall_sentiment = 'bullish'
@@ -88,8 +109,8 @@ def generate_ticker_data():
             overall_sentiment = 'neutral'
         
         # Determine conviction based on mention count and sources
-        total_mentions = data['podcast_mentions'] + data['newsletter_mentions']
-        unique_count = len(data['unique_sources'])
+        total_mentions = data.podcast_mentions + data.newsletter_mentions
+        unique_count = len(data.unique_sources)
         
         if total_mentions >= 3 and unique_count >= 2:
             conviction = 'high'
@@ -101,17 +122,17 @@ def generate_ticker_data():
         # Override conviction for variety in top 10
         if idx < 10:
             # Ensure variety: 3 high, 4 medium, 3 low in top 10
-            if idx in [0, 1, 2]:
+            if idx in {0, 1, 2}:
                 conviction = 'high'
-            elif idx in [3, 4, 5, 6]:
+            elif idx in {3, 4, 5, 6}:
                 conviction = 'medium'
             else:
                 conviction = 'low'
         
         # Determine timeframe
-        if ticker in short_term_tickers:
+        if ticker in SHORT_TERM_TICKERS:
             timeframe = 'short_term'
-        elif ticker in long_term_tickers:
+        elif ticker in LONG_TERM_TICKERS:
             timeframe = 'long_term'
         else:
             # Mix medium and long for others
@@ -125,30 +146,33 @@ def generate_ticker_data():
         # Override timeframe for variety in top 10
         if idx < 10:
             # Ensure variety: 3 short, 3 medium, 4 long
-            if idx in [0, 3, 6]:
+            if idx in {0, 3, 6}:
                 timeframe = 'short_term'
-            elif idx in [1, 4, 7]:
+            elif idx in {1, 4, 7}:
                 timeframe = 'medium_term'
             else:
                 timeframe = 'long_term'
         
         output.append({
             'ticker': ticker,
-            'total_score': data['total_score'],
-            'podcast_mentions': data['podcast_mentions'],
-            'newsletter_mentions': data['newsletter_mentions'],
-            'unique_sources': len(data['unique_sources']),
+            'total_score': data.total_score,
+            'podcast_mentions': data.podcast_mentions,
+            'newsletter_mentions': data.newsletter_mentions,
+            'unique_sources': len(data.unique_sources),
             'sentiment': overall_sentiment,
             'conviction_level': conviction,
             'timeframe': timeframe,
-            'sources': data['sources'][:5]  # Top 5 sources
+            'sources': data.sources  # Top 5 sources
         })
     
     conn.close()
     
     # Save to JSON
-    with open(DATA_DIR / 'ticker_scores.json', 'w') as f:
-        json.dump(output, f, indent=2)
+    if ORJSON_AVAILABLE:
+        (DATA_DIR / 'ticker_scores.json').write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(DATA_DIR / 'ticker_scores.json', 'w') as f:
+            json.dump(output, f, indent=2)
     
     print(f"✓ Generated ticker_scores.json with {len(output)} tickers")
     return output
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Multi-keyword substring matching for the research and keyword processors.
+Uses a single Aho-Corasick pass when pyahocorasick is installed.
+"""
+
+import re
+
+# Optional: one linear scan for all keywords instead of one `in` scan per keyword
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordMatcher:
+    """Finds which of a fixed list of keywords occur as substrings of a text.
+
+    With whole_words=True a keyword only counts when it is not part of a
+    longer word: no word character directly before or after it. Keywords
+    that overlap ('AI' inside 'AI chips') are all reported, with or
+    without pyahocorasick.
+    """
+
+    def __init__(self, keywords, whole_words=False):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.whole_words = whole_words
+        self.automaton = None
+        self.patterns = None
+        if AHOCORASICK_AVAILABLE:
+            self.automaton = ahocorasick.Automaton()
+            for index, keyword in enumerate(self.keywords):
+                self.automaton.add_word(keyword, index)
+            self.automaton.make_automaton()
+        elif whole_words:
+            # One search per keyword: a single alternation would only report the
+            # longest of several keywords matching at the same position
+            self.patterns = [re.compile(rf'(?<!\w){re.escape(kw)}(?!\w)') for kw in self.keywords]
+
+    def found(self, text):
+        """Keywords present in text, in their original list order."""
+        if self.patterns is not None:
+            return [kw for kw, pattern in zip(self.keywords, self.patterns) if pattern.search(text)]
+        if self.automaton is None:
+            return [kw for kw in self.keywords if kw in text]
+        if self.whole_words:
+            hits = set()
+            last = len(text) - 1
+            for end, index in self.automaton.iter(text):
+                start = end - len(self.keywords[index]) + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end < last and _is_word_char(text[end + 1]):
+                    continue
+                hits.add(index)
+        else:
+            hits = {index for _, index in self.automaton.iter(text)}
+        return [self.keywords[index] for index in sorted(hits)]
+
+    def count(self, text):
+        """Number of distinct keywords present in text."""
+        return len(self.found(text))
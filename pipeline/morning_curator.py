@@ -5,6 +5,7 @@ Checks for new podcasts and sends iMessage for approval
 """
 
 import json
+import os
 import subprocess
 from pathlib import Path
 from datetime import datetime
@@ -131,12 +132,15 @@ def main():
         
         # Save pending state
         pending_file = STATE_DIR / "pending_approval.json"
-        with open(pending_file, 'w') as f:
+        tmp_file = pending_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
             json.dump({
                 'sent_at': datetime.now().isoformat(),
                 'episodes': episodes,
                 'expires_at': None  # Will be set by approval processor
             }, f, indent=2)
+        # Rename into place so the approval processor never reads a half-written file
+        os.replace(tmp_file, pending_file)
     else:
         print("✗ Failed to send iMessage")
 
@@ -5,7 +5,9 @@ Tracks episodes through: Downloaded → Transcribed → Analyzed → Published
 """
 
 import json
+import mmap
 import sqlite3
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -17,6 +19,7 @@ DB_PATH = Path.home() / ".openclaw/workspace/pipeline/dashboard.db"
 STATE_DIR = Path.home() / ".openclaw/workspace/pipeline/state"
 CURATION_LOG = STATE_DIR / "curation_log.json"
 STATUS_FILE = STATE_DIR / "pipeline_status.json"
+DATA_JS = Path.home() / ".openclaw/workspace/site/data/data.js"
 
 class PodcastPipelineTracker:
     """Track podcast episodes through the processing pipeline."""
@@ -31,6 +34,7 @@ class PodcastPipelineTracker:
     
     def __init__(self):
         self.status = self._load_status()
+        self._data_js = None  # read-only mmap of data.js, held for one scan
         
     def _load_status(self) -> Dict:
         """Load existing status or create new."""
@@ -56,9 +60,15 @@ class PodcastPipelineTracker:
         # 1. Get approved episodes from curation log
         approved_episodes = self._get_approved_episodes()
         
-        # 2. Check each episode's progress
-        for episode_id, episode_info in approved_episodes.items():
-            self._update_episode_status(episode_id, episode_info)
+        # 2. Check each episode's progress (data.js is mapped once for all episodes)
+        self._data_js = self._map_data_js()
+        try:
+            for episode_id, episode_info in approved_episodes.items():
+                self._update_episode_status(episode_id, episode_info)
+        finally:
+            if self._data_js is not None:
+                self._data_js.close()
+                self._data_js = None
         
         self._save_status()
         self._print_summary()
@@ -181,19 +191,22 @@ class PodcastPipelineTracker:
         
         conn.close()
     
+    def _map_data_js(self) -> Optional[mmap.mmap]:
+        """Memory-map data.js read-only, or None if it is missing or empty."""
+        try:
+            with open(DATA_JS, 'rb') as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+    
     def _check_published_status(self, ep_id: str, episode_info: Dict, status: Dict):
         """Check if episode is in the published data.js."""
-        data_js = Path.home() / ".openclaw/workspace/site/data/data.js"
-        
-        if not data_js.exists():
+        if self._data_js is None:
             status['stages']['published'] = {'complete': False}
             return
         
-        # Simple check - look for title in data.js
-        with open(data_js, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        title_found = episode_info['title'][:30] in content
+        # Simple check - look for title in data.js (searched as UTF-8 bytes, no decode)
+        title_found = self._data_js.find(episode_info['title'][:30].encode('utf-8')) != -1
         
         status['stages']['published'] = {
             'complete': title_found,
@@ -207,12 +220,12 @@ class PodcastPipelineTracker:
         print("="*80)
         
         # Count by stage
-        stage_counts = {stage: 0 for stage in self.STAGES}
-        
-        for ep_id, ep_data in self.status['episodes'].items():
-            for stage in self.STAGES:
-                if ep_data['stages'].get(stage, {}).get('complete'):
-                    stage_counts[stage] += 1
+        stage_counts = Counter(
+            stage
+            for ep_data in self.status['episodes'].values()
+            for stage in self.STAGES
+            if ep_data['stages'].get(stage, {}).get('complete')
+        )
         
         total = len(self.status['episodes'])
         
@@ -323,9 +336,11 @@ def main():
     STATE_DIR.mkdir(parents=True, exist_ok=True)
     report_file = STATE_DIR / "pipeline_report.txt"
     with open(report_file, 'w') as f:
-        f.write("Podcast Pipeline Report\n")
-        f.write(f"Generated: {datetime.now().isoformat()}\n\n")
-        f.write(json.dumps(tracker.status, indent=2))
+        f.write(''.join([
+            "Podcast Pipeline Report\n",
+            f"Generated: {datetime.now().isoformat()}\n\n",
+            json.dumps(tracker.status, indent=2),
+        ]))
     
     print(f"\n📄 Detailed report saved to: {report_file}")
 
@@ -5,11 +5,25 @@ Extracts concepts, maps supply chains, finds hidden plays.
 """
 
 import json
+import os
 import re
+import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+from keyword_matcher import KeywordMatcher
+
+# orjson parses/serializes several times faster; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Directories
 INBOX_DIR = Path.home() / ".openclaw/workspace/pipeline/inbox"
 TRANSCRIPT_DIR = Path.home() / ".openclaw/workspace/pipeline/transcripts"
@@ -17,6 +31,9 @@ RESEARCH_DIR = Path.home() / ".openclaw/workspace/pipeline/research"
 
 RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
 
+# Threads used to read inbox and transcript files
+LOAD_WORKERS = 16
+
 # Theme patterns to watch for
 THEME_PATTERNS = {
     "ai_disruption": [
@@ -47,6 +64,14 @@ THEME_PATTERNS = {
     ]
 }
 
+# One alternation per theme: a single search answers "does any pattern match?"
+THEME_REGEXES = {
+    theme: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+    for theme, patterns in THEME_PATTERNS.items()
+}
+
+EXPLICIT_TICKER_RE = re.compile(r'\$([A-Z]{1,5})\b')
+
 # Industry supply chain mapping
 SUPPLY_CHAIN = {
     "ai_chips": {
@@ -93,157 +118,220 @@ INDUSTRY_EXPOSURE = {
     "fuel": ["CVX", "XOM", "COP", "MPC", "VLO"],
 }
 
+# Map of company names to tickers
+COMPANY_MAP = {
+    "nvidia": "NVDA", "apple": "AAPL", "microsoft": "MSFT",
+    "google": "GOOGL", "alphabet": "GOOGL", "meta": "META",
+    "facebook": "META", "amazon": "AMZN", "tesla": "TSLA",
+    "netflix": "NFLX", "salesforce": "CRM", "oracle": "ORCL",
+    "snowflake": "SNOW", "palantir": "PLTR", "mongodb": "MDB",
+    "datadog": "DDOG", "cloudflare": "NET", "twilio": "TWLO",
+    "workday": "WDAY", "servicenow": "NOW", "vmware": "VMW",
+    "crowdstrike": "CRWD", "zscaler": "ZS", "okta": "OKTA",
+    "sentinelone": "S", "cisco": "CSCO", "juniper": "JNPR",
+    "arista": "ANET", "broadcom": "AVGO", "marvell": "MRVL",
+    "micron": "MU", "western digital": "WDC", "seagate": "STX",
+    "intel": "INTC", "amd": "AMD", "tsmc": "TSM",
+    "asml": "ASML", "applied materials": "AMAT", "lam research": "LRCX",
+    "kla": "KLAC", "texas instruments": "TXN", "qualcomm": "QCOM",
+    "analog devices": "ADI", "nxp": "NXPI", "on semi": "ON",
+    "microchip": "MCHP", "xilinx": "XLNX"
+}
+
+# Bottleneck keywords and the exposure category they point to
+BOTTLENECK_KEYWORDS = {
+    "power": "ai_power_demand",
+    "electricity": "ai_power_demand",
+    "energy": "ai_power_demand",
+    "cooling": "ai_cooling",
+    "water": "ai_cooling",
+    "network": "ai_networking",
+    "bandwidth": "ai_networking",
+    "lithography": "lithography",
+    "wafers": "lithography",
+    "memory": "memory"
+}
+
+# Bottleneck rows only keep a short snippet; the report links back via "source"
+BOTTLENECK_CONTEXT_CHARS = 80
+
+# Industries are matched by either "ai chips" or "ai_chips" spelling
+INDUSTRY_NAMES = {}
+for _industry in SUPPLY_CHAIN:
+    INDUSTRY_NAMES.setdefault(_industry.replace("_", " "), _industry)
+    INDUSTRY_NAMES.setdefault(_industry, _industry)
+
+COMPANY_MATCHER = KeywordMatcher(COMPANY_MAP)
+BOTTLENECK_MATCHER = KeywordMatcher(BOTTLENECK_KEYWORDS)
+INDUSTRY_MATCHER = KeywordMatcher(INDUSTRY_NAMES)
+
+def _iter_files(directory, suffix):
+    """Yield DirEntry objects for non-hidden files ending in suffix.
+    
+    Unlike Path.glob this needs no extra stat per file; DirEntry caches the type.
+    Dotfiles (e.g. macOS ._*.json resource forks) are skipped on purpose, though
+    Path.glob('*') would have matched them.
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(suffix) and not entry.name.startswith(".") and entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
+
+def _load_email(entry):
+    try:
+        with open(entry.path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        return {
+            "source": data.get("sender", "Unknown"),
+            "subject": data.get("subject", ""),
+            "content": data.get("content", ""),
+            "date": data.get("date", ""),
+            "type": "email"
+        }
+    except Exception as e:
+        print(f"Error loading {entry.path}: {e}")
+        return None
+
+def _load_transcript(entry, loaded_at):
+    stem = entry.name[:-len(".txt")]
+    try:
+        with open(entry.path, 'r') as f:
+            content = f.read()
+        return {
+            "source": stem,
+            "subject": f"Podcast: {stem}",
+            "content": content,
+            "date": loaded_at,
+            "type": "podcast"
+        }
+    except Exception as e:
+        print(f"Error loading {entry.path}: {e}")
+        return None
+
 def load_all_content():
     """Load all emails and transcripts."""
-    all_content = []
-    
-    # Load emails
-    for json_file in INBOX_DIR.glob("*.json"):
-        try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-                all_content.append({
-                    "source": data.get("sender", "Unknown"),
-                    "subject": data.get("subject", ""),
-                    "content": data.get("content", ""),
-                    "date": data.get("date", ""),
-                    "type": "email"
-                })
-        except Exception as e:
-            print(f"Error loading {json_file}: {e}")
-    
-    # Load transcripts
-    for txt_file in TRANSCRIPT_DIR.glob("*.txt"):
-        try:
-            with open(txt_file, 'r') as f:
-                content = f.read()
-                all_content.append({
-                    "source": txt_file.stem,
-                    "subject": f"Podcast: {txt_file.stem}",
-                    "content": content,
-                    "date": str(datetime.now()),
-                    "type": "podcast"
-                })
-        except Exception as e:
-            print(f"Error loading {txt_file}: {e}")
+    # Files are independent, so overlap the reads on a small thread pool
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+        emails = pool.map(_load_email, _iter_files(INBOX_DIR, ".json"))
+        loaded_at = str(datetime.now())  # transcripts have no date of their own; stamp them all once
+        transcripts = pool.map(lambda entry: _load_transcript(entry, loaded_at), _iter_files(TRANSCRIPT_DIR, ".txt"))
+        all_content = [item for item in emails if item is not None]
+        all_content += [item for item in transcripts if item is not None]
     
     return all_content
 
+def item_text(content_item):
+    """Lowercased subject + content, built once per item and cached on it."""
+    text = content_item.get("_text")
+    if text is None:
+        text = content_item["_text"] = f"{content_item['subject']} {content_item['content']}".lower()
+    return text
+
 def extract_themes(content_item):
-    """Extract themes from a content item."""
-    full_text = f"{content_item['subject']} {content_item['content']}".lower()
-    
-    themes_found = []
-    for theme_name, patterns in THEME_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                themes_found.append(theme_name)
-                break
+    """Extract themes from a content item (cached on the item after the first call)."""
+    themes_found = content_item.get("_themes")
+    if themes_found is not None:
+        return themes_found
+    
+    full_text = item_text(content_item)
+    themes_found = [
+        theme_name for theme_name, regex in THEME_REGEXES.items()
+        if regex.search(full_text)
+    ]
     
+    content_item["_themes"] = themes_found
     return themes_found
 
 def extract_explicit_tickers(text):
     """Extract explicit $TICKER mentions."""
-    pattern = r'\$([A-Z]{1,5})\b'
-    return list(set(re.findall(pattern, text)))
+    return list(set(EXPLICIT_TICKER_RE.findall(text)))
 
 def extract_company_mentions(text):
     """Extract company name mentions."""
-    # Map of company names to tickers
-    company_map = {
-        "nvidia": "NVDA", "apple": "AAPL", "microsoft": "MSFT",
-        "google": "GOOGL", "alphabet": "GOOGL", "meta": "META",
-        "facebook": "META", "amazon": "AMZN", "tesla": "TSLA",
-        "netflix": "NFLX", "salesforce": "CRM", "oracle": "ORCL",
-        "snowflake": "SNOW", "palantir": "PLTR", "mongodb": "MDB",
-        "datadog": "DDOG", "cloudflare": "NET", "twilio": "TWLO",
-        "workday": "WDAY", "servicenow": "NOW", "vmware": "VMW",
-        "crowdstrike": "CRWD", "zscaler": "ZS", "okta": "OKTA",
-        "sentinelone": "S", "cisco": "CSCO", "juniper": "JNPR",
-        "arista": "ANET", "broadcom": "AVGO", "marvell": "MRVL",
-        "micron": "MU", "western digital": "WDC", "seagate": "STX",
-        "intel": "INTC", "amd": "AMD", "tsmc": "TSM",
-        "asml": "ASML", "applied materials": "AMAT", "lam research": "LRCX",
-        "kla": "KLAC", "texas instruments": "TXN", "qualcomm": "QCOM",
-        "analog devices": "ADI", "nxp": "NXPI", "on semi": "ON",
-        "microchip": "MCHP", "xilinx": "XLNX"
-    }
-    
-    tickers = []
-    text_lower = text.lower()
-    
-    for company, ticker in company_map.items():
-        if company in text_lower:
-            tickers.append(ticker)
-    
+    tickers = [COMPANY_MAP[company] for company in COMPANY_MATCHER.found(text.lower())]
     return list(set(tickers))
 
 def analyze_industry_mentions(content_items):
-    """Track which industries are being mentioned in disruption contexts."""
-    industry_mentions = defaultdict(lambda: {
-        "mentions": 0,
-        "disruption_signals": [],
-        "sources": set(),
-        "contexts": []
-    })
+    """Track which industries are being mentioned in disruption contexts.
+    
+    Returns one map per field (mentions, disruptions, sources, contexts), keyed by industry.
+    """
+    mentions = Counter()
+    disruptions = Counter()
+    sources = defaultdict(set)
+    contexts = defaultdict(list)
     
     for item in content_items:
-        text = f"{item['subject']} {item['content']}".lower()
+        text = item_text(item)
         themes = extract_themes(item)
+        disrupted = "ai_disruption" in themes or "disrupt" in text
         
-        for industry, data in SUPPLY_CHAIN.items():
-            # Check if industry mentioned
-            if industry.replace("_", " ") in text or industry in text:
-                industry_mentions[industry]["mentions"] += 1
-                industry_mentions[industry]["sources"].add(item['source'][:50])
+        # Check which industries are mentioned (kept in SUPPLY_CHAIN order)
+        mentioned = {INDUSTRY_NAMES[name] for name in INDUSTRY_MATCHER.found(text)}
+        for industry in SUPPLY_CHAIN:
+            if industry in mentioned:
+                mentions[industry] += 1
+                sources[industry].add(item['source'][:50])
                 
                 # Check for disruption signals
-                if "ai_disruption" in themes or "disrupt" in text:
-                    industry_mentions[industry]["disruption_signals"].append({
-                        "source": item['subject'][:80],
-                        "context": item['content'][:200]
-                    })
+                if disrupted:
+                    disruptions[industry] += 1
                 
-                industry_mentions[industry]["contexts"].append({
-                    "subject": item['subject'][:80],
-                    "source": item['source'][:50]
-                })
+                if len(contexts[industry]) < 3:  # only the first three are reported
+                    contexts[industry].append({
+                        "subject": item['subject'][:80],
+                        "source": item['source'][:50]
+                    })
     
-    return industry_mentions
+    return {
+        "mentions": mentions,
+        "disruptions": disruptions,
+        "sources": sources,
+        "contexts": contexts
+    }
+
+@lru_cache(maxsize=None)
+def supply_chain_plays(industry):
+    """Hidden plays implied by a disruption in industry (fixed by the static maps, so cached)."""
+    chain = SUPPLY_CHAIN.get(industry)
+    if chain is None:
+        return ()
+    plays = []
+    
+    # Check upstream (what feeds this industry)
+    for upstream in chain.get("upstream", []):
+        for ticker in INDUSTRY_EXPOSURE.get(upstream, []):
+            plays.append({
+                "ticker": ticker,
+                "theme": f"Upstream of disrupted {industry}",
+                "logic": f"{upstream} supplies {industry} which is being disrupted by AI",
+                "affected_industry": industry
+            })
+    
+    # Check downstream (who uses this industry)
+    for downstream in chain.get("downstream", []):
+        for ticker in INDUSTRY_EXPOSURE.get(downstream, []):
+            plays.append({
+                "ticker": ticker,
+                "theme": f"Downstream of disrupted {industry}",
+                "logic": f"{downstream} depends on {industry} which is being disrupted",
+                "affected_industry": industry
+            })
+    
+    return tuple(plays)
 
 def find_hidden_plays(industry_mentions, content_items):
     """Find companies in related industries that might be affected."""
     hidden_plays = []
     
-    for industry, data in industry_mentions.items():
-        if data["disruption_signals"]:
-            # This industry is being disrupted
-            # Look at downstream/supply chain effects
-            
-            if industry in SUPPLY_CHAIN:
-                chain = SUPPLY_CHAIN[industry]
-                
-                # Check upstream (what feeds this industry)
-                for upstream in chain.get("upstream", []):
-                    if upstream in INDUSTRY_EXPOSURE:
-                        for ticker in INDUSTRY_EXPOSURE[upstream]:
-                            hidden_plays.append({
-                                "ticker": ticker,
-                                "theme": f"Upstream of disrupted {industry}",
-                                "logic": f"{upstream} supplies {industry} which is being disrupted by AI",
-                                "affected_industry": industry
-                            })
-                
-                # Check downstream (who uses this industry)
-                for downstream in chain.get("downstream", []):
-                    if downstream in INDUSTRY_EXPOSURE:
-                        for ticker in INDUSTRY_EXPOSURE[downstream]:
-                            hidden_plays.append({
-                                "ticker": ticker,
-                                "theme": f"Downstream of disrupted {industry}",
-                                "logic": f"{downstream} depends on {industry} which is being disrupted",
-                                "affected_industry": industry
-                            })
+    for industry in industry_mentions["mentions"]:
+        if industry_mentions["disruptions"][industry]:
+            # This industry is being disrupted; look at supply chain effects
+            hidden_plays.extend(supply_chain_plays(industry))
     
     return hidden_plays
 
@@ -252,91 +340,81 @@ def find_supply_bottlenecks(content_items):
     bottlenecks = []
     
     for item in content_items:
-        text = f"{item['subject']} {item['content']}".lower()
+        text = item_text(item)
         themes = extract_themes(item)
         
         if "supply_bottleneck" in themes or "demand_surge" in themes:
-            # Look for mentions of specific bottlenecks
-            bottleneck_keywords = {
-                "power": "ai_power_demand",
-                "electricity": "ai_power_demand",
-                "energy": "ai_power_demand",
-                "cooling": "ai_cooling",
-                "water": "ai_cooling",
-                "network": "ai_networking",
-                "bandwidth": "ai_networking",
-                "lithography": "lithography",
-                "wafers": "lithography",
-                "memory": "memory"
-            }
+            # Sliced once per item; every bottleneck row from it shares these
+            source = item['subject'][:80]
+            context = item['content'][:BOTTLENECK_CONTEXT_CHARS]
             
-            for keyword, category in bottleneck_keywords.items():
-                if keyword in text:
-                    if category in INDUSTRY_EXPOSURE:
-                        for ticker in INDUSTRY_EXPOSURE[category]:
-                            bottlenecks.append({
-                                "ticker": ticker,
-                                "category": category,
-                                "bottleneck": keyword,
-                                "source": item['subject'][:80],
-                                "context": item['content'][:150]
-                            })
+            # Look for mentions of specific bottlenecks
+            for keyword in BOTTLENECK_MATCHER.found(text):
+                category = BOTTLENECK_KEYWORDS[keyword]
+                if category in INDUSTRY_EXPOSURE:
+                    for ticker in INDUSTRY_EXPOSURE[category]:
+                        bottlenecks.append({
+                            "ticker": ticker,
+                            "category": category,
+                            "bottleneck": keyword,
+                            "source": source,
+                            "context": context
+                        })
     
     return bottlenecks
 
 def generate_research_report(content_items, industry_mentions, hidden_plays, bottlenecks):
     """Generate comprehensive research report."""
     
-    # Count explicit ticker mentions
-    all_tickers = defaultdict(lambda: {"mentions": 0, "sources": set(), "contexts": []})
+    # Count explicit ticker mentions (parallel per-field maps instead of a dict per ticker)
+    mention_counts = Counter()
+    ticker_sources = defaultdict(set)
+    ticker_contexts = defaultdict(list)
     
     for item in content_items:
         text = f"{item['subject']} {item['content']}"
         tickers = extract_explicit_tickers(text) + extract_company_mentions(text)
+        if not tickers:
+            continue
         
+        source = item['source'][:50]
+        context = {"subject": item['subject'][:80], "source": source}
+        mention_counts.update(tickers)
         for ticker in tickers:
-            all_tickers[ticker]["mentions"] += 1
-            all_tickers[ticker]["sources"].add(item['source'][:50])
-            all_tickers[ticker]["contexts"].append({
-                "subject": item['subject'][:80],
-                "source": item['source'][:50]
-            })
+            ticker_sources[ticker].add(source)
+            contexts = ticker_contexts[ticker]
+            if len(contexts) < 2:  # only the first two are reported
+                contexts.append(context)
     
     # Sort by mentions
-    top_tickers = sorted(
-        [(t, d) for t, d in all_tickers.items()],
-        key=lambda x: x[1]["mentions"],
-        reverse=True
-    )[:20]
+    top_tickers = mention_counts.most_common(20)
+    
+    theme_counts = Counter(theme for item in content_items for theme in extract_themes(item))
     
     report = {
         "generated_at": datetime.now().isoformat(),
         "total_sources_analyzed": len(content_items),
         "themes_detected": {
-            theme: sum(1 for item in content_items if theme in extract_themes(item))
+            theme: theme_counts[theme]
             for theme in THEME_PATTERNS.keys()
         },
         "industry_analysis": {
             industry: {
-                "mentions": data["mentions"],
-                "sources": list(data["sources"]),
-                "disruption_count": len(data["disruption_signals"]),
-                "contexts": data["contexts"][:3]
+                "mentions": mentions,
+                "sources": list(industry_mentions["sources"][industry]),
+                "disruption_count": industry_mentions["disruptions"][industry],
+                "contexts": industry_mentions["contexts"][industry]
             }
-            for industry, data in sorted(
-                industry_mentions.items(),
-                key=lambda x: x[1]["mentions"],
-                reverse=True
-            )[:10]
+            for industry, mentions in industry_mentions["mentions"].most_common(10)
         },
         "explicit_ticker_mentions": [
             {
                 "ticker": ticker,
-                "mentions": data["mentions"],
-                "sources": list(data["sources"]),
-                "contexts": data["contexts"][:2]
+                "mentions": mentions,
+                "sources": list(ticker_sources[ticker]),
+                "contexts": ticker_contexts[ticker]
             }
-            for ticker, data in top_tickers
+            for ticker, mentions in top_tickers
         ],
         "hidden_plays": hidden_plays[:15],
         "supply_bottlenecks": bottlenecks[:15]
@@ -344,63 +422,80 @@ def generate_research_report(content_items, industry_mentions, hidden_plays, bot
     
     return report
 
+def write_atomic(path, data):
+    """Write bytes to a temp file and rename it over path."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
 def save_research_report(report):
     """Save report to research directory."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # JSON version
+    if ORJSON_AVAILABLE:
+        report_json = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    else:
+        report_json = json.dumps(report, indent=2).encode()
     json_path = RESEARCH_DIR / f"research_{timestamp}.json"
-    with open(json_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    json_path.write_bytes(report_json)
     
-    # Also save as latest
+    # Also save as latest (swapped in atomically, other tools read this path)
     latest_json = RESEARCH_DIR / "latest_research.json"
-    with open(latest_json, 'w') as f:
-        json.dump(report, f, indent=2)
+    write_atomic(latest_json, report_json)
+    
+    # Markdown version (assembled in memory, written once)
+    parts = []
+    append = parts.append
+    append("# Investment Research Report\n\n")
+    append(f"Generated: {report['generated_at']}\n\n")
+    append(f"Sources analyzed: {report['total_sources_analyzed']}\n\n")
+    
+    append("## Detected Themes\n\n")
+    for theme, count in report['themes_detected'].items():
+        if count > 0:
+            append(f"- **{theme}**: {count} mentions\n")
+    append("\n")
+    
+    append("## Industry Analysis\n\n")
+    for industry, data in report['industry_analysis'].items():
+        latest = f"- Latest: {data['contexts'][0]['subject']}\n" if data['contexts'] else ""
+        append(
+            f"### {industry.replace('_', ' ').title()}\n"
+            f"- Mentions: {data['mentions']}\n"
+            f"- Disruption signals: {data['disruption_count']}\n"
+            f"{latest}\n"
+        )
+    
+    append("## Explicit Ticker Mentions\n\n")
+    for item in report['explicit_ticker_mentions'][:10]:
+        context = f"- Context: {item['contexts'][0]['subject']}\n" if item['contexts'] else ""
+        append(
+            f"### {item['ticker']} ({item['mentions']} mentions)\n"
+            f"- Sources: {', '.join(item['sources'][:3])}\n"
+            f"{context}\n"
+        )
+    
+    append("## Hidden Plays (Supply Chain & Second-Order Effects)\n\n")
+    for play in report['hidden_plays'][:10]:
+        append(
+            f"### {play['ticker']}\n"
+            f"- Theme: {play['theme']}\n"
+            f"- Logic: {play['logic']}\n"
+            f"- Affected Industry: {play['affected_industry']}\n\n"
+        )
+    
+    append("## Supply Chain Bottlenecks\n\n")
+    for item in report['supply_bottlenecks'][:10]:
+        append(
+            f"### {item['ticker']}\n"
+            f"- Category: {item['category']}\n"
+            f"- Bottleneck: {item['bottleneck']}\n"
+            f"- Source: {item['source']}\n\n"
+        )
     
-    # Markdown version
     md_path = RESEARCH_DIR / "latest_research.md"
-    with open(md_path, 'w') as f:
-        f.write("# Investment Research Report\n\n")
-        f.write(f"Generated: {report['generated_at']}\n\n")
-        f.write(f"Sources analyzed: {report['total_sources_analyzed']}\n\n")
-        
-        f.write("## Detected Themes\n\n")
-        for theme, count in report['themes_detected'].items():
-            if count > 0:
-                f.write(f"- **{theme}**: {count} mentions\n")
-        f.write("\n")
-        
-        f.write("## Industry Analysis\n\n")
-        for industry, data in report['industry_analysis'].items():
-            f.write(f"### {industry.replace('_', ' ').title()}\n")
-            f.write(f"- Mentions: {data['mentions']}\n")
-            f.write(f"- Disruption signals: {data['disruption_count']}\n")
-            if data['contexts']:
-                f.write(f"- Latest: {data['contexts'][0]['subject']}\n")
-            f.write("\n")
-        
-        f.write("## Explicit Ticker Mentions\n\n")
-        for item in report['explicit_ticker_mentions'][:10]:
-            f.write(f"### {item['ticker']} ({item['mentions']} mentions)\n")
-            f.write(f"- Sources: {', '.join(item['sources'][:3])}\n")
-            if item['contexts']:
-                f.write(f"- Context: {item['contexts'][0]['subject']}\n")
-            f.write("\n")
-        
-        f.write("## Hidden Plays (Supply Chain & Second-Order Effects)\n\n")
-        for play in report['hidden_plays'][:10]:
-            f.write(f"### {play['ticker']}\n")
-            f.write(f"- Theme: {play['theme']}\n")
-            f.write(f"- Logic: {play['logic']}\n")
-            f.write(f"- Affected Industry: {play['affected_industry']}\n\n")
-        
-        f.write("## Supply Chain Bottlenecks\n\n")
-        for item in report['supply_bottlenecks'][:10]:
-            f.write(f"### {item['ticker']}\n")
-            f.write(f"- Category: {item['category']}\n")
-            f.write(f"- Bottleneck: {item['bottleneck']}\n")
-            f.write(f"- Source: {item['source']}\n\n")
+    md_path.write_text(''.join(parts))
     
     return json_path, md_path
 
@@ -437,27 +532,26 @@ if __name__ == "__main__":
     json_path, md_path = save_research_report(report)
     
     # Display
-    print("\n" + "=" * 60)
-    print("RESEARCH SUMMARY")
-    print("=" * 60)
+    lines = ["", "=" * 60, "RESEARCH SUMMARY", "=" * 60]
     
-    print(f"\nThemes detected:")
+    lines.append("\nThemes detected:")
     for theme, count in report['themes_detected'].items():
         if count > 0:
-            print(f"  - {theme}: {count}")
+            lines.append(f"  - {theme}: {count}")
     
-    print(f"\nTop industries mentioned:")
+    lines.append("\nTop industries mentioned:")
     for industry, data in list(report['industry_analysis'].items())[:5]:
-        print(f"  - {industry}: {data['mentions']} mentions")
+        lines.append(f"  - {industry}: {data['mentions']} mentions")
     
-    print(f"\nHidden plays identified: {len(hidden_plays)}")
+    lines.append(f"\nHidden plays identified: {len(hidden_plays)}")
     for play in hidden_plays[:5]:
-        print(f"  - {play['ticker']}: {play['logic'][:60]}...")
+        lines.append(f"  - {play['ticker']}: {play['logic'][:60]}...")
     
-    print(f"\nSupply bottlenecks: {len(bottlenecks)}")
+    lines.append(f"\nSupply bottlenecks: {len(bottlenecks)}")
     
-    print("\n" + "=" * 60)
-    print(f"✓ Reports saved:")
-    print(f"   JSON: {json_path}")
-    print(f"   Markdown: {md_path}")
-    print(f"   Latest: {RESEARCH_DIR}/latest_research.json")
+    lines.append("\n" + "=" * 60)
+    lines.append("✓ Reports saved:")
+    lines.append(f"   JSON: {json_path}")
+    lines.append(f"   Markdown: {md_path}")
+    lines.append(f"   Latest: {RESEARCH_DIR}/latest_research.json")
+    sys.stdout.write("\n".join(lines) + "\n")
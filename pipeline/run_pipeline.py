@@ -4,6 +4,8 @@ Master pipeline orchestrator.
 Runs all ingestion, analysis, and exports data for website.
 """
 
+import os
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -16,6 +18,20 @@ sys.path.insert(0, str(Path(__file__).parent))
 from db_manager import get_db, TickerMention, PodcastEpisode, DailyScore
 from pipeline_tracker import PodcastPipelineTracker
 
+# orjson parses the inbox newsletter files several times faster; fall back to stdlib json
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Newsletter disruption keywords, matched with one compiled alternation
+DISRUPTION_KEYWORDS = [
+    'disruption', 'disruptive', 'paradigm shift', 'game changer',
+    'breakthrough', 'transformation', 'revolutionary'
+]
+DISRUPTION_RE = re.compile('|'.join(map(re.escape, DISRUPTION_KEYWORDS)))
+
 def run_step(name: str, script: str, args: list = None) -> bool:
     """Run a pipeline step and report status."""
     print(f"\n{'='*60}")
@@ -27,15 +43,20 @@ def run_step(name: str, script: str, args: list = None) -> bool:
         cmd.extend(args)
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path(__file__).parent)
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        if result.returncode == 0:
+        # Relay the step's output line by line as it runs instead of buffering all of it
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+            cwd=Path(__file__).parent, env={**os.environ, 'PYTHONUNBUFFERED': '1'},
+        )
+        with proc.stdout:
+            for line in proc.stdout:
+                print(line, end='')
+        returncode = proc.wait()
+        if returncode == 0:
             print(f"✓ {name} completed")
             return True
         else:
-            print(f"✗ {name} failed with code {result.returncode}")
+            print(f"✗ {name} failed with code {returncode}")
             return False
     except Exception as e:
         print(f"✗ {name} error: {e}")
@@ -62,10 +83,10 @@ def import_newsletters_to_db():
     inbox_dir = Path.home() / ".openclaw/workspace/pipeline/inbox"
     
     imported = 0
+    mentions = []
     for json_file in inbox_dir.glob("*.json"):
         try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+            data = json_loads(json_file.read_bytes())
             
             # Process tickers from newsletter
             tickers = data.get('extracted_tickers', [])
@@ -74,30 +95,37 @@ def import_newsletters_to_db():
             
             # Check for disruption keywords
             content = str(subject) + ' ' + str(data.get('content_preview', ''))
-            content_lower = content.lower()
-            
-            disruption_keywords = [
-                'disruption', 'disruptive', 'paradigm shift', 'game changer',
-                'breakthrough', 'transformation', 'revolutionary'
-            ]
-            is_disruption = any(kw in content_lower for kw in disruption_keywords)
+            is_disruption = DISRUPTION_RE.search(content.lower()) is not None
             
+            # Slice once; every mention from this newsletter shares the same context
+            mention_title = subject[:100]
+            mention_context = data.get('content_preview', '')[:300]
             for ticker in tickers:
-                mention = TickerMention(
+                mentions.append(TickerMention(
                     ticker=ticker,
                     source_type='newsletter',
                     source_name=sender,
-                    episode_title=subject[:100],
-                    context=data.get('content_preview', '')[:300],
+                    episode_title=mention_title,
+                    context=mention_context,
                     is_disruption_focused=is_disruption
-                )
-                db.add_ticker_mention(mention)
+                ))
             
             imported += 1
             
         except Exception as e:
             print(f"  Error importing {json_file}: {e}")
     
+    # Every newsletter's mentions in one transaction
+    try:
+        db.add_ticker_mentions_bulk(mentions)
+    except Exception:
+        # The bulk insert is all-or-nothing; retry row by row so the rest still land
+        for mention in mentions:
+            try:
+                db.add_ticker_mention(mention)
+            except Exception as e:
+                print(f"  Error storing mention {mention.ticker}: {e}")
+    
     print(f"✓ Imported {imported} newsletters")
     return imported
 
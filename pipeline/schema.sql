@@ -160,6 +160,17 @@ CREATE TABLE processing_queue (
     processed_at TIMESTAMP
 );
 
+-- Transcript analyses submitted to the OpenAI Batch API (USE_BATCH_API=1)
+CREATE TABLE pending_batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch_id TEXT NOT NULL UNIQUE,
+    provider TEXT NOT NULL,
+    transcript_paths TEXT NOT NULL,  -- JSON object: request custom_id -> transcript path
+    status TEXT DEFAULT 'submitted',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP
+);
+
 -- Indexes for performance
 CREATE INDEX idx_mentions_ticker ON ticker_mentions(ticker);
 CREATE INDEX idx_mentions_date ON ticker_mentions(mention_date);
@@ -168,6 +179,10 @@ CREATE INDEX idx_scores_date ON daily_scores(date);
 CREATE INDEX idx_scores_ticker ON daily_scores(ticker);
 CREATE INDEX idx_episodes_date ON podcast_episodes(episode_date);
 CREATE INDEX idx_episodes_processed ON podcast_episodes(is_processed, added_to_site);
+CREATE INDEX idx_insights_active_date ON latest_insights(display_on_main, source_date DESC);
+CREATE INDEX idx_insights_episode ON latest_insights(podcast_episode_id);
+CREATE INDEX idx_definitions_active_votes ON definitions(display_on_main, vote_count DESC);
+CREATE INDEX idx_overton_active_mentions ON overton_terms(display_on_main, mention_count DESC);
 
 -- Views for common queries
 
@@ -4,47 +4,85 @@ Quick keyword-based transcript processor.
 Fallback when AI APIs are unavailable - extracts tickers and basic sentiment.
 """
 
+import heapq
 import re
 import json
+import sys
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from datetime import datetime, date
 
+sys.path.insert(0, str(Path(__file__).parent))
+from keyword_matcher import KeywordMatcher
+
+# orjson serializes indented JSON several times faster; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 TRANSCRIPT_DIR = Path.home() / ".openclaw/workspace/pipeline/transcripts"
+# Optional list of real symbols (e.g. a NASDAQ/NYSE listing export), one per line
+TICKER_UNIVERSE_FILE = Path.home() / ".openclaw/workspace/pipeline/state/ticker_universe.txt"
 
 # Ticker patterns
-TICKER_PATTERN = r'\b([A-Z]{3,5})\b'
+TICKER_PATTERN = re.compile(r'\b[A-Z]{3,5}\b')
 
 # Common words to exclude
-EXCLUDE_WORDS = {'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'DAY', 'HAD', 'HOT', 'HIS', 'HOW', 'MAN', 'NEW', 'NOW', 'OLD', 'SEE', 'WAY', 'WHO', 'BOY', 'DID', 'ITS', 'LET', 'PUT', 'SAY', 'SHE', 'TOO', 'USE', 'DAD', 'MOM', 'AI', 'US', 'COVID', 'OK', 'ETF', 'IPO', 'EPS', 'GDP', 'CEO', 'CFO', 'CTO', 'VIP', 'NBA', 'NFL', 'MLB', 'FBI', 'CIA', 'IRS', 'FDA', 'SEC', 'FTC', 'DOJ', 'YES', 'NO', 'GO', 'DO', 'IF', 'UP', 'SO', 'ME', 'MY', 'WE', 'HE', 'IT', 'BE', 'BY', 'ON', 'TO', 'OF', 'IN', 'IS', 'AT', 'AS', 'OR', 'AN', 'TV', 'PC', 'CD', 'US', 'UK', 'EU', 'UN', 'VS', 'HR', 'IT', 'RIP', 'LOL', 'OMG', 'WOW', 'BIG', 'TOP', 'BEST', 'NEW', 'GOOD', 'BAD', 'HIGH', 'LOW', 'FAST', 'SLOW', 'HARD', 'EASY', 'TRUE', 'FALSE', 'REAL', 'FAKE', 'OPEN', 'CLOSE', 'LONG', 'SHORT', 'BUY', 'SELL', 'HOLD', 'CALL', 'PUT', 'BULL', 'BEAR', 'MOON', 'REKT', 'HODL', 'FUD', 'FOMO', 'ATH', 'ATL', 'GPT', 'CEO', 'AGI', 'LLM'}
+EXCLUDE_WORDS = frozenset({'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'DAY', 'HAD', 'HOT', 'HIS', 'HOW', 'MAN', 'NEW', 'NOW', 'OLD', 'SEE', 'WAY', 'WHO', 'BOY', 'DID', 'ITS', 'LET', 'PUT', 'SAY', 'SHE', 'TOO', 'USE', 'DAD', 'MOM', 'AI', 'US', 'COVID', 'OK', 'ETF', 'IPO', 'EPS', 'GDP', 'CEO', 'CFO', 'CTO', 'VIP', 'NBA', 'NFL', 'MLB', 'FBI', 'CIA', 'IRS', 'FDA', 'SEC', 'FTC', 'DOJ', 'YES', 'NO', 'GO', 'DO', 'IF', 'UP', 'SO', 'ME', 'MY', 'WE', 'HE', 'IT', 'BE', 'BY', 'ON', 'TO', 'OF', 'IN', 'IS', 'AT', 'AS', 'OR', 'AN', 'TV', 'PC', 'CD', 'US', 'UK', 'EU', 'UN', 'VS', 'HR', 'IT', 'RIP', 'LOL', 'OMG', 'WOW', 'BIG', 'TOP', 'BEST', 'NEW', 'GOOD', 'BAD', 'HIGH', 'LOW', 'FAST', 'SLOW', 'HARD', 'EASY', 'TRUE', 'FALSE', 'REAL', 'FAKE', 'OPEN', 'CLOSE', 'LONG', 'SHORT', 'BUY', 'SELL', 'HOLD', 'CALL', 'PUT', 'BULL', 'BEAR', 'MOON', 'REKT', 'HODL', 'FUD', 'FOMO', 'ATH', 'ATL', 'GPT', 'CEO', 'AGI', 'LLM'})
 
 # Investment keywords
 BULLISH_KEYWORDS = ['buy', 'long', 'bullish', 'accumulate', 'increase', 'growth', 'opportunity', 'undervalued', 'cheap', 'strong', 'moon', 'rocket']
 BEARISH_KEYWORDS = ['sell', 'short', 'bearish', 'decrease', 'overvalued', 'expensive', 'weak', 'crash', 'drop', 'fall']
 
+BULLISH_MATCHER = KeywordMatcher(BULLISH_KEYWORDS)
+BEARISH_MATCHER = KeywordMatcher(BEARISH_KEYWORDS)
+
+def load_ticker_universe(path=TICKER_UNIVERSE_FILE):
+    """Load known ticker symbols in file order; empty if the file is missing."""
+    try:
+        with open(path) as f:
+            symbols = [line.split('|')[0].strip().upper() for line in f]
+    except FileNotFoundError:
+        return []
+    # Symbols that double as common words (ALL, NOW, ...) would still be noise
+    return [s for s in symbols if s and not s.startswith('#') and s not in EXCLUDE_WORDS]
+
+TICKER_UNIVERSE = load_ticker_universe()
+TICKER_MATCHER = KeywordMatcher(TICKER_UNIVERSE, whole_words=True) if TICKER_UNIVERSE else None
+
 def extract_tickers_from_text(text):
-    """Extract potential tickers from text."""
-    tickers = re.findall(TICKER_PATTERN, text)
-    valid_tickers = []
-    for t in tickers:
-        if t not in EXCLUDE_WORDS and len(t) >= 2 and len(t) <= 5:
-            valid_tickers.append(t)
-    return list(set(valid_tickers))
-
-def detect_sentiment(text, ticker):
+    """Extract potential tickers from text (a sized iterable of unique symbols)."""
+    if TICKER_MATCHER is not None:
+        # One pass over the text, and only symbols that actually exist
+        return TICKER_MATCHER.found(text)
+    # Pattern already limits length to 3-5; dedup and drop stopwords in one set, no list copy
+    seen = set(TICKER_PATTERN.findall(text))
+    seen -= EXCLUDE_WORDS
+    return seen
+
+def split_sentences(text):
+    """Split text into sentences."""
+    return re.split(r'[.!?]+', text)
+
+def detect_sentiment(text, ticker, sentences_lower=None):
     """Basic sentiment detection around ticker mentions."""
-    text_lower = text.lower()
+    if sentences_lower is None:
+        sentences_lower = split_sentences(text.lower())
     
     # Find sentences containing the ticker
-    sentences = re.split(r'[.!?]+', text)
-    ticker_sentences = [s for s in sentences if ticker.lower() in s.lower()]
+    ticker_lower = ticker.lower()
+    ticker_sentences = [s for s in sentences_lower if ticker_lower in s]
     
     if not ticker_sentences:
         return 'neutral', 50
     
-    context = ' '.join(ticker_sentences).lower()
+    context = ' '.join(ticker_sentences)
     
-    bullish_count = sum(1 for kw in BULLISH_KEYWORDS if kw in context)
-    bearish_count = sum(1 for kw in BEARISH_KEYWORDS if kw in context)
+    bullish_count = BULLISH_MATCHER.count(context)
+    bearish_count = BEARISH_MATCHER.count(context)
     
     if bullish_count > bearish_count:
         return 'bullish', min(50 + bullish_count * 10, 90)
@@ -69,20 +107,22 @@ def process_transcript_simple(filepath):
     preview = content[:500].replace('\n', ' ')
     
     # Detect podcast from content
+    content_lower = content.lower()
     podcast_name = "Unknown"
-    if 'monetary matters' in content.lower() or 'jack farley' in content.lower():
+    if 'monetary matters' in content_lower or 'jack farley' in content_lower:
         podcast_name = "Monetary Matters with Jack Farley"
-    elif 'jack mallers' in content.lower() or 'mallers show' in content.lower():
+    elif 'jack mallers' in content_lower or 'mallers show' in content_lower:
         podcast_name = "The Jack Mallers Show"
-    elif 'peter diamandis' in content.lower() or 'moonshots' in content.lower():
+    elif 'peter diamandis' in content_lower or 'moonshots' in content_lower:
         podcast_name = "Moonshots with Peter Diamandis"
-    elif 'a16z' in content.lower():
+    elif 'a16z' in content_lower:
         podcast_name = "a16z Live"
     
     # Build ticker mentions
+    sentences_lower = split_sentences(content_lower)  # shared by every ticker below
     ticker_mentions = []
-    for ticker in tickers[:15]:  # Limit to top 15
-        sentiment, conviction = detect_sentiment(content, ticker)
+    for ticker in islice(tickers, 15):  # Limit to top 15
+        sentiment, conviction = detect_sentiment(content, ticker, sentences_lower)
         ticker_mentions.append({
             'ticker': ticker,
             'sentiment': sentiment,
@@ -109,11 +149,14 @@ def main():
     results = []
     processed_count = 0
     
-    for transcript_file in TRANSCRIPT_DIR.glob("*.txt"):
+    # Transcripts are independent and the scan is CPU-bound, so fan out across cores
+    transcript_files = list(TRANSCRIPT_DIR.glob("*.txt"))
+    with ProcessPoolExecutor() as pool:
+        processed = list(pool.map(process_transcript_simple, transcript_files, chunksize=4))
+    
+    for transcript_file, result in zip(transcript_files, processed):
         print(f"\nProcessing {transcript_file.name}...")
         
-        result = process_transcript_simple(transcript_file)
-        
         if result:
             results.append(result)
             processed_count += 1
@@ -124,8 +167,11 @@ def main():
     
     # Save results
     output_file = Path.home() / ".openclaw/workspace/pipeline/simple_analysis.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    if ORJSON_AVAILABLE:
+        output_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(results, f, indent=2)
     
     print(f"\n" + "="*60)
     print(f"Processed {processed_count} transcripts")
@@ -140,9 +186,9 @@ def main():
                 all_tickers[t] = {'count': 0, 'sentiment': tm['sentiment']}
             all_tickers[t]['count'] += 1
     
-    # Sort by count
-    sorted_tickers = sorted(all_tickers.items(), key=lambda x: x[1]['count'], reverse=True)
-    for ticker, data in sorted_tickers[:20]:
+    # Top 20 by count (partial selection, no full sort)
+    top_tickers = heapq.nlargest(20, all_tickers.items(), key=lambda x: x[1]['count'])
+    for ticker, data in top_tickers:
         print(f"  {ticker}: {data['count']} mentions ({data['sentiment']})")
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+KeywordMatcher must give the same answer with and without pyahocorasick.
+Run: python -m pytest pipeline/test_keyword_matcher.py
+"""
+
+import pytest
+
+import keyword_matcher
+from keyword_matcher import KeywordMatcher
+
+KEYWORDS = ['BRK', 'BRK.B', 'AI', 'AI chips', 'NVDA', 'TSM']
+
+CASES = [
+    ("buy BRK.B and AI chips", ['BRK', 'BRK.B', 'AI', 'AI chips']),
+    ("AI", ['AI']),
+    ("AIR and NVDAX are not tickers here", []),
+    ("(NVDA) vs TSM_ vs TSM.", ['NVDA', 'TSM']),
+    ("", []),
+]
+
+BACKENDS = [
+    pytest.param(False, id="regex"),
+    pytest.param(True, id="ahocorasick", marks=pytest.mark.skipif(
+        not keyword_matcher.AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed")),
+]
+
+
+def make_matcher(monkeypatch, use_automaton, keywords, whole_words):
+    monkeypatch.setattr(keyword_matcher, "AHOCORASICK_AVAILABLE", use_automaton)
+    return KeywordMatcher(keywords, whole_words=whole_words)
+
+
+@pytest.mark.parametrize("use_automaton", BACKENDS)
+@pytest.mark.parametrize("text, expected", CASES)
+def test_whole_words_reports_every_keyword(monkeypatch, use_automaton, text, expected):
+    matcher = make_matcher(monkeypatch, use_automaton, KEYWORDS, whole_words=True)
+    assert matcher.found(text) == expected
+    assert matcher.count(text) == len(expected)
+
+
+@pytest.mark.parametrize("use_automaton", BACKENDS)
+def test_substrings_without_whole_words(monkeypatch, use_automaton):
+    matcher = make_matcher(monkeypatch, use_automaton, ['ai', 'chip', 'ai chip'], whole_words=False)
+    assert matcher.found("retail chipmakers and ai chips") == ['ai', 'chip', 'ai chip']
@@ -15,6 +15,7 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Reduce risk of CTranslate2/OpenMP SIGABRT on macOS by limiting threads
@@ -32,6 +33,14 @@ DEFAULT_MODEL = "tiny"
 SUPPORTED_MODELS = ("tiny", "base", "small", "medium", "large-v2", "large-v3")
 
 
+@lru_cache(maxsize=None)
+def _load_model(model_size: str, device: str, compute_type: str):
+    """Load a faster-whisper model once per process; batch runs reuse it for every file."""
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
 def transcribe_file(
     audio_path: Path,
     output_path: Path | None = None,
@@ -69,19 +78,23 @@ def transcribe_file(
         compute_type = "int8"
     elif device == "cpu" and compute_type == "default":
         compute_type = "int8"
+    elif device == "cuda" and compute_type == "default":
+        compute_type = "float16"
     elif device == "auto":
         try:
             import torch
             device = "cuda" if torch.cuda.is_available() else "cpu"
             if device == "cpu":
                 compute_type = "int8"
+            elif compute_type == "default":
+                compute_type = "float16"
         except Exception:
             device = "cpu"
             compute_type = "int8"
 
     print(f"  🎙️  Transcribing with faster-whisper (model={model_size}, device={device})...")
     try:
-        model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        model = _load_model(model_size, device, compute_type)
         segments, info = model.transcribe(
             str(audio_path),
             language=language,
@@ -5,10 +5,25 @@ Transcribe audio using LOCAL OpenAI Whisper (PyTorch). No API, stable on macOS.
 Use this if faster-whisper crashes (SIGABRT) on your machine.
 Install: pip install openai-whisper
 """
-import subprocess
+import importlib.util
+import multiprocessing
+import os
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 
+# Whisper runs in one long-lived worker process, so a run of several files shares one model load.
+# Only the worker imports it: callers such as approval_processor never load torch themselves.
+WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
+
+# Opt-in: WHISPER_INT8=1 quantizes the model to int8 on CPU (FP16 is already used on CUDA).
+# Off by default until its transcripts have been compared against FP32 on real episodes.
+WHISPER_INT8 = os.environ.get("WHISPER_INT8", "0").lower() in ("1", "true", "yes")
+
+# Per-file limit; a stuck decode is killed (with its worker) instead of blocking the caller
+WHISPER_TIMEOUT = int(os.environ.get("WHISPER_TIMEOUT", "14400"))  # 4 hours for long episodes
+
 # Config
 AUDIO_DIR = Path.home() / ".openclaw/workspace/pipeline/audio"
 WORKSPACE_AUDIO_DIR = Path.home() / ".openclaw/workspace/audio"
@@ -32,61 +47,110 @@ def _latest_audio_file():
     return max(candidates, key=lambda p: p.stat().st_mtime) if candidates else None
 
 
-def _find_whisper():
-    """Use current Python with -m whisper (no hardcoded path)."""
+@lru_cache(maxsize=None)
+def _load_model(model):
+    """Load a Whisper model once per process; every later file reuses it."""
+    import whisper
+
+    print(f"  ⏳ Loading Whisper model '{model}'...")
+    loaded = whisper.load_model(model)
+    if loaded.device.type == "cpu" and WHISPER_INT8:
+        import torch
+        try:
+            # whisper's Linear subclass only casts weights to the input dtype, which is a no-op in
+            # FP32; retype it so quantize_dynamic (exact type match) swaps in int8 Linear layers
+            for module in loaded.modules():
+                if isinstance(module, torch.nn.Linear):
+                    module.__class__ = torch.nn.Linear
+            loaded = torch.quantization.quantize_dynamic(loaded, {torch.nn.Linear}, dtype=torch.qint8)
+            print("  ⚙️  Quantized Whisper model to int8 (CPU)")
+        except Exception as e:
+            print(f"  ⚠️  int8 quantization unavailable ({e}); using FP32")
+    return loaded
+
+
+def _use_fp16(loaded):
+    """FP16 decoding on GPU; CPU runs FP32/int8 (whisper warns and falls back otherwise)."""
+    return loaded.device.type == "cuda"
+
+
+def _transcribe(audio_path, output_path, model):
+    """Transcribe in the current process (runs inside the worker)."""
     try:
-        r = subprocess.run(
-            [sys.executable, "-m", "whisper", "--help"],
-            capture_output=True,
-            timeout=10,
+        loaded = _load_model(model)
+        result = loaded.transcribe(str(audio_path), language="en", verbose=None, fp16=_use_fp16(loaded))
+        # Same layout as the whisper CLI's txt output: one segment per line
+        Path(output_path).write_text(
+            "".join(segment["text"].strip() + "\n" for segment in result["segments"]), encoding="utf-8"
         )
-        if r.returncode == 0:
-            return [sys.executable, "-m", "whisper"]
-    except Exception:
-        pass
-    return None
+        print(f"  ✓ Saved: {Path(output_path).name}")
+        return True
+    except Exception as e:
+        print(f"  ✗ Error: {e}", file=sys.stderr)
+        return False
+
+
+def _worker_loop(conn):
+    """Worker process: keep the model loaded and serve transcription requests until the pipe closes."""
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        conn.send(_transcribe(*request))
 
 
-def transcribe_with_whisper(audio_path, output_path, model="base"):
-    """Transcribe audio using local openai-whisper (PyTorch)."""
-    whisper_cmd = _find_whisper()
-    if not whisper_cmd:
+_worker = None  # (process, pipe) of the running worker
+_worker_lock = threading.Lock()
+
+
+def _get_worker():
+    """Start the worker on first use (or after it was killed) and return (process, pipe)."""
+    global _worker
+    if _worker is None or not _worker[0].is_alive():
+        ctx = multiprocessing.get_context("spawn")  # no fork of a process that has torch loaded
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(target=_worker_loop, args=(child_conn,), daemon=True)
+        proc.start()
+        child_conn.close()
+        _worker = (proc, parent_conn)
+    return _worker
+
+
+def _stop_worker():
+    """Kill the worker; the next file starts a fresh one."""
+    global _worker
+    if _worker is not None:
+        proc, conn = _worker
+        proc.kill()
+        proc.join()
+        conn.close()
+        _worker = None
+
+
+def transcribe_with_whisper(audio_path, output_path, model="base", timeout=WHISPER_TIMEOUT):
+    """Transcribe audio using local openai-whisper (PyTorch) in the worker, giving up after timeout seconds."""
+    if not WHISPER_AVAILABLE:
         print("  ✗ openai-whisper not found. Install with: pip install openai-whisper", file=sys.stderr)
         return False
 
     print(f"  🎙️  Transcribing with openai-whisper (model={model})...")
-    audio_path = Path(audio_path)
     output_path = Path(output_path)
-    out_dir = output_path.parent
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    cmd = whisper_cmd + [
-        str(audio_path),
-        "--model", model,
-        "--language", "en",
-        "--output_format", "txt",
-        "--output_dir", str(out_dir),
-        "--verbose", "False",
-    ]
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=14400)  # 4 hours for long episodes
-        if result.returncode != 0:
-            print(f"  ✗ Whisper error: {(result.stderr or result.stdout or '')[:300]}", file=sys.stderr)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with _worker_lock:
+        proc, conn = _get_worker()
+        try:
+            conn.send((str(audio_path), str(output_path), model))
+            if conn.poll(timeout):
+                return conn.recv()
+        except (EOFError, OSError):
+            proc.join(1)
+            print(f"  ✗ Whisper worker exited unexpectedly (exit code {proc.exitcode})", file=sys.stderr)
+            _stop_worker()
             return False
-        whisper_txt = out_dir / f"{audio_path.stem}.txt"
-        if whisper_txt.exists():
-            if whisper_txt.resolve() != output_path.resolve():
-                whisper_txt.rename(output_path)
-            print(f"  ✓ Saved: {output_path.name}")
-            return True
-        print("  ✗ Output file not found", file=sys.stderr)
-        return False
-    except subprocess.TimeoutExpired:
-        print("  ✗ Transcription timed out (4 h). For very long episodes, run whisper manually.", file=sys.stderr)
-        return False
-    except Exception as e:
-        print(f"  ✗ Error: {e}", file=sys.stderr)
+        print(f"  ✗ Whisper timed out after {timeout}s", file=sys.stderr)
+        _stop_worker()
         return False
 
 
@@ -113,7 +177,7 @@ def main():
     print("LOCAL WHISPER (openai-whisper) — stable on macOS")
     print("=" * 60)
 
-    if _find_whisper() is None:
+    if not WHISPER_AVAILABLE:
         print("\n✗ openai-whisper not found. Run: pip install openai-whisper")
         sys.exit(1)
 
@@ -1,6 +1,18 @@
 #!/bin/bash
 # Send iMessage via AppleScript
 # Usage: ./send_imessage.sh "phone_number" "message"
+#        ./send_imessage.sh --stdin   (reads "phone<TAB>message" lines, prints OK/FAIL per line)
+
+if [ "$1" = "--stdin" ]; then
+    while IFS=$'\t' read -r PHONE MESSAGE; do
+        if osascript -e "tell application \"Messages\" to send \"$MESSAGE\" to buddy \"$PHONE\"" >/dev/null 2>&1; then
+            echo "OK"
+        else
+            echo "FAIL"
+        fi
+    done
+    exit 0
+fi
 
 PHONE="$1"
 MESSAGE="$2"